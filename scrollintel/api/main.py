@@ -5,17 +5,22 @@ FastAPI backend
 
 from fastapi import FastAPI, HTTPException, File, UploadFile, Depends, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import BaseModel
 from typing import Dict, Any, List, Optional, Union
+from contextlib import asynccontextmanager
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from datetime import datetime, timedelta
 import pytz
 import os
+import time
 import json
 import logging
 from pathlib import Path
-import uuid
+from secrets import token_hex
 import sentry_sdk
 from sentry_sdk.integrations.fastapi import FastApiIntegration
 
@@ -25,6 +30,7 @@ from ..sanctify.scrollsanctify import ScrollSanctify
 from ..voice.voice_agent import VoiceAgent
 from ..store.project_store import ProjectStore
 from ..integrations.ga4_client import GA4Client
+from ..integrations.cloud_storage_client import shutdown_excel_pool
 from ..integrations.dropbox_client import DropboxClient
 from ..integrations.sheets_client import SheetsClient
 from ..integrations.drive_client import DriveClient
@@ -36,7 +42,7 @@ from ..auth.jwt_auth import get_current_user, require_permission, TokenData
 from ..auth.auth_service import auth_service, UserCreate
 from ..assistants.scroll_prophet import scroll_prophet
 from ..export.pdf_exporter import pdf_exporter
-from ..integrations.github_client import github_client
+from ..integrations.github_client import get_github_client
 from ..sync.cloud_sync import cloud_sync
 
 # Initialize components
@@ -46,6 +52,37 @@ scroll_sanctify = ScrollSanctify()
 voice_agent = VoiceAgent(os.getenv("OPENAI_API_KEY"))
 project_store = ProjectStore()
 
+# Filename stamp cache: [epoch second, formatted stamp]
+_STAMP = [0, ""]
+
+def _file_stamp() -> str:
+    """Return a YYYYmmdd_HHMMSS stamp for export filenames, formatted once per second."""
+    now = int(time.time())
+    if now != _STAMP[0]:
+        _STAMP[:] = [now, time.strftime('%Y%m%d_%H%M%S', time.localtime(now))]
+    return _STAMP[1]
+
+def _session_table(input_data: Union[Dict[str, Any], List[Dict[str, Any]]]) -> pa.Table:
+    """Build an Arrow table from stored session input data (columns or records)."""
+    try:
+        if isinstance(input_data, dict):
+            table = pa.Table.from_pydict(input_data)
+        else:
+            table = pa.Table.from_pylist(input_data)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed-type columns (e.g. 1.5 and "n/a") have no single Arrow type; stringify them
+        frame = pd.DataFrame(input_data)
+        mixed = frame.select_dtypes(include="object").columns
+        frame[mixed] = frame[mixed].where(frame[mixed].isna(), frame[mixed].astype(str))
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+    
+    # The CSV writer only accepts flat types; stringify nested columns (e.g. Notion multi_select)
+    for i, field in enumerate(table.schema):
+        if pa.types.is_nested(field.type):
+            values = [None if v is None else str(v) for v in table.column(i).to_pylist()]
+            table = table.set_column(i, field.name, pa.array(values, pa.string()))
+    return table
+
 # Initialize Sentry
 sentry_sdk.init(
     dsn=os.getenv("SENTRY_DSN"),
@@ -54,11 +91,24 @@ sentry_sdk.init(
     environment=os.getenv("ENVIRONMENT", "development")
 )
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release pooled client connections and worker processes on shutdown."""
+    yield
+    await scroll_prophet.close()
+    await AirtableClient.close()
+    await DriveClient.close()
+    await SheetsClient.close()
+    await OneDriveClient.close()
+    await NotionClient.close()
+    shutdown_excel_pool()
+
 # Initialize API
 app = FastAPI(
     title="ScrollIntel v2 API",
     description="The Flame Interpreter API",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -137,6 +187,10 @@ class InsightRequest(BaseModel):
 class RecommendationRequest(BaseModel):
     data: Dict[str, Any]
 
+class ProphetRequest(BaseModel):
+    context: Dict[str, Any]
+    data: Dict[str, Any]
+
 class GitHubExportRequest(BaseModel):
     """GitHub export request model."""
     repo_name: str
@@ -223,7 +277,7 @@ def get_notion_client() -> NotionClient:
 # Authentication endpoints
 @app.post("/auth/token")
 async def login(form_data: OAuth2PasswordRequestForm = Depends()):
-    user = auth_service.authenticate_user(form_data.username, form_data.password)
+    user = await auth_service.authenticate_user(form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -348,7 +402,7 @@ async def create_visualization(request: InterpretRequest):
         )
         
         # Save chart
-        chart_path = f"charts/{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+        chart_path = f"charts/{_file_stamp()}.png"
         fig.write_image(chart_path)
         
         return {
@@ -418,7 +472,7 @@ async def integrate_ga4(
         )
         
         # Save chart
-        chart_path = f"charts/ga4_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+        chart_path = f"charts/ga4_{_file_stamp()}.png"
         fig.write_image(chart_path)
         
         # Store session
@@ -494,7 +548,7 @@ async def read_dropbox_file(
         )
         
         # Save chart
-        chart_path = f"charts/dropbox_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+        chart_path = f"charts/dropbox_{_file_stamp()}.png"
         fig.write_image(chart_path)
         
         # Store session
@@ -546,7 +600,7 @@ async def integrate_sheets(
         )
         
         # Save chart
-        chart_path = f"charts/sheets_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+        chart_path = f"charts/sheets_{_file_stamp()}.png"
         fig.write_image(chart_path)
         
         # Store session
@@ -620,7 +674,7 @@ async def read_drive_file(
         )
         
         # Save chart
-        chart_path = f"charts/drive_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+        chart_path = f"charts/drive_{_file_stamp()}.png"
         fig.write_image(chart_path)
         
         # Store session
@@ -693,7 +747,7 @@ async def read_onedrive_file(
         )
         
         # Save chart
-        chart_path = f"charts/onedrive_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+        chart_path = f"charts/onedrive_{_file_stamp()}.png"
         fig.write_image(chart_path)
         
         # Store session
@@ -782,11 +836,11 @@ async def read_salesforce_data(
         chart_path = graph.create_visualization(
             data,
             interpretation,
-            f"salesforce_{request.object_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+            f"salesforce_{request.object_name}_{_file_stamp()}.html"
         )
         
         # Store session
-        session_id = str(uuid.uuid4())
+        session_id = token_hex(16)
         project_store.store_session(
             domain=interpretation["domain"],
             input_data=data,
@@ -875,11 +929,11 @@ async def read_airtable_data(
         chart_path = graph.create_visualization(
             data,
             interpretation,
-            f"airtable_{request.table_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+            f"airtable_{request.table_id}_{_file_stamp()}.html"
         )
         
         # Store session
-        session_id = str(uuid.uuid4())
+        session_id = token_hex(16)
         project_store.store_session(
             domain=interpretation["domain"],
             input_data=data,
@@ -969,11 +1023,11 @@ async def read_notion_data(
         chart_path = graph.create_visualization(
             data,
             interpretation,
-            f"notion_{request.database_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+            f"notion_{request.database_id}_{_file_stamp()}.html"
         )
         
         # Store session
-        session_id = str(uuid.uuid4())
+        session_id = token_hex(16)
         project_store.store_session(
             domain=interpretation["domain"],
             input_data=data,
@@ -1016,31 +1070,35 @@ async def export_to_tableau(
                 detail=f"Session {session_id} not found"
             )
         
-        # Convert data to DataFrame
-        df = pd.DataFrame(session["input_data"])
+        # Convert data to Arrow table
+        table = _session_table(session["input_data"])
         
         # Add interpretation metadata
-        df["scroll_domain"] = session["interpretation"]["domain"]
-        df["flame_caption"] = session["interpretation"]["caption"]
-        df["chart_path"] = session["chart_path"]
-        df["timestamp"] = session["timestamp"]
+        rows = table.num_rows
+        for name, value in (
+            ("scroll_domain", session["interpretation"]["domain"]),
+            ("flame_caption", session["interpretation"]["caption"]),
+            ("chart_path", session["chart_path"]),
+            ("timestamp", session["timestamp"])
+        ):
+            table = table.append_column(name, pa.array([value] * rows, pa.string()))
         
         # Generate CSV filename
-        filename = f"tableau_export_{session_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        filename = f"tableau_export_{session_id}_{_file_stamp()}.csv"
         filepath = os.path.join("exports", filename)
         
         # Create exports directory if it doesn't exist
         os.makedirs("exports", exist_ok=True)
         
         # Save to CSV
-        df.to_csv(filepath, index=False)
+        pacsv.write_csv(table, filepath, write_options=pacsv.WriteOptions(batch_size=65536))
         
         return {
             "status": "success",
             "filepath": filepath,
             "filename": filename,
-            "rows": len(df),
-            "columns": list(df.columns)
+            "rows": table.num_rows,
+            "columns": table.column_names
         }
     except Exception as e:
         raise HTTPException(
@@ -1157,6 +1215,21 @@ async def get_prophet_insights(
             detail=f"Failed to get insights: {str(e)}"
         )
 
+@app.post("/prophet/insights/stream")
+async def stream_prophet_insights(
+    request: InsightRequest,
+    current_user: TokenData = Depends(require_permission("read"))
+):
+    """Stream AI-powered insights from ScrollProphet as newline-delimited JSON."""
+    async def sections():
+        try:
+            async for section in scroll_prophet.stream_insights(request.context):
+                yield json.dumps(section) + "\n"
+        except Exception as e:
+            yield json.dumps({"error": f"Failed to get insights: {str(e)}"}) + "\n"
+    
+    return StreamingResponse(sections(), media_type="application/x-ndjson")
+
 @app.post("/prophet/recommendations")
 async def get_prophet_recommendations(
     request: RecommendationRequest,
@@ -1176,6 +1249,26 @@ async def get_prophet_recommendations(
             detail=f"Failed to get recommendations: {str(e)}"
         )
 
+@app.post("/prophet/all")
+async def get_prophet_all(
+    request: ProphetRequest,
+    current_user: TokenData = Depends(require_permission("read"))
+):
+    """Get AI-powered insights and recommendations from ScrollProphet in one call."""
+    try:
+        result = await scroll_prophet.get_all(request.context, request.data)
+        return {
+            "status": "success",
+            "insights": result["insights"],
+            "recommendations": result["recommendations"],
+            "timestamp": datetime.now(pytz.UTC).isoformat()
+        }
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to get insights and recommendations: {str(e)}"
+        )
+
 @app.post("/export/pdf/{session_id}")
 async def export_pdf(
     session_id: str,
@@ -1197,6 +1290,25 @@ async def export_pdf(
             detail=f"Failed to generate PDF report: {str(e)}"
         )
 
+@app.get("/export/pdf/{session_id}/stream")
+async def stream_pdf(
+    session_id: str,
+    current_user: TokenData = Depends(require_permission("read"))
+):
+    """
+    Stream a session's PDF report without writing it to the export directory.
+    """
+    if not project_store.get_session(session_id):
+        raise HTTPException(
+            status_code=404,
+            detail=f"Session {session_id} not found"
+        )
+    return StreamingResponse(
+        pdf_exporter.iter_report(session_id),
+        media_type="application/pdf",
+        headers={"Content-Disposition": f'attachment; filename="scroll_report_{session_id}.pdf"'}
+    )
+
 @app.post("/export/github/{session_id}")
 async def export_to_github(
     session_id: str,
@@ -1214,8 +1326,9 @@ async def export_to_github(
             )
         
         # Generate CSV content
-        df = pd.DataFrame(session["input_data"])
-        csv_content = df.to_csv(index=False)
+        buffer = pa.BufferOutputStream()
+        pacsv.write_csv(_session_table(session["input_data"]), buffer)
+        csv_content = buffer.getvalue().to_pybytes().decode()
         
         # Generate PDF content
         pdf_path = await pdf_exporter.generate_report(session_id)
@@ -1231,7 +1344,7 @@ async def export_to_github(
         }
         
         # Push to GitHub
-        commit_url = await github_client.push_session(
+        commit_url = await get_github_client().push_session(
             repo_name=request.repo_name,
             session_data=session_data,
             commit_message=request.commit_message
@@ -4,17 +4,237 @@ Provides intelligent insights and recommendations using OpenAI's GPT model
 """
 
 import os
-from typing import Dict, Any, List, Optional
-import openai
+import re
+import time
+import asyncio
+from typing import Dict, Any, List, Optional, Callable, Awaitable, AsyncIterator, Tuple
+from openai import AsyncOpenAI
 from datetime import datetime
-import json
+import hashlib
 from pathlib import Path
+from collections import OrderedDict, deque
 import logging
+import numpy as np
+import orjson
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+EMBEDDING_MODEL = "text-embedding-3-small"
+MEMORY_COMPACT_EVERY = 1000
+MEMORY_MAX_INSIGHTS = 5000
+SEMANTIC_CACHE_FLUSH_EVERY = 100
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+INSIGHT_SYSTEM_PROMPT = "You are ScrollProphet, an AI assistant specialized in data analysis and visualization. Provide concise, actionable insights and recommendations."
+RECOMMENDATION_SYSTEM_PROMPT = "You are ScrollProphet, an AI assistant specialized in data analysis. Provide specific, actionable recommendations for data analysis and visualization."
+
+INSIGHT_SECTION_KEYS = {
+    "Key insights": "key_insights",
+    "Potential areas": "analysis_areas",
+    "Recommended visualizations": "visualizations",
+    "Action items": "action_items"
+}
+_SECTION_HEADER = "|".join(map(re.escape, INSIGHT_SECTION_KEYS))
+_SECTION_RE = re.compile(
+    rf"^[^\n]*?({_SECTION_HEADER})[^\n]*\n?(.*?)(?=^[^\n]*?(?:{_SECTION_HEADER})|\Z)",
+    re.DOTALL | re.MULTILINE
+)
+_PARAGRAPH_RE = re.compile(r"\n\s*\n")
+
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+def _parse_duration(value: Optional[str]) -> float:
+    """Parse an OpenAI rate-limit reset header such as `6m0s` or `20ms` into seconds."""
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in _DURATION_RE.findall(value or ""))
+
+class OpenAIDispatcher:
+    """Concurrency gate around OpenAI calls that backs off when rate limits run low."""
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        min_remaining_requests: int = 2,
+        min_remaining_tokens: int = 1000
+    ):
+        """Initialize the dispatcher with concurrency and rate-limit thresholds."""
+        self.sem = asyncio.Semaphore(max_concurrency)
+        self.min_remaining_requests = min_remaining_requests
+        self.min_remaining_tokens = min_remaining_tokens
+        self.remaining_requests: Optional[int] = None
+        self.remaining_tokens: Optional[int] = None
+        self.reset_at = 0.0
+
+    async def dispatch(self, create: Callable[..., Awaitable[Any]], **kwargs) -> Any:
+        """
+        Call a `with_raw_response` create method and return the parsed response.
+        
+        Waits out the rate-limit window when the previous response reported
+        fewer remaining requests or tokens than the configured thresholds.
+        Transient errors are retried by the OpenAI client itself.
+        """
+        async with self.sem:
+            delay = self.reset_at - time.monotonic()
+            if delay > 0:
+                logger.info(f"OpenAI rate limit nearly exhausted, waiting {delay:.2f}s")
+                await asyncio.sleep(delay)
+            raw = await create(**kwargs)
+            self._update(raw.headers)
+            return raw.parse()
+
+    def _update(self, headers: Any):
+        """Track remaining request/token budget from response headers."""
+        remaining_requests = headers.get("x-ratelimit-remaining-requests")
+        remaining_tokens = headers.get("x-ratelimit-remaining-tokens")
+        if remaining_requests is not None:
+            self.remaining_requests = int(remaining_requests)
+        if remaining_tokens is not None:
+            self.remaining_tokens = int(remaining_tokens)
+        
+        wait = 0.0
+        if self.remaining_requests is not None and self.remaining_requests < self.min_remaining_requests:
+            wait = max(wait, _parse_duration(headers.get("x-ratelimit-reset-requests")))
+        if self.remaining_tokens is not None and self.remaining_tokens < self.min_remaining_tokens:
+            wait = max(wait, _parse_duration(headers.get("x-ratelimit-reset-tokens")))
+        if wait:
+            self.reset_at = max(self.reset_at, time.monotonic() + wait)
+
+class SemanticCache:
+    """
+    Cache of parsed OpenAI responses keyed by prompt hash and embedding similarity.
+    
+    Both tiers are bounded LRU caches. Embeddings live in a preallocated
+    buffer of `max_semantic` rows, and entries are persisted every
+    `SEMANTIC_CACHE_FLUSH_EVERY` additions and on `flush()` rather than
+    rewritten on each add.
+    """
+
+    def __init__(self, name: str, threshold: float = 0.92, max_exact: int = 10_000, max_semantic: int = 10_000):
+        """Initialize the cache, persisted as `<name>.npy` + `<name>.json`."""
+        self.threshold = threshold
+        self.max_exact = max_exact
+        self.max_semantic = max_semantic
+        self.embeddings_file = Path(f"{name}.npy")
+        self.responses_file = Path(f"{name}.json")
+        self._lock = asyncio.Lock()
+        self._unsaved = 0
+        self._reset()
+        self._load()
+
+    @staticmethod
+    def _key(prompt: str) -> str:
+        return hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+
+    def _reset(self):
+        """Empty both tiers; the embedding buffer is allocated once the dimension is known."""
+        self.exact: "OrderedDict[str, Any]" = OrderedDict()
+        self.responses: List[Any] = [None] * self.max_semantic
+        self.embeddings: Optional[np.ndarray] = None
+        self.norms = np.zeros(self.max_semantic, dtype=np.float32)
+        self.last_used = np.zeros(self.max_semantic, dtype=np.int64)
+        self.size = 0
+        self._tick = 0
+
+    def _load(self):
+        """Load persisted cache entries, keeping the most recently used ones that fit."""
+        if not self.responses_file.exists():
+            return
+        try:
+            with open(self.responses_file, "rb") as f:
+                stored = orjson.loads(f.read())
+            self.exact = OrderedDict(list(stored.get("exact", {}).items())[-self.max_exact:])
+            responses = stored.get("semantic", [])
+            if responses and self.embeddings_file.exists():
+                embeddings = np.load(self.embeddings_file)
+                count = min(len(responses), len(embeddings), self.max_semantic)
+                if count:
+                    embeddings = embeddings[len(embeddings) - count:]
+                    self.embeddings = np.empty((self.max_semantic, embeddings.shape[1]), dtype=np.float32)
+                    self.embeddings[:count] = embeddings
+                    self.norms[:count] = np.linalg.norm(embeddings, axis=1)
+                    self.responses[:count] = responses[len(responses) - count:]
+                    self.last_used[:count] = np.arange(1, count + 1)
+                    self.size = self._tick = count
+        except Exception as e:
+            logger.error(f"Error loading semantic cache: {e}")
+            self._reset()
+
+    def _snapshot(self) -> Tuple[Dict[str, Any], List[Any], Optional[np.ndarray]]:
+        """Copy the cache entries, semantic ones ordered from least to most recently used."""
+        order = np.argsort(self.last_used[:self.size], kind="stable")
+        responses = [self.responses[i] for i in order]
+        embeddings = self.embeddings[order] if self.size else None
+        return dict(self.exact), responses, embeddings
+
+    def _save(self, exact: Dict[str, Any], responses: List[Any], embeddings: Optional[np.ndarray]):
+        """Persist a snapshot of the cache entries."""
+        try:
+            with open(self.responses_file, "wb") as f:
+                f.write(orjson.dumps({"exact": exact, "semantic": responses}, option=orjson.OPT_NON_STR_KEYS))
+            if embeddings is not None:
+                np.save(self.embeddings_file, embeddings)
+        except Exception as e:
+            logger.error(f"Error saving semantic cache: {e}")
+
+    async def flush(self):
+        """Persist the cache if it changed since the last save."""
+        async with self._lock:
+            if not self._unsaved:
+                return
+            self._unsaved = 0
+            await asyncio.to_thread(self._save, *self._snapshot())
+
+    def get(self, prompt: str) -> Optional[Any]:
+        """Return the response cached for a byte-identical prompt."""
+        key = self._key(prompt)
+        cached = self.exact.get(key)
+        if cached is not None:
+            self.exact.move_to_end(key)
+        return cached
+
+    def _touch(self, slot: int):
+        self._tick += 1
+        self.last_used[slot] = self._tick
+
+    def search(self, embedding: Optional[np.ndarray]) -> Optional[Any]:
+        """Return the most similar cached response above the threshold."""
+        if embedding is None or not self.size:
+            return None
+        sims = self.embeddings[:self.size] @ embedding / (self.norms[:self.size] * np.linalg.norm(embedding))
+        best = int(np.argmax(sims))
+        if sims[best] >= self.threshold:
+            self._touch(best)
+            return self.responses[best]
+        return None
+
+    def _store_embedding(self, embedding: np.ndarray, response: Any):
+        """Write an entry into a free slot, or over the least recently used one."""
+        if self.embeddings is None:
+            self.embeddings = np.empty((self.max_semantic, embedding.shape[0]), dtype=np.float32)
+        if self.size < self.max_semantic:
+            slot = self.size
+            self.size += 1
+        else:
+            slot = int(np.argmin(self.last_used))
+        self.embeddings[slot] = embedding
+        self.norms[slot] = np.linalg.norm(embedding)
+        self.responses[slot] = response
+        self._touch(slot)
+
+    async def add(self, prompt: str, embedding: Optional[np.ndarray], response: Any):
+        """Store a parsed response under its prompt hash and embedding."""
+        key = self._key(prompt)
+        self.exact[key] = response
+        self.exact.move_to_end(key)
+        while len(self.exact) > self.max_exact:
+            self.exact.popitem(last=False)
+        if embedding is not None:
+            self._store_embedding(embedding, response)
+        self._unsaved += 1
+        if self._unsaved >= SEMANTIC_CACHE_FLUSH_EVERY:
+            await self.flush()
+
 class ScrollProphet:
     def __init__(self, api_key: Optional[str] = None):
         """Initialize ScrollProphet with OpenAI API key."""
@@ -22,29 +242,213 @@ class ScrollProphet:
         if not self.api_key:
             raise ValueError("OpenAI API key is required")
         
-        openai.api_key = self.api_key
+        self.client = AsyncOpenAI(api_key=self.api_key, max_retries=3, timeout=30)
+        self.dispatcher = OpenAIDispatcher()
         self.model = "gpt-4-turbo-preview"
-        self.memory_file = Path("prophet_memory.json")
+        self.memory_file = Path("prophet_memory.jsonl")
+        self.archive_file = Path("prophet_memory.archive.jsonl")
+        self._appends_since_compact = 0
+        self._pending_archive: List[bytes] = []
+        self._memory_lock = asyncio.Lock()
         self.memory: Dict[str, Any] = self._load_memory()
+        self.compact()
+        self.insight_cache = SemanticCache("prophet_insights_cache")
+        self.recommendation_cache = SemanticCache("prophet_recommendations_cache")
+        self._inflight: Dict[str, asyncio.Future] = {}
 
     def _load_memory(self) -> Dict[str, Any]:
-        """Load conversation memory from file."""
-        if self.memory_file.exists():
+        """Load conversation memory from the append-only log."""
+        memory: Dict[str, Any] = {"conversations": [], "insights": []}
+        legacy_file = self.memory_file.with_suffix(".json")
+        try:
+            if self.memory_file.exists():
+                with open(self.memory_file, "rb") as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            record = orjson.loads(line)
+                        except orjson.JSONDecodeError:
+                            logger.warning("Skipping corrupt memory entry")
+                            continue
+                        memory.setdefault(record["section"], []).append(record["entry"])
+            elif legacy_file.exists():
+                # Migrate the pre-JSONL memory file; compact() rewrites it as a log
+                with open(legacy_file, "rb") as f:
+                    legacy = orjson.loads(f.read())
+                for section, entries in legacy.items():
+                    memory.setdefault(section, []).extend(entries)
+        except Exception as e:
+            logger.error(f"Error loading memory: {e}")
+        
+        # Keep only the most recent insights in RAM; older ones move to the archive on compaction
+        insights = memory["insights"]
+        self._pending_archive.extend(
+            self._encode_memory_entry("insights", entry)
+            for entry in insights[:max(len(insights) - MEMORY_MAX_INSIGHTS, 0)]
+        )
+        memory["insights"] = deque(insights, maxlen=MEMORY_MAX_INSIGHTS)
+        return memory
+
+    @staticmethod
+    def _encode_memory_entry(section: str, entry: Dict[str, Any]) -> bytes:
+        return orjson.dumps(
+            {"section": section, "entry": entry},
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        )
+
+    def _write_memory(self, line: bytes):
+        """Append an encoded entry to the memory log."""
+        with open(self.memory_file, "ab") as f:
+            f.write(line)
+
+    async def _append_memory(self, section: str, entry: Dict[str, Any]):
+        """Record a memory entry and append it to the log off the event loop."""
+        line = self._encode_memory_entry(section, entry)
+        async with self._memory_lock:
+            entries = self.memory[section]
+            if isinstance(entries, deque) and len(entries) == entries.maxlen:
+                self._pending_archive.append(self._encode_memory_entry(section, entries[0]))
+            entries.append(entry)
             try:
-                with open(self.memory_file, "r") as f:
-                    return json.load(f)
+                await asyncio.to_thread(self._write_memory, line)
+                self._appends_since_compact += 1
+                if self._appends_since_compact >= MEMORY_COMPACT_EVERY:
+                    await asyncio.to_thread(self.compact)
             except Exception as e:
-                logger.error(f"Error loading memory: {e}")
-                return {"conversations": [], "insights": []}
-        return {"conversations": [], "insights": []}
+                logger.error(f"Error saving memory: {e}")
 
-    def _save_memory(self):
-        """Save conversation memory to file."""
+    def compact(self):
+        """
+        Rewrite the memory log from the in-memory state, dropping corrupt entries.
+        
+        Entries evicted from the bounded in-memory history are appended to the
+        archive log before they are dropped from the memory log.
+        """
+        try:
+            if self._pending_archive:
+                with open(self.archive_file, "ab") as f:
+                    f.writelines(self._pending_archive)
+                self._pending_archive = []
+            tmp_file = self.memory_file.with_suffix(".jsonl.tmp")
+            with open(tmp_file, "wb") as f:
+                for section, entries in self.memory.items():
+                    for entry in entries:
+                        f.write(self._encode_memory_entry(section, entry))
+            tmp_file.replace(self.memory_file)
+            self._appends_since_compact = 0
+        except Exception as e:
+            logger.error(f"Error compacting memory: {e}")
+
+    async def close(self):
+        """Persist the response caches and close the pooled OpenAI HTTP client."""
+        await self.insight_cache.flush()
+        await self.recommendation_cache.flush()
+        await self.client.close()
+
+    async def _embed(self, payload: Dict[str, Any]) -> Optional[np.ndarray]:
+        """
+        Embed the variable part of a prompt for semantic cache lookups.
+        
+        The prompt templates are shared, so only the caller-supplied payload is
+        embedded; otherwise every prompt would look alike to the cache.
+        """
         try:
-            with open(self.memory_file, "w") as f:
-                json.dump(self.memory, f, indent=2)
+            response = await self.dispatcher.dispatch(
+                self.client.embeddings.with_raw_response.create,
+                model=EMBEDDING_MODEL,
+                input=orjson.dumps(
+                    payload,
+                    default=str,
+                    option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+                ).decode()
+            )
+            return np.asarray(response.data[0].embedding, dtype=np.float32)
         except Exception as e:
-            logger.error(f"Error saving memory: {e}")
+            logger.warning(f"Semantic cache lookup skipped: {e}")
+            return None
+
+    def _chat_body(self, prompt: str, system_prompt: str, max_tokens: int) -> Dict[str, Any]:
+        """Build the chat completion request body."""
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": 0.7,
+            "max_tokens": max_tokens
+        }
+
+    async def _call_openai(self, prompt: str, system_prompt: str, max_tokens: int) -> str:
+        """Send a chat completion request and return the message content."""
+        response = await self.dispatcher.dispatch(
+            self.client.chat.completions.with_raw_response.create,
+            **self._chat_body(prompt, system_prompt, max_tokens)
+        )
+        return response.choices[0].message.content
+
+    async def _coalesce(self, prompt: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Share one in-flight fetch between concurrent callers with the same prompt.
+        
+        The fetch runs as its own task rather than in the first caller, so a
+        caller being cancelled (e.g. its client disconnecting) leaves the
+        fetch running for everyone else waiting on it.
+        """
+        key = SemanticCache._key(prompt)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish_inflight(key, done))
+        return await asyncio.shield(task)
+
+    def _finish_inflight(self, key: str, task: asyncio.Future):
+        """Forget a finished fetch, marking its exception retrieved in case every caller left."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
+
+    async def _fetch_insights(self, prompt: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Resolve insights through the semantic cache or OpenAI."""
+        embedding = await self._embed(context)
+        cached = self.insight_cache.search(embedding)
+        if cached is not None:
+            return cached
+        
+        # Get response from OpenAI
+        content = await self._call_openai(prompt, INSIGHT_SYSTEM_PROMPT, max_tokens=500)
+        
+        # Extract and structure the response
+        insights = self._parse_insights(content)
+        
+        # Store in memory
+        await self._append_memory("insights", {
+            "timestamp": datetime.now().isoformat(),
+            "context": context,
+            "insights": insights
+        })
+        await self.insight_cache.add(prompt, embedding, insights)
+        
+        return insights
+
+    async def _fetch_recommendations(self, prompt: str, data: Dict[str, Any]) -> List[str]:
+        """Resolve recommendations through the semantic cache or OpenAI."""
+        embedding = await self._embed(data)
+        cached = self.recommendation_cache.search(embedding)
+        if cached is not None:
+            return cached
+        
+        # Get response from OpenAI
+        content = await self._call_openai(prompt, RECOMMENDATION_SYSTEM_PROMPT, max_tokens=300)
+        
+        # Parse recommendations
+        recommendations = self._parse_recommendations(content)
+        await self.recommendation_cache.add(prompt, embedding, recommendations)
+        
+        return recommendations
 
     async def get_insights(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -60,29 +464,12 @@ class ScrollProphet:
             # Prepare the prompt
             prompt = self._prepare_insight_prompt(context)
             
-            # Get response from OpenAI
-            response = await openai.ChatCompletion.acreate(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are ScrollProphet, an AI assistant specialized in data analysis and visualization. Provide concise, actionable insights and recommendations."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=500
-            )
-            
-            # Extract and structure the response
-            insights = self._parse_insights(response.choices[0].message.content)
+            # Check cache before calling OpenAI
+            cached = self.insight_cache.get(prompt)
+            if cached is not None:
+                return cached
             
-            # Store in memory
-            self.memory["insights"].append({
-                "timestamp": datetime.now().isoformat(),
-                "context": context,
-                "insights": insights
-            })
-            self._save_memory()
-            
-            return insights
+            return await self._coalesce(prompt, lambda: self._fetch_insights(prompt, context))
             
         except Exception as e:
             logger.error(f"Error getting insights: {e}")
@@ -92,6 +479,141 @@ class ScrollProphet:
                 "recommendations": []
             }
 
+    async def stream_insights(self, context: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream AI-powered insights section by section.
+        
+        Sections are yielded as soon as the model starts writing the next
+        header, so callers can render key insights before the action items
+        are generated.
+        
+        Args:
+            context: Dictionary containing current session/analysis context
+            
+        Yields:
+            Dictionaries with the section key and its items
+        """
+        prompt = self._prepare_insight_prompt(context)
+        
+        # Serve cached insights in one go
+        cached = self.insight_cache.get(prompt)
+        embedding = None
+        if cached is None:
+            embedding = await self._embed(context)
+            cached = self.insight_cache.search(embedding)
+        if cached is not None:
+            for key, items in cached.items():
+                if key in INSIGHT_SECTION_KEYS.values():
+                    yield {"section": key, "items": items}
+            return
+        
+        stream = await self.dispatcher.dispatch(
+            self.client.chat.completions.with_raw_response.create,
+            stream=True,
+            **self._chat_body(prompt, INSIGHT_SYSTEM_PROMPT, max_tokens=500)
+        )
+        
+        parts: List[str] = []
+        emitted = 0
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if not delta:
+                continue
+            parts.append(delta)
+            if "\n" in delta:
+                # Every section before the last header seen is complete
+                sections = self._split_sections("".join(parts))
+                for key, items in sections[emitted:-1]:
+                    yield {"section": key, "items": items}
+                emitted = max(emitted, len(sections) - 1)
+        
+        content = "".join(parts)
+        for key, items in self._split_sections(content)[emitted:]:
+            yield {"section": key, "items": items}
+        
+        # Store in memory
+        insights = self._parse_insights(content)
+        await self._append_memory("insights", {
+            "timestamp": datetime.now().isoformat(),
+            "context": context,
+            "insights": insights
+        })
+        await self.insight_cache.add(prompt, embedding, insights)
+
+    async def get_insights_bulk(
+        self,
+        contexts: List[Dict[str, Any]],
+        poll_interval: float = 30.0
+    ) -> List[Dict[str, Any]]:
+        """
+        Get insights for many contexts through the OpenAI Batch API.
+        
+        Batch requests are billed at half price and use a separate rate-limit
+        pool, but complete within a 24h window, so this is meant for
+        background recomputation rather than interactive requests.
+        
+        Args:
+            contexts: List of session/analysis contexts
+            poll_interval: Seconds between batch status checks
+            
+        Returns:
+            List of insight dictionaries, in the same order as `contexts`
+        """
+        prompts = [self._prepare_insight_prompt(context) for context in contexts]
+        batch_input = b"".join(
+            orjson.dumps({
+                "custom_id": f"ctx-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._chat_body(prompt, INSIGHT_SYSTEM_PROMPT, max_tokens=500)
+            }, option=orjson.OPT_APPEND_NEWLINE)
+            for i, prompt in enumerate(prompts)
+        )
+        
+        # Submit the batch and wait for it to finish
+        input_file = await self.client.files.create(
+            file=("prophet_insights.jsonl", batch_input),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        while batch.status not in BATCH_TERMINAL_STATUSES:
+            await asyncio.sleep(poll_interval)
+            batch = await self.client.batches.retrieve(batch.id)
+        if batch.status != "completed" or not batch.output_file_id:
+            raise ValueError(f"Insight batch {batch.id} ended with status {batch.status}")
+        
+        # Map results back to their contexts
+        results: List[Dict[str, Any]] = [
+            {"error": "No response in batch output", "insights": [], "recommendations": []}
+            for _ in contexts
+        ]
+        output = await self.client.files.content(batch.output_file_id)
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            i = int(record["custom_id"].split("-", 1)[1])
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                error = record.get("error") or response.get("body", {}).get("error")
+                results[i] = {"error": str(error), "insights": [], "recommendations": []}
+                continue
+            
+            insights = self._parse_insights(response["body"]["choices"][0]["message"]["content"])
+            results[i] = insights
+            await self._append_memory("insights", {
+                "timestamp": datetime.now().isoformat(),
+                "context": contexts[i],
+                "insights": insights
+            })
+            await self.insight_cache.add(prompts[i], None, insights)
+        
+        return results
+
     async def get_recommendations(self, data: Dict[str, Any]) -> List[str]:
         """
         Get AI-powered recommendations for data analysis.
@@ -106,26 +628,46 @@ class ScrollProphet:
             # Prepare the prompt
             prompt = self._prepare_recommendation_prompt(data)
             
-            # Get response from OpenAI
-            response = await openai.ChatCompletion.acreate(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are ScrollProphet, an AI assistant specialized in data analysis. Provide specific, actionable recommendations for data analysis and visualization."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=300
-            )
+            # Check cache before calling OpenAI
+            cached = self.recommendation_cache.get(prompt)
+            if cached is not None:
+                return cached
             
-            # Parse recommendations
-            recommendations = self._parse_recommendations(response.choices[0].message.content)
-            
-            return recommendations
+            return await self._coalesce(prompt, lambda: self._fetch_recommendations(prompt, data))
             
         except Exception as e:
             logger.error(f"Error getting recommendations: {e}")
             return []
 
+    async def get_all(self, context: Dict[str, Any], data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get insights and recommendations concurrently.
+        
+        Args:
+            context: Dictionary containing current session/analysis context
+            data: Dictionary containing data to analyze
+            
+        Returns:
+            Dictionary containing both insights and recommendations
+        """
+        insights, recommendations = await asyncio.gather(
+            self.get_insights(context),
+            self.get_recommendations(data),
+            return_exceptions=True
+        )
+        
+        if isinstance(insights, BaseException):
+            logger.error(f"Error getting insights: {insights}")
+            insights = {"error": str(insights), "insights": [], "recommendations": []}
+        if isinstance(recommendations, BaseException):
+            logger.error(f"Error getting recommendations: {recommendations}")
+            recommendations = []
+        
+        return {
+            "insights": insights,
+            "recommendations": recommendations
+        }
+
     def _prepare_insight_prompt(self, context: Dict[str, Any]) -> str:
         """Prepare the prompt for getting insights."""
         return f"""
@@ -159,31 +701,27 @@ class ScrollProphet:
         3. Potential insights to explore
         """
 
+    def _split_sections(self, content: str) -> List[Tuple[str, List[str]]]:
+        """Split a response into (section key, paragraphs) pairs in order."""
+        # Each match is a header line plus the body up to the next header
+        return [
+            (
+                INSIGHT_SECTION_KEYS[match.group(1)],
+                [
+                    paragraph.strip()
+                    for paragraph in _PARAGRAPH_RE.split(match.group(2))
+                    if paragraph.strip()
+                ]
+            )
+            for match in _SECTION_RE.finditer(content)
+        ]
+
     def _parse_insights(self, content: str) -> Dict[str, Any]:
         """Parse the AI response into structured insights."""
         try:
-            # Split content into sections
-            sections = content.split("\n\n")
-            insights = {
-                "key_insights": [],
-                "analysis_areas": [],
-                "visualizations": [],
-                "action_items": []
-            }
-            
-            current_section = None
-            for section in sections:
-                if "Key insights" in section:
-                    current_section = "key_insights"
-                elif "Potential areas" in section:
-                    current_section = "analysis_areas"
-                elif "Recommended visualizations" in section:
-                    current_section = "visualizations"
-                elif "Action items" in section:
-                    current_section = "action_items"
-                elif current_section and section.strip():
-                    insights[current_section].append(section.strip())
-            
+            insights = {key: [] for key in INSIGHT_SECTION_KEYS.values()}
+            for key, items in self._split_sections(content):
+                insights[key].extend(items)
             return insights
             
         except Exception as e:
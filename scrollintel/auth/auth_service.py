@@ -7,14 +7,18 @@ from typing import Optional
 from pydantic import BaseModel, EmailStr
 from passlib.context import CryptContext
 import os
+import asyncio
+import sqlite3
+import threading
 from datetime import datetime
-import json
+from cachetools import LRUCache
+import orjson
 from pathlib import Path
 
 from .jwt_auth import create_user_token, create_admin_token, create_readonly_token
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing (10 bcrypt rounds keeps login latency bounded while staying above the OWASP baseline)
+pwd_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=10, deprecated="auto")
 
 class User(BaseModel):
     username: str
@@ -35,34 +39,83 @@ class UserInDB(User):
     hashed_password: str
 
 class AuthService:
-    def __init__(self, users_file: str = "users.json"):
+    def __init__(self, db_path: str = "users.db", users_file: str = "users.json"):
+        self.db_path = db_path
         self.users_file = Path(users_file)
-        self.users: dict[str, UserInDB] = {}
-        self._load_users()
-
-    def _load_users(self):
-        """Load users from JSON file"""
-        if self.users_file.exists():
-            with open(self.users_file, "r") as f:
-                data = json.load(f)
-                for username, user_data in data.items():
-                    user_data["created_at"] = datetime.fromisoformat(user_data["created_at"])
-                    if user_data.get("last_login"):
-                        user_data["last_login"] = datetime.fromisoformat(user_data["last_login"])
-                    self.users[username] = UserInDB(**user_data)
-
-    def _save_users(self):
-        """Save users to JSON file"""
-        data = {}
-        for username, user in self.users.items():
-            user_dict = user.dict()
-            user_dict["created_at"] = user_dict["created_at"].isoformat()
-            if user_dict.get("last_login"):
-                user_dict["last_login"] = user_dict["last_login"].isoformat()
-            data[username] = user_dict
-        
-        with open(self.users_file, "w") as f:
-            json.dump(data, f, indent=2)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        # Users by username (None for unknown names); guarded by _lock and evicted per key on write
+        self._user_cache: LRUCache = LRUCache(maxsize=1024)
+        self._init_db()
+        self._migrate_users_file()
+
+    def _init_db(self):
+        """Initialize the database schema"""
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS users (
+                    username TEXT PRIMARY KEY,
+                    email TEXT NOT NULL,
+                    hashed_password TEXT NOT NULL,
+                    is_active INTEGER NOT NULL DEFAULT 1,
+                    is_admin INTEGER NOT NULL DEFAULT 0,
+                    created_at TEXT NOT NULL,
+                    last_login TEXT
+                )
+            """)
+
+    def _migrate_users_file(self):
+        """Import users from the legacy JSON file into an empty database"""
+        if not self.users_file.exists():
+            return
+        with self._lock:
+            if self._conn.execute("SELECT 1 FROM users LIMIT 1").fetchone():
+                return
+            with open(self.users_file, "rb") as f:
+                data = orjson.loads(f.read())
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                """
+                INSERT INTO users (
+                    username, email, hashed_password, is_active,
+                    is_admin, created_at, last_login
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        username,
+                        user_data["email"],
+                        user_data["hashed_password"],
+                        user_data.get("is_active", True),
+                        user_data.get("is_admin", False),
+                        user_data["created_at"],
+                        user_data.get("last_login")
+                    )
+                    for username, user_data in data.items()
+                ]
+            )
+            self._conn.execute("COMMIT")
+
+    def _fetch_user(self, username: str) -> Optional[UserInDB]:
+        """Load a single user row; the caller holds _lock"""
+        row = self._conn.execute(
+            "SELECT * FROM users WHERE username = ?",
+            (username,)
+        ).fetchone()
+        if not row:
+            return None
+        return UserInDB(
+            username=row["username"],
+            email=row["email"],
+            hashed_password=row["hashed_password"],
+            is_active=bool(row["is_active"]),
+            is_admin=bool(row["is_admin"]),
+            created_at=datetime.fromisoformat(row["created_at"]),
+            last_login=datetime.fromisoformat(row["last_login"]) if row["last_login"] else None
+        )
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verify a password against its hash"""
@@ -74,10 +127,13 @@ class AuthService:
 
     def get_user(self, username: str) -> Optional[UserInDB]:
         """Get user by username"""
-        return self.users.get(username)
+        with self._lock:
+            if username not in self._user_cache:
+                self._user_cache[username] = self._fetch_user(username)
+            return self._user_cache[username]
 
-    def authenticate_user(self, username: str, password: str) -> Optional[UserInDB]:
-        """Authenticate user with username and password"""
+    def _verify_and_fetch(self, username: str, password: str) -> Optional[UserInDB]:
+        """Look up a user and verify their password"""
         user = self.get_user(username)
         if not user:
             return None
@@ -85,6 +141,10 @@ class AuthService:
             return None
         return user
 
+    async def authenticate_user(self, username: str, password: str) -> Optional[UserInDB]:
+        """Authenticate user with username and password, hashing off the event loop"""
+        return await asyncio.to_thread(self._verify_and_fetch, username, password)
+
     def create_user(self, user_data: UserCreate) -> UserInDB:
         """Create a new user"""
         if self.get_user(user_data.username):
@@ -101,16 +161,38 @@ class AuthService:
             created_at=now
         )
         
-        self.users[user.username] = user
-        self._save_users()
+        with self._lock:
+            try:
+                self._conn.execute(
+                    """
+                    INSERT INTO users (
+                        username, email, hashed_password, is_active,
+                        is_admin, created_at, last_login
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        user.username,
+                        user.email,
+                        user.hashed_password,
+                        user.is_active,
+                        user.is_admin,
+                        user.created_at.isoformat(),
+                        None
+                    )
+                )
+            except sqlite3.IntegrityError:
+                raise ValueError("Username already exists")
+            self._user_cache.pop(user.username, None)
         return user
 
     def update_last_login(self, username: str):
         """Update user's last login timestamp"""
-        user = self.get_user(username)
-        if user:
-            user.last_login = datetime.utcnow()
-            self._save_users()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE users SET last_login = ? WHERE username = ?",
+                (datetime.utcnow().isoformat(), username)
+            )
+            self._user_cache.pop(username, None)
 
     def create_token(self, username: str) -> str:
         """Create appropriate token based on user role"""
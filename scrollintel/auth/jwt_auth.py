@@ -4,7 +4,9 @@ Handles token generation, validation, and dependency injection for FastAPI endpo
 """
 
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+from functools import lru_cache
+import time
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import jwt
@@ -18,6 +20,9 @@ load_dotenv()
 JWT_SECRET = os.getenv("JWT_SECRET", "your-secret-key")  # Change in production
 JWT_ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
+ACCESS_TOKEN_EXPIRE_DELTA = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+
+_jwt_encode = jwt.encode
 
 security = HTTPBearer()
 
@@ -40,15 +45,24 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
     Returns:
         str: Encoded JWT token
     """
-    to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    expire = datetime.utcnow() + (expires_delta or ACCESS_TOKEN_EXPIRE_DELTA)
+    to_encode = {**data, "exp": expire}
+    return _jwt_encode(to_encode, JWT_SECRET, algorithm=JWT_ALGORITHM)
+
+@lru_cache(maxsize=4096)
+def _decode_token(token: str) -> Tuple[Optional[str], Tuple[str, ...], float]:
+    """
+    Decode and verify a JWT, caching the result per token
     
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, JWT_SECRET, algorithm=JWT_ALGORITHM)
-    return encoded_jwt
+    Returns:
+        Tuple of username, permissions and expiry as a UNIX timestamp
+    """
+    payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+    return (
+        payload.get("sub"),
+        tuple(payload.get("permissions", [])),
+        float(payload.get("exp", float("inf")))
+    )
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> TokenData:
     """
@@ -71,14 +85,13 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     
     try:
         token = credentials.credentials
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
-        username: str = payload.get("sub")
-        permissions: list[str] = payload.get("permissions", [])
+        username, permissions, expires_at = _decode_token(token)
         
-        if username is None:
+        # Cached decodes skip jwt's own expiry check, so re-check it here
+        if username is None or expires_at <= time.time():
             raise credentials_exception
             
-        return TokenData(username=username, permissions=permissions)
+        return TokenData(username=username, permissions=list(permissions))
     except jwt.PyJWTError:
         raise credentials_exception
 
@@ -102,9 +115,9 @@ def require_permission(required_permission: str):
     return permission_dependency
 
 # Common permission sets
-ADMIN_PERMISSIONS = ["admin", "read", "write", "delete"]
-USER_PERMISSIONS = ["read", "write"]
-READ_ONLY_PERMISSIONS = ["read"]
+ADMIN_PERMISSIONS = ("admin", "read", "write", "delete")
+USER_PERMISSIONS = ("read", "write")
+READ_ONLY_PERMISSIONS = ("read",)
 
 def create_admin_token(username: str) -> Token:
     """Create an admin token with full permissions"""
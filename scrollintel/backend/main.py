@@ -5,22 +5,36 @@ Backend API for ScrollProphetic data insight with ScrollSpirit Layer
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from datetime import datetime
-import pytz
+from datetime import datetime, timezone
+import os
+import time
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
-import json
+import re
 
 app = FastAPI(
     title="ScrollIntel v2 API",
     description="Flame Interpreter Backend API with ScrollSpirit Layer for divine data insight",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse
 )
 
-# Configure CORS
+class OriginSetCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware with constant-time lookups for explicit origin lists."""
+
+    def __init__(self, app, **kwargs):
+        super().__init__(app, **kwargs)
+        self.allow_origins = frozenset(self.allow_origins)
+
+# Configure CORS; in production set CORS_ORIGINS (comma-separated) and/or CORS_ORIGIN_REGEX
+CORS_ORIGINS = [origin.strip() for origin in os.getenv("CORS_ORIGINS", "*").split(",") if origin.strip()]
+
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # In production, replace with your domain
+    OriginSetCORSMiddleware,
+    allow_origins=CORS_ORIGINS,
+    allow_origin_regex=os.getenv("CORS_ORIGIN_REGEX") or None,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -37,6 +51,15 @@ SACRED_TIMES = {
     "midnight": "23:00-01:00"
 }
 
+# Sacred phase for each UTC hour; hours outside a named window fall back to dawn
+PHASE_BY_HOUR = tuple(
+    "noon" if 12 <= hour < 14
+    else "dusk" if 17 <= hour < 19
+    else "midnight" if hour == 23 or hour < 1
+    else "dawn"
+    for hour in range(24)
+)
+
 SCROLL_ECONOMY_DOMAINS = {
     "prophetic": ["visions", "dreams", "revelations"],
     "temporal": ["market", "trends", "cycles"],
@@ -44,18 +67,19 @@ SCROLL_ECONOMY_DOMAINS = {
     "material": ["wealth", "resources", "abundance"]
 }
 
-def get_sacred_timing() -> Dict[str, Any]:
-    """Get current sacred timing based on ScrollProphetic cycles."""
-    now = datetime.now(pytz.UTC)
-    hour = now.hour
-    
-    current_phase = "dawn"
-    if 12 <= hour < 14:
-        current_phase = "noon"
-    elif 17 <= hour < 19:
-        current_phase = "dusk"
-    elif 23 <= hour or hour < 1:
-        current_phase = "midnight"
+# Single-pass keyword matcher over all domains, built once at import
+_KEYWORD_TO_DOMAIN = {
+    keyword: domain
+    for domain, keywords in SCROLL_ECONOMY_DOMAINS.items()
+    for keyword in keywords
+}
+_KEYWORD_RE = re.compile("|".join(map(re.escape, _KEYWORD_TO_DOMAIN)))
+
+@lru_cache(maxsize=2)
+def _sacred_for_minute(epoch_minute: int) -> Dict[str, Any]:
+    """Compute sacred timing for a given minute since the epoch."""
+    now = datetime.fromtimestamp(epoch_minute * 60, timezone.utc)
+    current_phase = PHASE_BY_HOUR[now.hour]
     
     return {
         "phase": current_phase,
@@ -64,14 +88,14 @@ def get_sacred_timing() -> Dict[str, Any]:
         "prophetic_cycle": f"ScrollCycle_{now.strftime('%Y%m%d')}"
     }
 
+def get_sacred_timing() -> Dict[str, Any]:
+    """Get current sacred timing based on ScrollProphetic cycles, resolved per minute."""
+    return dict(_sacred_for_minute(int(time.time()) // 60))
+
 def classify_domain(text: str) -> List[str]:
     """Classify text into Scroll Economy domains."""
-    domains = []
-    text_lower = text.lower()
-    
-    for domain, keywords in SCROLL_ECONOMY_DOMAINS.items():
-        if any(keyword in text_lower for keyword in keywords):
-            domains.append(domain)
+    found = {_KEYWORD_TO_DOMAIN[keyword] for keyword in _KEYWORD_RE.findall(text.lower())}
+    domains = [domain for domain in SCROLL_ECONOMY_DOMAINS if domain in found]
     
     return domains if domains else ["temporal"]  # Default to temporal if no match
 
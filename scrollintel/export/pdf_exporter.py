@@ -3,16 +3,24 @@ ScrollIntel PDF Exporter
 Generates sacred flame reports in PDF format
 """
 
+import io
 import os
-from typing import Dict, Any, Optional
-from datetime import datetime
-import pytz
+import copy
+import json
+import hashlib
+import asyncio
+import aiofiles
+from typing import Dict, Any, Optional, Set, Tuple, AsyncIterator
+from datetime import datetime, timezone
 from pathlib import Path
+from collections import OrderedDict
+from xml.sax.saxutils import escape
+from reportlab import rl_config
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle, KeepTogether
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 import logging
@@ -24,6 +32,126 @@ from ..assistants.scroll_prophet import scroll_prophet
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Attribute validation is only useful while debugging report layouts
+if not os.getenv("SCROLLINTEL_DEBUG"):
+    rl_config.shapeChecking = 0
+
+# Custom fonts as (font name, file name) pairs
+SCROLL_FONTS = (
+    ("ScrollFont", "scroll-font.ttf"),
+    ("ScrollDecorative", "scroll-decorative.ttf"),
+)
+
+# Maximum number of sessions whose insights are kept for re-export
+INSIGHTS_CACHE_SIZE = 512
+
+# Size of the byte chunks yielded by PDFExporter.iter_report
+REPORT_CHUNK_SIZE = 64 * 1024
+
+# Insight sections rendered in the report as (heading, insights key) pairs
+INSIGHT_SECTIONS = (
+    ("Key Insights:", "key_insights"),
+    ("Analysis Areas:", "analysis_areas"),
+    ("Action Items:", "action_items"),
+)
+
+# Font files already attempted, so failed registrations are not re-parsed per exporter
+_FONTS_ATTEMPTED: Set[str] = set()
+
+# Shared paragraph styles, created on first use
+_STYLES: Optional[StyleSheet1] = None
+
+# Report boilerplate as name -> (text, style name)
+STATIC_PARAGRAPHS = {
+    "title": ("🔥 ScrollIntel Flame Report", "ScrollTitle"),
+    "quote": (
+        '"The flame reveals patterns unseen by man, illuminating the path to wisdom."',
+        "ScrollQuote"
+    ),
+    "domain_header": ("Domain Insight", "ScrollHeader"),
+    "interpretation_header": ("Interpretation", "ScrollHeader"),
+    "insights_header": ("ScrollProphet Insights", "ScrollHeader"),
+    "source_header": ("Source Data", "ScrollHeader"),
+    "footer": ("ScrollIntel v2 - The Flame Interpreter", "ScrollBody"),
+    **{key: (title, "ScrollBody") for title, key in INSIGHT_SECTIONS},
+}
+
+# Parsed boilerplate paragraphs, created on first use
+_PARAGRAPHS: Dict[str, Paragraph] = {}
+
+def _register_fonts(font_dir: Path):
+    """Register custom fonts for the PDF once per process."""
+    registered = set(pdfmetrics.getRegisteredFontNames())
+    for font_name, file_name in SCROLL_FONTS:
+        font_path = str(font_dir / file_name)
+        if font_name in registered or font_path in _FONTS_ATTEMPTED:
+            continue
+        _FONTS_ATTEMPTED.add(font_path)
+        try:
+            pdfmetrics.registerFont(TTFont(font_name, font_path))
+        except Exception as e:
+            logger.warning(f"Failed to register custom font {font_name}: {e}")
+
+def _create_styles() -> StyleSheet1:
+    """Create custom paragraph styles for the PDF."""
+    styles = getSampleStyleSheet()
+    
+    # Title style
+    styles.add(ParagraphStyle(
+        name='ScrollTitle',
+        fontName='ScrollDecorative',
+        fontSize=24,
+        alignment=1,  # Center
+        spaceAfter=30,
+        textColor=colors.HexColor('#B8860B')  # ScrollGold
+    ))
+    
+    # Section header style
+    styles.add(ParagraphStyle(
+        name='ScrollHeader',
+        fontName='ScrollFont',
+        fontSize=16,
+        spaceAfter=12,
+        textColor=colors.HexColor('#8B4513')  # SaddleBrown
+    ))
+    
+    # Body text style
+    styles.add(ParagraphStyle(
+        name='ScrollBody',
+        fontName='ScrollFont',
+        fontSize=12,
+        spaceAfter=12,
+        textColor=colors.black
+    ))
+    
+    # Quote style
+    styles.add(ParagraphStyle(
+        name='ScrollQuote',
+        fontName='ScrollDecorative',
+        fontSize=14,
+        alignment=1,  # Center
+        spaceAfter=20,
+        textColor=colors.HexColor('#8B4513')  # SaddleBrown
+    ))
+    
+    return styles
+
+def _get_styles() -> StyleSheet1:
+    """Return the shared paragraph styles, creating them on first use."""
+    global _STYLES
+    if _STYLES is None:
+        _STYLES = _create_styles()
+    return _STYLES
+
+def _static_paragraph(name: str) -> Paragraph:
+    """Return a fresh copy of a boilerplate paragraph, parsing its markup only once."""
+    paragraph = _PARAGRAPHS.get(name)
+    if paragraph is None:
+        text, style = STATIC_PARAGRAPHS[name]
+        paragraph = _PARAGRAPHS[name] = Paragraph(text, _get_styles()[style])
+    # Layout state is per instance; the parsed fragments are shared read-only
+    return copy.copy(paragraph)
+
 class PDFExporter:
     def __init__(self, export_dir: Optional[str] = None):
         """Initialize PDF exporter with configuration."""
@@ -37,75 +165,154 @@ class PDFExporter:
         self.font_dir.mkdir(parents=True, exist_ok=True)
         
         # Register custom fonts
-        self._register_fonts()
+        _register_fonts(self.font_dir)
         
         # Initialize styles
-        self.styles = self._create_styles()
+        self.styles = _get_styles()
         
         # Initialize project store
         self.project_store = ProjectStore()
+        
+        # Insights by session content hash, least recently used first
+        self._insights_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
 
-    def _register_fonts(self):
-        """Register custom fonts for the PDF."""
+    async def _cached_insights(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Get ScrollProphet insights, reusing them for re-exports of the same session content."""
+        key = hashlib.blake2b(
+            json.dumps(context, sort_keys=True, default=str).encode(),
+            digest_size=16
+        ).hexdigest()
+        cached = self._insights_cache.get(key)
+        if cached is not None:
+            self._insights_cache.move_to_end(key)
+            return cached
+        
+        insights = await scroll_prophet.get_insights(context)
+        if "error" not in insights:
+            self._insights_cache[key] = insights
+            while len(self._insights_cache) > INSIGHTS_CACHE_SIZE:
+                self._insights_cache.popitem(last=False)
+        return insights
+
+    async def _render_report(self, session_id: str) -> Tuple[str, io.BytesIO]:
+        """Render a session's PDF report in memory, returning its filename and buffer."""
+        # Get session data
+        session = self.project_store.get_session(session_id)
+        if not session:
+            raise ValueError(f"Session {session_id} not found")
+        
+        # Get AI insights if available
+        insights = None
         try:
-            # Register main font
-            pdfmetrics.registerFont(TTFont(
-                'ScrollFont',
-                str(self.font_dir / 'scroll-font.ttf')
-            ))
-            # Register decorative font
-            pdfmetrics.registerFont(TTFont(
-                'ScrollDecorative',
-                str(self.font_dir / 'scroll-decorative.ttf')
-            ))
+            insights = await self._cached_insights({
+                "domain": session["domain"],
+                "data_type": session.get("metadata", {}).get("type", "Unknown"),
+                "metrics": list(session.get("interpretation", {}).get("metrics", {}).keys()),
+                "recent_activity": [{
+                    "type": "interpretation",
+                    "timestamp": session["timestamp"]
+                }]
+            })
         except Exception as e:
-            logger.warning(f"Failed to register custom fonts: {e}")
-            # Fallback to default fonts
-            pass
-
-    def _create_styles(self) -> Dict[str, ParagraphStyle]:
-        """Create custom paragraph styles for the PDF."""
-        styles = getSampleStyleSheet()
-        
-        # Title style
-        styles.add(ParagraphStyle(
-            name='ScrollTitle',
-            fontName='ScrollDecorative',
-            fontSize=24,
-            alignment=1,  # Center
-            spaceAfter=30,
-            textColor=colors.HexColor('#B8860B')  # ScrollGold
-        ))
+            logger.warning(f"Failed to get AI insights: {e}")
         
-        # Section header style
-        styles.add(ParagraphStyle(
-            name='ScrollHeader',
-            fontName='ScrollFont',
-            fontSize=16,
-            spaceAfter=12,
-            textColor=colors.HexColor('#8B4513')  # SaddleBrown
-        ))
+        # Generate PDF
+        filename = f"scroll_report_{session_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+        
+        buffer = io.BytesIO()
+        doc = SimpleDocTemplate(
+            buffer,
+            pagesize=letter,
+            rightMargin=72,
+            leftMargin=72,
+            topMargin=72,
+            bottomMargin=72
+        )
+        
+        # Build PDF content
+        story = []
+        
+        # Title
+        story.append(_static_paragraph("title"))
         
-        # Body text style
-        styles.add(ParagraphStyle(
-            name='ScrollBody',
-            fontName='ScrollFont',
-            fontSize=12,
-            spaceAfter=12,
-            textColor=colors.black
+        # Prophetic quote
+        story.append(_static_paragraph("quote"))
+        
+        # Domain Insight
+        story.append(_static_paragraph("domain_header"))
+        story.append(Paragraph(
+            f"<b>Domain:</b> {session['domain']}",
+            self.styles["ScrollBody"]
+        ))
+        story.append(Paragraph(
+            f"<b>Flame Caption:</b> {session['interpretation']['caption']}",
+            self.styles["ScrollBody"]
         ))
         
-        # Quote style
-        styles.add(ParagraphStyle(
-            name='ScrollQuote',
-            fontName='ScrollDecorative',
-            fontSize=14,
-            alignment=1,  # Center
-            spaceAfter=20,
-            textColor=colors.HexColor('#8B4513')  # SaddleBrown
+        # Chart
+        if session.get("chart_path"):
+            img = Image(session["chart_path"], width=6*inch, height=4*inch)
+            story.append(img)
+        
+        # Interpretation
+        story.append(_static_paragraph("interpretation_header"))
+        for key, value in session["interpretation"].items():
+            if key != "caption":
+                story.append(Paragraph(
+                    f"<b>{key.title()}:</b> {value}",
+                    self.styles["ScrollBody"]
+                ))
+        
+        # AI Insights
+        if insights:
+            story.append(_static_paragraph("insights_header"))
+            
+            # Key Insights, Analysis Areas and Action Items, one Paragraph per list
+            for _, key in INSIGHT_SECTIONS:
+                items = insights.get(key, [])
+                if not items:
+                    story.append(_static_paragraph(key))
+                    continue
+                bullets = "<br/>".join([f"&bull; {escape(str(item))}" for item in items])
+                # Keep each section title on the same page as its list
+                story.append(KeepTogether([
+                    _static_paragraph(key),
+                    Paragraph(bullets, self.styles["ScrollBody"])
+                ]))
+        
+        # Source Data
+        story.append(_static_paragraph("source_header"))
+        if session.get("metadata"):
+            # Plain strings; the TableStyle below sets font and size
+            metadata_table = Table([
+                ["Source", str(session["metadata"].get("source", "Unknown"))],
+                ["Timestamp", str(session["timestamp"])],
+                ["Type", str(session["metadata"].get("type", "Unknown"))]
+            ])
+            metadata_table.setStyle(TableStyle([
+                ('GRID', (0, 0), (-1, -1), 1, colors.black),
+                ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#F5DEB3')),  # Wheat
+                ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                ('FONTNAME', (0, 0), (-1, -1), 'ScrollFont'),
+                ('FONTSIZE', (0, 0), (-1, -1), 10),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+                ('TOPPADDING', (0, 0), (-1, -1), 12),
+            ]))
+            story.append(metadata_table)
+        
+        # Footer
+        story.append(Spacer(1, 30))
+        story.append(Paragraph(
+            f"Generated on {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}",
+            self.styles["ScrollBody"]
         ))
+        story.append(_static_paragraph("footer"))
+        
+        # Build PDF off the event loop
+        await asyncio.to_thread(doc.build, story)
         
-        return styles
+        return filename, buffer
 
     async def generate_report(self, session_id: str) -> str:
         """
@@ -118,131 +325,10 @@ class PDFExporter:
             str: Path to the generated PDF file
         """
         try:
-            # Get session data
-            session = self.project_store.get_session(session_id)
-            if not session:
-                raise ValueError(f"Session {session_id} not found")
-            
-            # Get AI insights if available
-            insights = None
-            try:
-                insights = await scroll_prophet.get_insights({
-                    "domain": session["domain"],
-                    "data_type": session.get("metadata", {}).get("type", "Unknown"),
-                    "metrics": session.get("interpretation", {}).get("metrics", {}).keys(),
-                    "recent_activity": [{
-                        "type": "interpretation",
-                        "timestamp": session["timestamp"]
-                    }]
-                })
-            except Exception as e:
-                logger.warning(f"Failed to get AI insights: {e}")
-            
-            # Generate PDF
-            filename = f"scroll_report_{session_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+            filename, buffer = await self._render_report(session_id)
             filepath = self.export_dir / filename
-            
-            doc = SimpleDocTemplate(
-                str(filepath),
-                pagesize=letter,
-                rightMargin=72,
-                leftMargin=72,
-                topMargin=72,
-                bottomMargin=72
-            )
-            
-            # Build PDF content
-            story = []
-            
-            # Title
-            story.append(Paragraph("🔥 ScrollIntel Flame Report", self.styles["ScrollTitle"]))
-            
-            # Prophetic quote
-            story.append(Paragraph(
-                '"The flame reveals patterns unseen by man, illuminating the path to wisdom."',
-                self.styles["ScrollQuote"]
-            ))
-            
-            # Domain Insight
-            story.append(Paragraph("Domain Insight", self.styles["ScrollHeader"]))
-            story.append(Paragraph(
-                f"<b>Domain:</b> {session['domain']}",
-                self.styles["ScrollBody"]
-            ))
-            story.append(Paragraph(
-                f"<b>Flame Caption:</b> {session['interpretation']['caption']}",
-                self.styles["ScrollBody"]
-            ))
-            
-            # Chart
-            if session.get("chart_path"):
-                img = Image(session["chart_path"], width=6*inch, height=4*inch)
-                story.append(img)
-            
-            # Interpretation
-            story.append(Paragraph("Interpretation", self.styles["ScrollHeader"]))
-            for key, value in session["interpretation"].items():
-                if key != "caption":
-                    story.append(Paragraph(
-                        f"<b>{key.title()}:</b> {value}",
-                        self.styles["ScrollBody"]
-                    ))
-            
-            # AI Insights
-            if insights:
-                story.append(Paragraph("ScrollProphet Insights", self.styles["ScrollHeader"]))
-                
-                # Key Insights
-                story.append(Paragraph("Key Insights:", self.styles["ScrollBody"]))
-                for insight in insights.get("key_insights", []):
-                    story.append(Paragraph(f"• {insight}", self.styles["ScrollBody"]))
-                
-                # Analysis Areas
-                story.append(Paragraph("Analysis Areas:", self.styles["ScrollBody"]))
-                for area in insights.get("analysis_areas", []):
-                    story.append(Paragraph(f"• {area}", self.styles["ScrollBody"]))
-                
-                # Action Items
-                story.append(Paragraph("Action Items:", self.styles["ScrollBody"]))
-                for action in insights.get("action_items", []):
-                    story.append(Paragraph(f"• {action}", self.styles["ScrollBody"]))
-            
-            # Source Data
-            story.append(Paragraph("Source Data", self.styles["ScrollHeader"]))
-            if session.get("metadata"):
-                metadata_table = Table([
-                    [Paragraph("Source", self.styles["ScrollBody"]),
-                     Paragraph(str(session["metadata"].get("source", "Unknown")), self.styles["ScrollBody"])],
-                    [Paragraph("Timestamp", self.styles["ScrollBody"]),
-                     Paragraph(session["timestamp"], self.styles["ScrollBody"])],
-                    [Paragraph("Type", self.styles["ScrollBody"]),
-                     Paragraph(str(session["metadata"].get("type", "Unknown")), self.styles["ScrollBody"])]
-                ])
-                metadata_table.setStyle(TableStyle([
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                    ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#F5DEB3')),  # Wheat
-                    ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, -1), 'ScrollFont'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 10),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-                    ('TOPPADDING', (0, 0), (-1, -1), 12),
-                ]))
-                story.append(metadata_table)
-            
-            # Footer
-            story.append(Spacer(1, 30))
-            story.append(Paragraph(
-                f"Generated on {datetime.now(pytz.UTC).strftime('%Y-%m-%d %H:%M:%S UTC')}",
-                self.styles["ScrollBody"]
-            ))
-            story.append(Paragraph(
-                "ScrollIntel v2 - The Flame Interpreter",
-                self.styles["ScrollBody"]
-            ))
-            
-            # Build PDF
-            doc.build(story)
+            async with aiofiles.open(filepath, "wb", buffering=1 << 20) as f:
+                await f.write(buffer.getbuffer())
             
             return str(filepath)
             
@@ -250,5 +336,36 @@ class PDFExporter:
             logger.error(f"Error generating PDF report: {e}")
             raise
 
+    async def iter_report(
+        self,
+        session_id: str,
+        chunk_size: int = REPORT_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """
+        Generate a PDF report for a session and yield it in chunks.
+        
+        Nothing is written to the export directory, so the report can be
+        streamed straight to a client.
+        
+        Args:
+            session_id: ID of the session to generate report for
+            chunk_size: Maximum size of each yielded chunk
+            
+        Yields:
+            bytes: Consecutive chunks of the PDF file
+        """
+        try:
+            _, buffer = await self._render_report(session_id)
+        except Exception as e:
+            logger.error(f"Error generating PDF report: {e}")
+            raise
+        
+        view = buffer.getbuffer()
+        try:
+            for start in range(0, len(view), chunk_size):
+                yield bytes(view[start:start + chunk_size])
+        finally:
+            view.release()
+
 # Create global instance
 pdf_exporter = PDFExporter() 
\ No newline at end of file
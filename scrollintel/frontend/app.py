@@ -4,10 +4,11 @@ Frontend application with ScrollSpirit Layer for divine data insight
 """
 
 import streamlit as st
-import requests
+import httpx
 import json
 import pandas as pd
-import plotly.express as px
+import plotly.graph_objects as go
+from plotly.colors import sequential
 from typing import Dict, Any, List, Optional
 import os
 import aiohttp
@@ -24,124 +25,16 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Add sacred styling
-st.markdown("""
-<style>
-/* Sacred Flame Animation */
-@keyframes sacredFlame {
-    0% { filter: drop-shadow(0 0 5px rgba(255, 69, 0, 0.5)); }
-    50% { filter: drop-shadow(0 0 20px rgba(255, 69, 0, 0.8)); }
-    100% { filter: drop-shadow(0 0 5px rgba(255, 69, 0, 0.5)); }
-}
-
-@keyframes divineFloat {
-    0% { transform: translateY(0px); }
-    50% { transform: translateY(-10px); }
-    100% { transform: translateY(0px); }
-}
-
-/* Sacred UI Elements */
-.stApp {
-    background: linear-gradient(135deg, #1a1a1a 0%, #2d2d2d 100%);
-    color: #ffffff;
-}
-
-.stSidebar {
-    background: linear-gradient(180deg, #1a1a1a 0%, #2d2d2d 100%);
-    border-right: 1px solid rgba(255, 69, 0, 0.2);
-}
-
-.stButton>button {
-    background: linear-gradient(45deg, #ff4500, #ff8c00);
-    color: #1a1a1a;
-    border: none;
-    border-radius: 8px;
-    padding: 0.5rem 1rem;
-    font-weight: bold;
-    transition: all 0.3s ease;
-}
-
-.stButton>button:hover {
-    transform: scale(1.05);
-    box-shadow: 0 0 15px rgba(255, 69, 0, 0.5);
-}
-
-/* Sacred Chart Styling */
-.js-plotly-plot .plotly {
-    background: rgba(26, 26, 26, 0.8) !important;
-}
+STYLES_PATH = os.path.join(os.path.dirname(__file__), "styles.css")
 
-.js-plotly-plot .plotly .main-svg {
-    background: transparent !important;
-}
-
-.js-plotly-plot .plotly .bglayer {
-    background: transparent !important;
-}
+@st.cache_resource
+def _sacred_css() -> str:
+    """Load the sacred styling once per server process."""
+    with open(STYLES_PATH, encoding="utf-8") as f:
+        return f"<style>\n{f.read()}</style>"
 
-.js-plotly-plot .plotly .gl-canvas {
-    background: transparent !important;
-}
-
-/* Sacred Seal */
-.scroll-seal-container {
-    animation: divineFloat 6s ease-in-out infinite;
-}
-
-.scroll-seal-container img {
-    animation: sacredFlame 4s ease-in-out infinite;
-    border-radius: 50%;
-    padding: 10px;
-    background: rgba(255, 69, 0, 0.1);
-    border: 2px solid rgba(255, 69, 0, 0.3);
-}
-
-/* Sacred Headers */
-h1, h2, h3, h4, h5, h6 {
-    color: #ff4500;
-    text-shadow: 0 0 10px rgba(255, 69, 0, 0.3);
-}
-
-/* Sacred Radio Buttons */
-.stRadio > div {
-    background: rgba(255, 69, 0, 0.1);
-    border-radius: 8px;
-    padding: 1rem;
-    border: 1px solid rgba(255, 69, 0, 0.2);
-}
-
-/* Sacred Dividers */
-hr {
-    border: none;
-    height: 1px;
-    background: linear-gradient(90deg, transparent, rgba(255, 69, 0, 0.5), transparent);
-    margin: 1rem 0;
-}
-
-/* Sacred Charts */
-.plotly-chart {
-    background: rgba(26, 26, 26, 0.8);
-    border-radius: 8px;
-    padding: 1rem;
-    border: 1px solid rgba(255, 69, 0, 0.2);
-}
-
-/* Sacred Data Tables */
-.dataframe {
-    background: rgba(26, 26, 26, 0.8);
-    border-radius: 8px;
-    padding: 1rem;
-    border: 1px solid rgba(255, 69, 0, 0.2);
-}
-
-/* Sacred Messages */
-.stAlert {
-    background: rgba(255, 69, 0, 0.1);
-    border: 1px solid rgba(255, 69, 0, 0.3);
-    border-radius: 8px;
-}
-</style>
-""", unsafe_allow_html=True)
+# Add sacred styling
+st.markdown(_sacred_css(), unsafe_allow_html=True)
 
 # Get backend URL from environment variable or use default
 BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
@@ -156,11 +49,21 @@ def init_session_state():
     if "sacred_timing" not in st.session_state:
         st.session_state.sacred_timing = get_sacred_timing()
 
+@st.cache_resource
+def _backend_client() -> httpx.Client:
+    """Shared HTTP client so reruns reuse the backend connection."""
+    return httpx.Client(base_url=BACKEND_URL, timeout=10)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_sacred_timing() -> Dict[str, Any]:
+    """Fetch sacred timing, memoized for a minute across reruns."""
+    response = _backend_client().get("/scrollspirit/status")
+    return response.json()["sacred_timing"]
+
 def get_sacred_timing() -> Dict[str, Any]:
     """Get current sacred timing from backend."""
     try:
-        response = requests.get(f"{BACKEND_URL}/scrollspirit/status")
-        return response.json()["sacred_timing"]
+        return _fetch_sacred_timing()
     except:
         return {
             "phase": "dawn",
@@ -234,42 +137,44 @@ def render_scrollspirit_interface():
         else:
             st.warning("Please enter data for interpretation")
 
-def render_sacred_chart(data: pd.DataFrame, chart_type: str, **kwargs):
+# Trace class and fixed trace options for each sacred chart type
+SACRED_CHART_TRACES = {
+    "bar": (go.Bar, {}),
+    "line": (go.Scatter, {"mode": "lines"}),
+    "scatter": (go.Scatter, {"mode": "markers"}),
+}
+
+# Sacred chart layout, built once instead of per render
+_SACRED_LAYOUT = go.Layout(
+    template="plotly_dark",
+    colorway=sequential.Oranges,
+    paper_bgcolor="rgba(26, 26, 26, 0.8)",
+    plot_bgcolor="rgba(26, 26, 26, 0.8)",
+    font=dict(color="#ffffff"),
+    title=dict(
+        font=dict(color="#ff4500"),
+        x=0.5,
+        y=0.95
+    ),
+    margin=dict(t=50, l=50, r=50, b=50)
+)
+
+def render_sacred_chart(
+    data: pd.DataFrame,
+    chart_type: str,
+    x: str,
+    y: str,
+    title: Optional[str] = None,
+    **kwargs
+):
     """Render a chart with sacred styling."""
-    if chart_type == "bar":
-        fig = px.bar(
-            data,
-            **kwargs,
-            template="plotly_dark",
-            color_discrete_sequence=px.colors.sequential.Oranges
-        )
-    elif chart_type == "line":
-        fig = px.line(
-            data,
-            **kwargs,
-            template="plotly_dark",
-            color_discrete_sequence=px.colors.sequential.Oranges
-        )
-    elif chart_type == "scatter":
-        fig = px.scatter(
-            data,
-            **kwargs,
-            template="plotly_dark",
-            color_discrete_sequence=px.colors.sequential.Oranges
-        )
-    
-    # Add sacred styling
-    fig.update_layout(
-        paper_bgcolor="rgba(26, 26, 26, 0.8)",
-        plot_bgcolor="rgba(26, 26, 26, 0.8)",
-        font=dict(color="#ffffff"),
-        title=dict(
-            font=dict(color="#ff4500"),
-            x=0.5,
-            y=0.95
-        ),
-        margin=dict(t=50, l=50, r=50, b=50)
+    trace_cls, trace_options = SACRED_CHART_TRACES[chart_type]
+    fig = go.Figure(
+        data=[trace_cls(x=data[x], y=data[y], **trace_options, **kwargs)],
+        layout=_SACRED_LAYOUT
     )
+    if title:
+        fig.update_layout(title_text=title)
     
     return fig
 
@@ -5,11 +5,12 @@ Airtable integration client
 
 from typing import Dict, Any, List, Optional, Union
 import pandas as pd
-from datetime import datetime
-import pytz
 import os
 import json
-import requests
+import asyncio
+import aiohttp
+from urllib.parse import urlencode, quote
+from yarl import URL
 
 from .base import BaseIntegration
 
@@ -18,6 +19,13 @@ class AirtableClient(BaseIntegration):
     
     BASE_URL = "https://api.airtable.com/v0"
     
+    # Shared across instances so keep-alive connections survive the
+    # per-request clients built by the API dependencies.
+    _session: Optional[aiohttp.ClientSession] = None
+    
+    # Airtable allows 5 requests/second per base; keep in-flight calls below that
+    _requests = asyncio.Semaphore(4)
+    
     def __init__(self, credentials: Dict[str, Any]):
         """Initialize Airtable client with credentials."""
         super().__init__(credentials)
@@ -29,6 +37,35 @@ class AirtableClient(BaseIntegration):
         }
         self._log_integration("initialize", {"status": "success"})
     
+    @classmethod
+    def _get_session(cls) -> aiohttp.ClientSession:
+        """Return the pooled HTTP session, creating it inside the running loop."""
+        if cls._session is None or cls._session.closed:
+            cls._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=30)
+            )
+        return cls._session
+    
+    @classmethod
+    async def close(cls):
+        """Close the pooled HTTP session."""
+        if cls._session is not None and not cls._session.closed:
+            await cls._session.close()
+        cls._session = None
+    
+    async def _get_json(
+        self,
+        url: Union[str, URL],
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """GET an Airtable endpoint and decode the JSON body."""
+        async with self._requests:
+            async with self._get_session().get(
+                url, headers=self.headers, params=params
+            ) as response:
+                response.raise_for_status()
+                return await response.json()
+    
     async def fetch_data(
         self,
         table_id: str,
@@ -42,34 +79,35 @@ class AirtableClient(BaseIntegration):
             # Build URL
             url = f"{self.BASE_URL}/{self.base_id}/{table_id}"
             
-            # Build params
-            params = {
-                "maxRecords": max_records
-            }
+            # Build params, encoded once and reused for every page
+            params = {}
+            if max_records is not None:
+                params["maxRecords"] = max_records
             if filter_by_formula:
                 params["filterByFormula"] = filter_by_formula
-            
-            # Make request
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            
-            # Parse response
-            data = response.json()
-            records = data.get("records", [])
-            
-            # Convert to DataFrame
-            rows = []
-            for record in records:
-                row = record["fields"]
-                row["id"] = record["id"]
-                row["createdTime"] = record["createdTime"]
-                rows.append(row)
-            
-            df = pd.DataFrame(rows)
+            query = f"{url}?{urlencode(params, quote_via=quote)}"
+            
+            # Follow offset pagination; Airtable caps each page at 100 records
+            records = []
+            pending = asyncio.ensure_future(self._get_json(URL(query, encoded=True)))
+            while pending is not None:
+                data = await pending
+                offset = data.get("offset")
+                # Request the next page before handling this one so the
+                # round trip overlaps with record processing
+                pending = asyncio.ensure_future(self._get_json(
+                    URL(f"{query}&offset={quote(offset)}", encoded=True)
+                )) if offset else None
+                records.extend(data.get("records", []))
+            
+            # Convert to DataFrame column-wise, leaving Airtable's dicts untouched
+            df = pd.DataFrame.from_records([record["fields"] for record in records])
+            df["id"] = [record["id"] for record in records]
+            df["createdTime"] = [record["createdTime"] for record in records]
             
             # Filter fields if specified
             if fields:
-                df = df[fields]
+                df = df.reindex(columns=fields)
             
             self._log_integration(
                 "fetch_data",
@@ -95,11 +133,7 @@ class AirtableClient(BaseIntegration):
         try:
             # Get base schema
             url = f"{self.BASE_URL}/meta/bases/{self.base_id}/tables"
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            
-            # Parse response
-            data = response.json()
+            data = await self._get_json(url)
             tables = data.get("tables", [])
             
             # Format table info
@@ -138,11 +172,7 @@ class AirtableClient(BaseIntegration):
         try:
             # Get table schema
             url = f"{self.BASE_URL}/meta/bases/{self.base_id}/tables/{table_id}"
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            
-            # Parse response
-            table = response.json()
+            table = await self._get_json(url)
             
             info = {
                 "id": table["id"],
@@ -170,11 +200,19 @@ class AirtableClient(BaseIntegration):
             self.logger.error(f"Failed to get table info: {str(e)}")
             raise ValueError(f"Failed to get table info: {str(e)}")
     
-    def validate_credentials(self) -> bool:
+    async def validate_credentials(self) -> bool:
         """Validate Airtable credentials."""
+        # Reject malformed keys and base IDs without a network round trip
+        if not (
+            self.api_key and self.api_key.startswith(("key", "pat"))
+            and self.base_id and self.base_id.startswith("app")
+        ):
+            self.logger.error("Airtable credential validation failed: malformed api_key or base_id")
+            return False
+        
         try:
-            # Try to list tables as a validation check
-            self.list_resources()
+            # Smallest authenticated request Airtable offers
+            await self._get_json(f"{self.BASE_URL}/meta/whoami")
             return True
         except Exception as e:
             self.logger.error(f"Airtable credential validation failed: {str(e)}")
@@ -6,11 +6,76 @@ Base integration module
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional, Union
 import pandas as pd
-from datetime import datetime
-import pytz
+import asyncio
 import logging
-import json
+import functools
+import orjson
+import inspect
 import os
+from datetime import datetime, timezone
+from cachetools import TTLCache
+
+LOG_DIR = "logs/integrations"
+
+# One file handler per integration class, shared by every instance
+_HANDLERS: Dict[str, logging.Handler] = {}
+
+@functools.singledispatch
+def _to_dataframe(data: Any) -> pd.DataFrame:
+    """Convert integration results to a DataFrame by type."""
+    raise ValueError(f"Unsupported data type: {type(data)}")
+
+@_to_dataframe.register
+def _(data: pd.DataFrame) -> pd.DataFrame:
+    return data
+
+@_to_dataframe.register
+def _(data: dict) -> pd.DataFrame:
+    return pd.DataFrame(data)
+
+def ttl_cache(seconds: float = 300, maxsize: int = 256):
+    """
+    Cache a metadata method's result for ``seconds``.
+    
+    Clients are built per request, so entries are shared across instances
+    and keyed on the instance's credentials rather than on ``self``.
+    """
+    def decorator(func):
+        cache: TTLCache = TTLCache(maxsize=maxsize, ttl=seconds)
+        
+        def make_key(self, args, kwargs):
+            try:
+                key = (self._cache_scope, args, frozenset(kwargs.items()))
+                hash(key)
+                return key
+            except TypeError:
+                # Unhashable arguments bypass the cache
+                return None
+        
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(self, *args, **kwargs):
+                key = make_key(self, args, kwargs)
+                if key is not None and key in cache:
+                    return cache[key]
+                value = await func(self, *args, **kwargs)
+                if key is not None:
+                    cache[key] = value
+                return value
+        else:
+            @functools.wraps(func)
+            def wrapper(self, *args, **kwargs):
+                key = make_key(self, args, kwargs)
+                if key is not None and key in cache:
+                    return cache[key]
+                value = func(self, *args, **kwargs)
+                if key is not None:
+                    cache[key] = value
+                return value
+        
+        wrapper.cache = cache
+        return wrapper
+    return decorator
 
 class BaseIntegration(ABC):
     """Base class for all ScrollIntel integrations."""
@@ -21,30 +86,50 @@ class BaseIntegration(ABC):
         self.logger = logging.getLogger(f"scrollintel.integrations.{self.__class__.__name__}")
         self._setup_logging()
     
+    @functools.cached_property
+    def _cache_scope(self) -> int:
+        """Identify the account behind this instance for shared caches."""
+        return hash((
+            self.__class__.__name__,
+            tuple(sorted((k, str(v)) for k, v in self.credentials.items()))
+        ))
+    
     def _setup_logging(self):
         """Set up logging for the integration."""
-        log_dir = "logs/integrations"
-        os.makedirs(log_dir, exist_ok=True)
+        name = self.__class__.__name__
+        if name in _HANDLERS:
+            return
         
-        handler = logging.FileHandler(
-            f"{log_dir}/{self.__class__.__name__}.log"
-        )
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        os.makedirs(LOG_DIR, exist_ok=True)
+        path = os.path.abspath(f"{LOG_DIR}/{name}.log")
+        handler = next(
+            (
+                h for h in self.logger.handlers
+                if isinstance(h, logging.FileHandler) and h.baseFilename == path
+            ),
+            None
         )
-        handler.setFormatter(formatter)
-        self.logger.addHandler(handler)
+        if handler is None:
+            handler = logging.FileHandler(path)
+            formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
+            handler.setFormatter(formatter)
+            self.logger.addHandler(handler)
         self.logger.setLevel(logging.INFO)
+        _HANDLERS[name] = handler
     
     def _log_integration(self, action: str, details: Dict[str, Any]):
         """Log integration activity."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         log_entry = {
-            "timestamp": datetime.now(pytz.UTC).isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             "integration": self.__class__.__name__,
             "action": action,
             "details": details
         }
-        self.logger.info(json.dumps(log_entry))
+        self.logger.info(orjson.dumps(log_entry).decode())
     
     def _sanitize_credentials(self, credentials: Dict[str, Any]) -> Dict[str, Any]:
         """Sanitize credentials for logging."""
@@ -79,17 +164,34 @@ class BaseIntegration(ABC):
         """Get information about a specific resource."""
         pass
     
+    async def fetch_many(
+        self,
+        resource_ids: List[str],
+        concurrency: int = 8,
+        **kwargs
+    ) -> List[Union[pd.DataFrame, Dict[str, Any], Exception]]:
+        """Fetch several resources concurrently, at most ``concurrency`` at a time.
+        
+        Results are returned in input order; a failed fetch yields its exception
+        instead of aborting the batch.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def fetch_one(resource_id: str):
+            async with semaphore:
+                return await self.fetch_data(resource_id, **kwargs)
+        
+        return await asyncio.gather(
+            *(fetch_one(resource_id) for resource_id in resource_ids),
+            return_exceptions=True
+        )
+    
     def to_dataframe(
         self,
         data: Union[pd.DataFrame, Dict[str, Any]]
     ) -> pd.DataFrame:
         """Convert data to pandas DataFrame."""
-        if isinstance(data, pd.DataFrame):
-            return data
-        elif isinstance(data, dict):
-            return pd.DataFrame(data)
-        else:
-            raise ValueError(f"Unsupported data type: {type(data)}")
+        return _to_dataframe(data)
     
     def validate_credentials(self) -> bool:
         """Validate integration credentials."""
@@ -3,32 +3,220 @@ ScrollIntel v2: The Flame Interpreter
 Cloud Storage integration base client
 """
 
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Union, Iterator, AsyncIterator, Callable, Tuple
 import pandas as pd
-from datetime import datetime
+from pandas.errors import EmptyDataError
+from pandas.io.parsers import TextParser
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from python_calamine import CalamineWorkbook
+import ijson
+from cachetools import TTLCache
+from datetime import date, datetime
 import pytz
 import os
-import json
+import orjson
 import io
-import mimetypes
+import time
+import tempfile
+from pathlib import Path
+import asyncio
+import multiprocessing
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
 
 from .base import BaseIntegration
 
+# Default size of the fragments pulled from a download stream
+DOWNLOAD_CHUNK_BYTES = 8 << 20
+
+def file_extension(name: str) -> str:
+    """Lower-cased extension of a file name or path, without the dot; "" if it has none."""
+    _, dot, ext = name.rpartition(".")
+    if not dot or "/" in ext:
+        return ""
+    return ext.lower()
+
+# Block size for Arrow's multithreaded CSV parser
+CSV_BLOCK_BYTES = 8 << 20
+
+def _arrow_result(table: pa.Table, as_arrow: bool) -> Union[pd.DataFrame, pa.Table]:
+    """Return the Arrow table itself, or convert it while releasing Arrow buffers as they are copied."""
+    if as_arrow:
+        return table
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+def parse_csv_bytes(content: bytes, as_arrow: bool = False) -> Union[pd.DataFrame, pa.Table]:
+    """Parse CSV content with Arrow's multithreaded reader."""
+    return parse_csv_file(pa.py_buffer(content), as_arrow)
+
+def parse_csv_file(path: Union[str, pa.Buffer], as_arrow: bool = False) -> Union[pd.DataFrame, pa.Table]:
+    """Parse a CSV file (or Arrow buffer) with Arrow's multithreaded reader."""
+    table = pacsv.read_csv(
+        path,
+        read_options=pacsv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_BYTES)
+    )
+    return _arrow_result(table, as_arrow)
+
+def parse_csv_stream(stream, as_arrow: bool = False) -> Union[pd.DataFrame, pa.Table]:
+    """Parse CSV from a readable stream block by block, without buffering the raw file."""
+    reader = pacsv.open_csv(
+        stream,
+        read_options=pacsv.ReadOptions(block_size=CSV_BLOCK_BYTES)
+    )
+    return _arrow_result(reader.read_all(), as_arrow)
+
+def _excel_cell(value: Any) -> Any:
+    """Convert a calamine cell the way pandas' Excel readers do."""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return datetime(value.year, value.month, value.day)
+    return value
+
+def parse_excel_bytes(content: Union[bytes, str]) -> pd.DataFrame:
+    """Parse the first worksheet of an Excel workbook (bytes or a path), using its first row as the header.
+    
+    Rows go through the same parser ``pd.read_excel`` uses, so blank cells
+    become NaN, column dtypes are inferred and duplicate headers are
+    de-duplicated exactly as before.
+    """
+    if isinstance(content, str):
+        workbook = CalamineWorkbook.from_path(content)
+    else:
+        workbook = CalamineWorkbook.from_filelike(io.BytesIO(content))
+    rows = workbook.get_sheet_by_index(0).to_python(skip_empty_area=False)
+    data = [[_excel_cell(cell) for cell in row] for row in rows]
+    try:
+        return TextParser(data, header=0, skip_blank_lines=False).read()
+    except EmptyDataError:
+        return pd.DataFrame()
+
+def excel_bytes(df: pd.DataFrame) -> bytes:
+    """Write a DataFrame as a single-sheet XLSX workbook with xlsxwriter."""
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer, engine="xlsxwriter") as writer:
+        df.to_excel(writer, index=False)
+    return buffer.getvalue()
+
+class ChunkedByteStream(io.RawIOBase):
+    """Readable file object over an iterator of byte fragments.
+    
+    Lets pandas and ijson pull a download lazily instead of needing the
+    whole file in memory.
+    """
+    
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = iter(chunks)
+        self._pending = b""
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            try:
+                self._pending = next(self._chunks)
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+async def iterate_in_thread(
+    make_iterator: Callable[[], Iterator[Any]],
+    batch: int = 1
+) -> AsyncIterator[Any]:
+    """Drive a blocking iterator from worker threads, pulling up to ``batch`` items per hop.
+    
+    Streamed downloads read the network as they are iterated, so every
+    pull (including building the iterator) stays off the event loop.
+    """
+    iterator = await asyncio.to_thread(make_iterator)
+    while True:
+        items = await asyncio.to_thread(list, islice(iterator, batch))
+        if not items:
+            return
+        for item in items:
+            yield item
+
+def stream_records(
+    chunks: Iterator[bytes],
+    is_csv: bool,
+    chunksize: int,
+    json_prefix: str = "item"
+) -> AsyncIterator[Any]:
+    """Parse a streamed download into CSV DataFrame chunks or JSON items, off the event loop."""
+    def make_iterator():
+        stream = io.BufferedReader(ChunkedByteStream(chunks))
+        if is_csv:
+            return pd.read_csv(stream, chunksize=chunksize, low_memory=True)
+        return ijson.items(stream, json_prefix)
+    
+    return iterate_in_thread(make_iterator, batch=1 if is_csv else chunksize)
+
+# Worker processes for Excel decoding, which holds the GIL for the whole parse; started on first use
+_EXCEL_POOL: Optional[ProcessPoolExecutor] = None
+
+def _excel_pool() -> ProcessPoolExecutor:
+    """Return the Excel worker pool, spawning (not forking) it on first use."""
+    global _EXCEL_POOL
+    if _EXCEL_POOL is None:
+        _EXCEL_POOL = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _EXCEL_POOL
+
+def shutdown_excel_pool():
+    """Stop the Excel worker processes; a later parse starts a new pool."""
+    global _EXCEL_POOL
+    pool, _EXCEL_POOL = _EXCEL_POOL, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+async def parse_excel_in_pool(content: Union[bytes, str]) -> pd.DataFrame:
+    """Parse an Excel workbook (bytes or a path) in a worker process so large sheets decode in parallel."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_excel_pool(), parse_excel_bytes, content)
+
 class CloudStorageClient(BaseIntegration):
     """Base class for cloud storage integrations (Google Drive, OneDrive)."""
     
-    SUPPORTED_MIMETYPES = [
-        'text/csv',
-        'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-        'application/vnd.ms-excel',
-        'application/json'
-    ]
+    # Supported mime types and file extensions mapped to file types
+    _MIME_TO_TYPE = {
+        'text/csv': 'csv',
+        'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': 'xlsx',
+        'application/vnd.ms-excel': 'xlsx',
+        'application/json': 'json'
+    }
+    _EXT_TO_TYPE = {
+        'csv': 'csv',
+        'xlsx': 'xlsx',
+        'xls': 'xlsx',
+        'json': 'json'
+    }
+    
+    SUPPORTED_MIMETYPES = frozenset(_MIME_TO_TYPE)
+    
+    # Clients that implement _download_file_to read files via a temp file, not bytes
+    DOWNLOAD_TO_DISK = False
+    
+    # Filtered folder listings by (account scope, folder ID, file types); shared
+    # because the API builds a new client for every request
+    _listing_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
     
     def __init__(self, credentials: Dict[str, Any]):
         """Initialize cloud storage client with credentials."""
         super().__init__(credentials)
         self.scroll_folder = "/ScrollIntel"
-        self._log_integration("initialize", {"status": "success"})
+        
+        # File metadata by file ID as (fetched at, metadata)
+        self._meta_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._meta_ttl = 300
+        
+        # Subclasses log "initialize" once their service client is ready
     
     async def fetch_data(
         self,
@@ -36,24 +224,49 @@ class CloudStorageClient(BaseIntegration):
         file_type: Optional[str] = None,
         **kwargs
     ) -> Union[pd.DataFrame, Dict[str, Any]]:
-        """Read file from cloud storage."""
+        """Read file from cloud storage.
+        
+        Pass ``chunksize`` to stream CSV files as an async iterator of
+        DataFrames, or JSON files as an async iterator of the items under
+        ``json_prefix`` (default ``"item"``), without holding the whole file
+        in memory. Downloading and parsing happen in worker threads.
+        Pass ``return_arrow=True`` to get CSV files as a ``pyarrow.Table``.
+        """
         try:
-            # Download file content
-            content = await self._download_file(file_id)
-            
             # Determine file type if not provided
             if not file_type:
-                file_type = self._get_file_type(file_id)
+                file_type = await self._get_file_type(file_id)
             
-            # Read file based on type
-            if file_type == "csv":
-                data = pd.read_csv(io.BytesIO(content))
-            elif file_type in ["xlsx", "xls"]:
-                data = pd.read_excel(io.BytesIO(content))
-            elif file_type == "json":
-                data = json.loads(content)
+            chunksize = kwargs.get("chunksize")
+            if chunksize and file_type in ("csv", "json"):
+                data = stream_records(
+                    self._iter_file_bytes(file_id),
+                    file_type == "csv",
+                    chunksize,
+                    kwargs.get("json_prefix", "item")
+                )
+                
+                self._log_integration(
+                    "fetch_data",
+                    {
+                        "file_id": file_id,
+                        "file_type": file_type,
+                        "chunksize": chunksize
+                    }
+                )
+                
+                return data
+            
+            # Download the file, to disk where the client streams, and parse it
+            as_arrow = kwargs.get("return_arrow", False)
+            if self.DOWNLOAD_TO_DISK:
+                with tempfile.TemporaryDirectory() as tmp_dir:
+                    path = os.path.join(tmp_dir, f"download.{file_type}")
+                    await self._download_file_to(file_id, path)
+                    data = await self._parse_file(path, file_type, as_arrow)
             else:
-                raise ValueError(f"Unsupported file type: {file_type}")
+                content = await self._download_file(file_id)
+                data = await self._parse_file(content, file_type, as_arrow)
             
             self._log_integration(
                 "fetch_data",
@@ -80,13 +293,23 @@ class CloudStorageClient(BaseIntegration):
             if not file_types:
                 file_types = ["csv", "xlsx", "xls", "json"]
             
+            key = (self._cache_scope, folder_id, tuple(sorted(file_types)))
+            cached = self._listing_cache.get(key)
+            if cached is not None:
+                return list(cached)
+            
             # List files in folder
             files = await self._list_files(folder_id)
             
+            # The listing already carries each file's metadata
+            now = time.monotonic()
+            for file in files:
+                self._meta_cache[file["id"]] = (now, file)
+            
             # Filter by file type
             result = []
             for file in files:
-                file_type = self._get_file_type(file["id"])
+                file_type = self._mime_to_type(file.get("mime_type", ""), file["name"])
                 if file_type in file_types:
                     result.append({
                         "id": file["id"],
@@ -106,11 +329,43 @@ class CloudStorageClient(BaseIntegration):
                 }
             )
             
-            return result
+            self._listing_cache[key] = result
+            return list(result)
         except Exception as e:
             self.logger.error(f"Failed to list files: {str(e)}")
             raise ValueError(f"Failed to list files: {str(e)}")
     
+    def invalidate_listing(self, folder_id: Optional[str] = None):
+        """Drop cached listings for a folder so the next list_resources call refetches it."""
+        scope = self._cache_scope
+        for key in [key for key in self._listing_cache if key[:2] == (scope, folder_id)]:
+            self._listing_cache.pop(key, None)
+    
+    async def upload_file(
+        self,
+        content: bytes,
+        name: str,
+        folder_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Upload a file into a folder and drop that folder's cached listings."""
+        try:
+            info = await self._upload_file(content, name, folder_id)
+            self.invalidate_listing(folder_id)
+            
+            self._log_integration(
+                "upload_file",
+                {
+                    "name": name,
+                    "folder_id": folder_id,
+                    "size": len(content)
+                }
+            )
+            
+            return info
+        except Exception as e:
+            self.logger.error(f"Failed to upload file: {str(e)}")
+            raise ValueError(f"Failed to upload file: {str(e)}")
+    
     async def get_resource_info(
         self,
         file_id: str,
@@ -119,12 +374,12 @@ class CloudStorageClient(BaseIntegration):
         """Get information about a file."""
         try:
             # Get file metadata
-            metadata = await self._get_file_metadata(file_id)
+            metadata = await self._cached_metadata(file_id)
             
             info = {
                 "id": metadata["id"],
                 "name": metadata["name"],
-                "type": self._get_file_type(file_id),
+                "type": await self._get_file_type(file_id),
                 "size": metadata.get("size", 0),
                 "created": metadata.get("created", datetime.now(pytz.UTC).isoformat()),
                 "modified": metadata.get("modified", datetime.now(pytz.UTC).isoformat()),
@@ -142,7 +397,48 @@ class CloudStorageClient(BaseIntegration):
             raise ValueError(f"Failed to get file info: {str(e)}")
     
     async def _download_file(self, file_id: str) -> bytes:
-        """Download file content. Must be implemented by subclasses."""
+        """Download file content. Implemented by subclasses that don't set DOWNLOAD_TO_DISK."""
+        raise NotImplementedError
+    
+    async def _download_file_to(self, file_id: str, dest_path: str) -> int:
+        """Download a file to a path and return its size. Implemented by DOWNLOAD_TO_DISK subclasses."""
+        raise NotImplementedError
+    
+    async def _parse_file(
+        self,
+        source: Union[bytes, str],
+        file_type: str,
+        as_arrow: bool = False
+    ) -> Union[pd.DataFrame, pa.Table, Dict[str, Any]]:
+        """Parse downloaded content, or a downloaded file at a path, by file type."""
+        is_path = isinstance(source, str)
+        if file_type == "csv":
+            return await asyncio.to_thread(
+                parse_csv_file if is_path else parse_csv_bytes, source, as_arrow
+            )
+        if file_type in ["xlsx", "xls"]:
+            return await parse_excel_in_pool(source)
+        if file_type == "json":
+            if is_path:
+                source = await asyncio.to_thread(Path(source).read_bytes)
+            return orjson.loads(source)
+        raise ValueError(f"Unsupported file type: {file_type}")
+    
+    def _iter_file_bytes(
+        self,
+        file_id: str,
+        chunk_bytes: int = DOWNLOAD_CHUNK_BYTES
+    ) -> Iterator[bytes]:
+        """Yield file content in fragments. Must be implemented by subclasses."""
+        raise NotImplementedError
+    
+    async def _upload_file(
+        self,
+        content: bytes,
+        name: str,
+        folder_id: Optional[str]
+    ) -> Dict[str, Any]:
+        """Upload file content and return its metadata. Must be implemented by subclasses."""
         raise NotImplementedError
     
     async def _list_files(self, folder_id: Optional[str]) -> List[Dict[str, Any]]:
@@ -153,32 +449,33 @@ class CloudStorageClient(BaseIntegration):
         """Get file metadata. Must be implemented by subclasses."""
         raise NotImplementedError
     
-    def _get_file_type(self, file_id: str) -> str:
+    async def _cached_metadata(self, file_id: str) -> Dict[str, Any]:
+        """Get file metadata, reusing entries fetched within the last ``_meta_ttl`` seconds."""
+        entry = self._meta_cache.get(file_id)
+        if entry is not None and time.monotonic() - entry[0] < self._meta_ttl:
+            return entry[1]
+        
+        metadata = await self._get_file_metadata(file_id)
+        self._meta_cache[file_id] = (time.monotonic(), metadata)
+        return metadata
+    
+    @classmethod
+    def _mime_to_type(cls, mime_type: str, name: str) -> Optional[str]:
+        """Map a mime type and file name to a supported file type, or None."""
+        return (
+            cls._MIME_TO_TYPE.get(mime_type)
+            or cls._EXT_TO_TYPE.get(file_extension(name))
+        )
+    
+    async def _get_file_type(self, file_id: str) -> str:
         """Get file type from file ID or metadata."""
         try:
-            metadata = self._get_file_metadata(file_id)
+            metadata = await self._cached_metadata(file_id)
             mime_type = metadata.get("mime_type", "")
-            
-            if mime_type == "text/csv":
-                return "csv"
-            elif mime_type in [
-                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                "application/vnd.ms-excel"
-            ]:
-                return "xlsx"
-            elif mime_type == "application/json":
-                return "json"
-            else:
-                # Try to infer from file extension
-                ext = os.path.splitext(metadata["name"])[1].lower()
-                if ext == ".csv":
-                    return "csv"
-                elif ext in [".xlsx", ".xls"]:
-                    return "xlsx"
-                elif ext == ".json":
-                    return "json"
-                else:
-                    raise ValueError(f"Unsupported file type: {mime_type}")
+            file_type = self._mime_to_type(mime_type, metadata["name"])
+            if file_type is None:
+                raise ValueError(f"Unsupported file type: {mime_type}")
+            return file_type
         except Exception as e:
             self.logger.error(f"Failed to get file type: {str(e)}")
-            raise ValueError(f"Failed to get file type: {str(e)}") 
\ No newline at end of file
+            raise ValueError(f"Failed to get file type: {str(e)}")
\ No newline at end of file
@@ -3,103 +3,153 @@ ScrollIntel v2: The Flame Interpreter
 Google Drive integration client
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Iterator
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaIoBaseDownload
+from googleapiclient.http import MediaIoBaseDownload, HttpRequest
+from google_auth_httplib2 import AuthorizedHttp
+import httplib2
 import os
-import pickle
 import io
+import asyncio
+import aiohttp
+import threading
+import functools
 from datetime import datetime
 import pytz
 
-from .cloud_storage_client import CloudStorageClient
+from .google_auth import get_google_credentials
+from .cloud_storage_client import CloudStorageClient, DOWNLOAD_CHUNK_BYTES
 
 class DriveClient(CloudStorageClient):
     """Google Drive integration client."""
     
     SCOPES = ['https://www.googleapis.com/auth/drive.readonly']
-    TOKEN_PATH = 'credentials/drive_token.pickle'
+    TOKEN_PATH = 'credentials/drive_token.json'
     CREDENTIALS_PATH = 'credentials/drive_credentials.json'
+    FILES_URL = "https://www.googleapis.com/drive/v3/files"
+    
+    # Shared across instances so keep-alive connections survive the
+    # per-request clients built by the API dependencies.
+    _session: Optional[aiohttp.ClientSession] = None
+    
+    # Static part of every files.list query
+    _MIME_CLAUSE = "(" + " or ".join(
+        f"mimeType='{mime}'" for mime in sorted(CloudStorageClient.SUPPORTED_MIMETYPES)
+    ) + ")"
     
     def __init__(self, credentials: Dict[str, Any]):
         """Initialize Google Drive client with OAuth2 credentials."""
         super().__init__(credentials)
         self.credentials = self._get_credentials()
         self.service = build('drive', 'v3', credentials=self.credentials)
+        self._local = threading.local()
         self._log_integration("initialize", {"status": "success"})
     
     def _get_credentials(self) -> Credentials:
         """Get or refresh OAuth2 credentials."""
-        creds = None
-        
-        # Create credentials directory if it doesn't exist
-        os.makedirs('credentials', exist_ok=True)
-        
-        # Load existing token
-        if os.path.exists(self.TOKEN_PATH):
-            with open(self.TOKEN_PATH, 'rb') as token:
-                creds = pickle.load(token)
-        
-        # Refresh or create new credentials
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-            else:
-                if not os.path.exists(self.CREDENTIALS_PATH):
-                    raise ValueError(
-                        f"Google Drive credentials file not found at {self.CREDENTIALS_PATH}. "
-                        "Please download from Google Cloud Console."
-                    )
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    self.CREDENTIALS_PATH, self.SCOPES
-                )
-                creds = flow.run_local_server(port=0)
-            
-            # Save credentials
-            with open(self.TOKEN_PATH, 'wb') as token:
-                pickle.dump(creds, token)
-        
-        return creds
+        return get_google_credentials(
+            "Google Drive", self.TOKEN_PATH, self.CREDENTIALS_PATH, self.SCOPES
+        )
+    
+    @functools.cached_property
+    def _cache_scope(self) -> int:
+        """Identify the Google account; credentials here are an OAuth2 object."""
+        return hash((self.__class__.__name__, self.credentials.client_id, self.credentials.refresh_token))
+    
+    def _thread_http(self) -> AuthorizedHttp:
+        """Authorized transport for the calling thread; httplib2 is not thread-safe."""
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = self._local.http = AuthorizedHttp(self.credentials, http=httplib2.Http())
+        return http
+    
+    def _execute(self, request: HttpRequest) -> Dict[str, Any]:
+        """Execute a Drive API request on the calling thread's transport."""
+        return request.execute(http=self._thread_http())
+    
+    @classmethod
+    def _get_session(cls) -> aiohttp.ClientSession:
+        """Return the pooled HTTP session, creating it inside the running loop."""
+        if cls._session is None or cls._session.closed:
+            cls._session = aiohttp.ClientSession()
+        return cls._session
+    
+    @classmethod
+    async def close(cls):
+        """Close the pooled HTTP session."""
+        if cls._session is not None and not cls._session.closed:
+            await cls._session.close()
+        cls._session = None
     
     async def _download_file(self, file_id: str) -> bytes:
         """Download file content from Google Drive."""
         try:
-            request = self.service.files().get_media(fileId=file_id)
-            file = io.BytesIO()
-            downloader = MediaIoBaseDownload(file, request)
-            done = False
-            
-            while not done:
-                status, done = downloader.next_chunk()
+            if not self.credentials.valid:
+                await asyncio.to_thread(self.credentials.refresh, Request())
             
-            return file.getvalue()
+            url = f"{self.FILES_URL}/{file_id}"
+            for attempt in range(2):
+                headers = {"Authorization": f"Bearer {self.credentials.token}"}
+                async with self._get_session().get(
+                    url, headers=headers, params={"alt": "media"}
+                ) as response:
+                    # Refresh a token that expired since it was loaded, then retry once
+                    if response.status == 401 and attempt == 0:
+                        await asyncio.to_thread(self.credentials.refresh, Request())
+                        continue
+                    response.raise_for_status()
+                    
+                    file = io.BytesIO()
+                    async for chunk in response.content.iter_chunked(1 << 20):
+                        file.write(chunk)
+                    return file.getvalue()
         except Exception as e:
             self.logger.error(f"Failed to download file: {str(e)}")
             raise ValueError(f"Failed to download file: {str(e)}")
     
+    def _iter_file_bytes(
+        self,
+        file_id: str,
+        chunk_bytes: int = DOWNLOAD_CHUNK_BYTES
+    ) -> Iterator[bytes]:
+        """Yield file content from Google Drive one download chunk at a time."""
+        request = self.service.files().get_media(fileId=file_id)
+        request.http = self._thread_http()
+        buffer = io.BytesIO()
+        downloader = MediaIoBaseDownload(buffer, request, chunksize=chunk_bytes)
+        done = False
+        
+        while not done:
+            _, done = downloader.next_chunk()
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    
     async def _list_files(self, folder_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """List files in Google Drive folder."""
         try:
             # Build query
-            query = "trashed = false"
+            query = f"trashed = false and {self._MIME_CLAUSE}"
             if folder_id:
                 query += f" and '{folder_id}' in parents"
             
-            # Add mime type filters
-            mime_types = " or ".join([f"mimeType='{mime}'" for mime in self.SUPPORTED_MIMETYPES])
-            query += f" and ({mime_types})"
-            
-            # List files
-            results = self.service.files().list(
-                q=query,
-                spaces='drive',
-                fields="files(id, name, mimeType, size, createdTime, modifiedTime)"
-            ).execute()
-            
-            files = results.get('files', [])
+            # List files, following pagination
+            files = []
+            page_token = None
+            while True:
+                results = await asyncio.to_thread(self._execute, self.service.files().list(
+                    q=query,
+                    spaces='drive',
+                    pageSize=1000,
+                    fields="nextPageToken, files(id, name, mimeType, size, createdTime, modifiedTime)",
+                    pageToken=page_token
+                ))
+                files.extend(results.get('files', []))
+                page_token = results.get('nextPageToken')
+                if not page_token:
+                    break
             
             # Format file metadata
             return [{
@@ -117,10 +167,10 @@ class DriveClient(CloudStorageClient):
     async def _get_file_metadata(self, file_id: str) -> Dict[str, Any]:
         """Get file metadata from Google Drive."""
         try:
-            file = self.service.files().get(
+            file = await asyncio.to_thread(self._execute, self.service.files().get(
                 fileId=file_id,
                 fields="id, name, mimeType, size, createdTime, modifiedTime"
-            ).execute()
+            ))
             
             return {
                 "id": file["id"],
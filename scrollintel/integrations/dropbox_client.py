@@ -3,17 +3,30 @@ ScrollIntel v2: The Flame Interpreter
 Dropbox integration client
 """
 
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Union, Iterator
 import dropbox
 from dropbox.files import FileMetadata, FolderMetadata
 import pandas as pd
-import json
+import pyarrow as pa
+import orjson
 import io
+import asyncio
 from datetime import datetime
 import pytz
 import os
 
 from .base import BaseIntegration
+from .cloud_storage_client import (
+    DOWNLOAD_CHUNK_BYTES,
+    excel_bytes,
+    file_extension,
+    parse_csv_stream,
+    parse_excel_in_pool,
+    stream_records
+)
+
+# Uploads larger than this go through an upload session in chunks of this size
+UPLOAD_CHUNK_BYTES = 8 << 20
 
 class DropboxClient(BaseIntegration):
     """Dropbox integration client."""
@@ -31,25 +44,56 @@ class DropboxClient(BaseIntegration):
         file_type: Optional[str] = None,
         **kwargs
     ) -> Union[pd.DataFrame, Dict[str, Any]]:
-        """Read file from Dropbox."""
+        """Read file from Dropbox.
+        
+        Pass ``chunksize`` to stream CSV files as an async iterator of
+        DataFrames, or JSON files as an async iterator of the items under
+        ``json_prefix`` (default ``"item"``), without holding the whole file
+        in memory. Downloading and parsing happen in worker threads.
+        Pass ``return_arrow=True`` to get CSV files as a ``pyarrow.Table``.
+        """
         try:
-            # Download file
-            _, response = self.client.files_download(path)
-            
             # Determine file type if not provided
             if not file_type:
-                file_type = os.path.splitext(path)[1].lower()
+                file_type = f".{file_extension(path)}"
             
-            # Read file based on type
-            if file_type == ".csv":
-                data = pd.read_csv(io.BytesIO(response.content))
-            elif file_type == ".xlsx":
-                data = pd.read_excel(io.BytesIO(response.content))
-            elif file_type == ".json":
-                data = json.loads(response.content)
-            else:
+            chunksize = kwargs.get("chunksize")
+            if chunksize and file_type in (".csv", ".json"):
+                data = stream_records(
+                    self._iter_file_bytes(path),
+                    file_type == ".csv",
+                    chunksize,
+                    kwargs.get("json_prefix", "item")
+                )
+                
+                self._log_integration(
+                    "fetch_data",
+                    {
+                        "path": path,
+                        "file_type": file_type,
+                        "chunksize": chunksize
+                    }
+                )
+                
+                return data
+            
+            if file_type not in (".csv", ".xlsx", ".json"):
                 raise ValueError(f"Unsupported file type: {file_type}")
             
+            # Download and read file
+            _, response = await asyncio.to_thread(self.client.files_download, path)
+            if file_type == ".xlsx":
+                # Workbooks are zip archives, so the whole body is needed
+                content = await asyncio.to_thread(lambda: response.content)
+                data = await parse_excel_in_pool(content)
+            else:
+                data = await asyncio.to_thread(
+                    self._read_download,
+                    response,
+                    file_type,
+                    kwargs.get("return_arrow", False)
+                )
+            
             self._log_integration(
                 "fetch_data",
                 {
@@ -64,6 +108,29 @@ class DropboxClient(BaseIntegration):
             self.logger.error(f"Failed to read Dropbox file: {str(e)}")
             raise ValueError(f"Failed to read Dropbox file: {str(e)}")
     
+    def _read_download(
+        self,
+        response,
+        file_type: str,
+        as_arrow: bool = False
+    ) -> Union[pd.DataFrame, pa.Table, Dict[str, Any]]:
+        """Decode a download; CSV is parsed straight off the socket."""
+        with response:
+            if file_type == ".csv":
+                response.raw.decode_content = True
+                return parse_csv_stream(response.raw, as_arrow)
+            return orjson.loads(response.content)
+    
+    def _iter_file_bytes(
+        self,
+        path: str,
+        chunk_bytes: int = DOWNLOAD_CHUNK_BYTES
+    ) -> Iterator[bytes]:
+        """Yield file content from Dropbox as it arrives."""
+        _, response = self.client.files_download(path)
+        with response:
+            yield from response.iter_content(chunk_size=chunk_bytes)
+    
     async def list_resources(
         self,
         path: str = "/ScrollIntel",
@@ -78,7 +145,7 @@ class DropboxClient(BaseIntegration):
             result = []
             
             # List files in folder
-            response = self.client.files_list_folder(path)
+            response = await asyncio.to_thread(self.client.files_list_folder, path)
             
             for entry in response.entries:
                 if isinstance(entry, FileMetadata):
@@ -119,7 +186,7 @@ class DropboxClient(BaseIntegration):
     ) -> Dict[str, Any]:
         """Get information about a Dropbox file or folder."""
         try:
-            metadata = self.client.files_get_metadata(path)
+            metadata = await asyncio.to_thread(self.client.files_get_metadata, path)
             
             info = {
                 "name": metadata.name,
@@ -153,27 +220,24 @@ class DropboxClient(BaseIntegration):
             # Convert data to bytes
             if isinstance(data, pd.DataFrame):
                 if file_type == ".csv":
-                    content = data.to_csv(index=False).encode()
-                elif file_type == ".xlsx":
                     buffer = io.BytesIO()
-                    data.to_excel(buffer, index=False)
+                    data.to_csv(buffer, index=False)
                     content = buffer.getvalue()
+                elif file_type == ".xlsx":
+                    # Not constant_memory: to_excel writes column by column, which that mode drops
+                    content = excel_bytes(data)
                 else:
                     raise ValueError(f"Unsupported file type for DataFrame: {file_type}")
             elif isinstance(data, dict):
                 if file_type == ".json":
-                    content = json.dumps(data).encode()
+                    content = orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
                 else:
                     raise ValueError(f"Unsupported file type for dict: {file_type}")
             else:
                 raise ValueError("Unsupported data type")
             
             # Upload file
-            response = self.client.files_upload(
-                content,
-                path,
-                mode=dropbox.files.WriteMode.overwrite
-            )
+            response = await asyncio.to_thread(self._upload_content, content, path)
             
             result = {
                 "name": response.name,
@@ -196,6 +260,29 @@ class DropboxClient(BaseIntegration):
             self.logger.error(f"Failed to upload file to Dropbox: {str(e)}")
             raise ValueError(f"Failed to upload file to Dropbox: {str(e)}")
     
+    def _upload_content(self, content: bytes, path: str) -> FileMetadata:
+        """Upload bytes, using an upload session for anything over one chunk."""
+        mode = dropbox.files.WriteMode.overwrite
+        if len(content) <= UPLOAD_CHUNK_BYTES:
+            return self.client.files_upload(content, path, mode=mode)
+        
+        view = memoryview(content)
+        session = self.client.files_upload_session_start(bytes(view[:UPLOAD_CHUNK_BYTES]))
+        cursor = dropbox.files.UploadSessionCursor(
+            session_id=session.session_id,
+            offset=UPLOAD_CHUNK_BYTES
+        )
+        while len(content) - cursor.offset > UPLOAD_CHUNK_BYTES:
+            end = cursor.offset + UPLOAD_CHUNK_BYTES
+            self.client.files_upload_session_append_v2(bytes(view[cursor.offset:end]), cursor)
+            cursor.offset = end
+        
+        return self.client.files_upload_session_finish(
+            bytes(view[cursor.offset:]),
+            cursor,
+            dropbox.files.CommitInfo(path=path, mode=mode)
+        )
+    
     def validate_credentials(self) -> bool:
         """Validate Dropbox credentials."""
         try:
@@ -3,10 +3,8 @@ ScrollIntel v2: The Flame Interpreter
 Google Analytics 4 integration client
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, AsyncIterator
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
 from google.analytics.data_v1beta import BetaAnalyticsDataClient
 from google.analytics.data_v1beta.types import (
     RunReportRequest,
@@ -16,18 +14,33 @@ from google.analytics.data_v1beta.types import (
 )
 import os
 import json
-import pickle
+import asyncio
 from datetime import datetime, timedelta
 import pytz
+import numpy as np
 import pandas as pd
 
+from .google_auth import get_google_credentials
 from .base import BaseIntegration
 
+# Metrics and dimensions reported when the caller does not choose any
+DEFAULT_METRICS = [
+    "totalUsers",
+    "sessions",
+    "conversions",
+    "averageSessionDuration",
+    "bounceRate"
+]
+DEFAULT_DIMENSIONS = ["date"]
+
+# Rows requested per report page; the Data API allows up to 250,000
+REPORT_PAGE_SIZE = 100_000
+
 class GA4Client(BaseIntegration):
     """Google Analytics 4 integration client."""
     
     SCOPES = ['https://www.googleapis.com/auth/analytics.readonly']
-    TOKEN_PATH = 'credentials/ga4_token.pickle'
+    TOKEN_PATH = 'credentials/ga4_token.json'
     CREDENTIALS_PATH = 'credentials/ga4_credentials.json'
     
     def __init__(self, credentials: Dict[str, Any]):
@@ -39,36 +52,82 @@ class GA4Client(BaseIntegration):
     
     def _get_credentials(self) -> Credentials:
         """Get or refresh OAuth2 credentials."""
-        creds = None
-        
-        # Create credentials directory if it doesn't exist
-        os.makedirs('credentials', exist_ok=True)
+        return get_google_credentials(
+            "GA4", self.TOKEN_PATH, self.CREDENTIALS_PATH, self.SCOPES
+        )
+    
+    def _report_request(
+        self,
+        property_id: str,
+        date_range: Optional[Dict[str, str]],
+        metrics: Optional[List[str]],
+        dimensions: Optional[List[str]]
+    ) -> RunReportRequest:
+        """Build a report request, filling in the default date range, metrics and dimensions."""
+        # Set default date range if not provided
+        if not date_range:
+            end_date = datetime.now(pytz.UTC)
+            start_date = end_date - timedelta(days=30)
+            date_range = {
+                "start_date": start_date.strftime("%Y-%m-%d"),
+                "end_date": end_date.strftime("%Y-%m-%d")
+            }
         
-        # Load existing token
-        if os.path.exists(self.TOKEN_PATH):
-            with open(self.TOKEN_PATH, 'rb') as token:
-                creds = pickle.load(token)
+        return RunReportRequest(
+            property=f"properties/{property_id}",
+            date_ranges=[DateRange(
+                start_date=date_range["start_date"],
+                end_date=date_range["end_date"]
+            )],
+            metrics=[Metric(name=metric) for metric in metrics or DEFAULT_METRICS],
+            dimensions=[Dimension(name=dim) for dim in dimensions or DEFAULT_DIMENSIONS]
+        )
+    
+    async def _iter_pages(
+        self,
+        request: RunReportRequest,
+        page_size: int
+    ) -> AsyncIterator[Dict[str, List[Any]]]:
+        """Run a report page by page, yielding each page as columns keyed by name."""
+        dimensions = [dimension.name for dimension in request.dimensions]
+        metrics = [metric.name for metric in request.metrics]
+        offset = 0
         
-        # Refresh or create new credentials
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-            else:
-                if not os.path.exists(self.CREDENTIALS_PATH):
-                    raise ValueError(
-                        f"GA4 credentials file not found at {self.CREDENTIALS_PATH}. "
-                        "Please download from Google Cloud Console."
-                    )
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    self.CREDENTIALS_PATH, self.SCOPES
-                )
-                creds = flow.run_local_server(port=0)
+        while True:
+            request.limit = page_size
+            request.offset = offset
+            response = await asyncio.to_thread(self.client.run_report, request)
+            rows = response.rows
+            if not rows:
+                return
             
-            # Save credentials
-            with open(self.TOKEN_PATH, 'wb') as token:
-                pickle.dump(creds, token)
-        
-        return creds
+            # Extract values column by column; NumPy parses the metric strings in bulk
+            columns = {}
+            for i, dimension in enumerate(dimensions):
+                columns[dimension] = [row.dimension_values[i].value for row in rows]
+            for i, metric in enumerate(metrics):
+                columns[metric] = np.array(
+                    [row.metric_values[i].value for row in rows],
+                    dtype=np.float64
+                ).tolist()
+            yield columns
+            
+            offset += len(rows)
+            if offset >= response.row_count:
+                return
+    
+    async def iter_report(
+        self,
+        property_id: str,
+        date_range: Optional[Dict[str, str]] = None,
+        metrics: Optional[List[str]] = None,
+        dimensions: Optional[List[str]] = None,
+        page_size: int = REPORT_PAGE_SIZE
+    ) -> AsyncIterator[pd.DataFrame]:
+        """Yield a GA4 report as one DataFrame per page of rows."""
+        request = self._report_request(property_id, date_range, metrics, dimensions)
+        async for columns in self._iter_pages(request, page_size):
+            yield pd.DataFrame(columns)
     
     async def fetch_data(
         self,
@@ -80,42 +139,13 @@ class GA4Client(BaseIntegration):
     ) -> Dict[str, Any]:
         """Fetch metrics from GA4 property."""
         try:
-            # Set default date range if not provided
-            if not date_range:
-                end_date = datetime.now(pytz.UTC)
-                start_date = end_date - timedelta(days=30)
-                date_range = {
-                    "start_date": start_date.strftime("%Y-%m-%d"),
-                    "end_date": end_date.strftime("%Y-%m-%d")
-                }
-            
-            # Set default metrics if not provided
-            if not metrics:
-                metrics = [
-                    "totalUsers",
-                    "sessions",
-                    "conversions",
-                    "averageSessionDuration",
-                    "bounceRate"
-                ]
-            
-            # Set default dimensions if not provided
-            if not dimensions:
-                dimensions = ["date"]
-            
-            # Create request
-            request = RunReportRequest(
-                property=f"properties/{property_id}",
-                date_ranges=[DateRange(
-                    start_date=date_range["start_date"],
-                    end_date=date_range["end_date"]
-                )],
-                metrics=[Metric(name=metric) for metric in metrics],
-                dimensions=[Dimension(name=dim) for dim in dimensions]
-            )
-            
-            # Run report
-            response = self.client.run_report(request)
+            request = self._report_request(property_id, date_range, metrics, dimensions)
+            date_range = {
+                "start_date": request.date_ranges[0].start_date,
+                "end_date": request.date_ranges[0].end_date
+            }
+            metrics = metrics or list(DEFAULT_METRICS)
+            dimensions = dimensions or list(DEFAULT_DIMENSIONS)
             
             # Process response
             result = {
@@ -125,17 +155,11 @@ class GA4Client(BaseIntegration):
                 "timestamp": datetime.now(pytz.UTC).isoformat()
             }
             
-            # Extract metric values
-            for row in response.rows:
-                for i, dimension in enumerate(dimensions):
-                    if dimension not in result["metrics"]:
-                        result["metrics"][dimension] = []
-                    result["metrics"][dimension].append(row.dimension_values[i].value)
-                
-                for i, metric in enumerate(metrics):
-                    if metric not in result["metrics"]:
-                        result["metrics"][metric] = []
-                    result["metrics"][metric].append(float(row.metric_values[i].value))
+            # Run report, collecting every page
+            page_size = kwargs.get("page_size", REPORT_PAGE_SIZE)
+            async for columns in self._iter_pages(request, page_size):
+                for name, values in columns.items():
+                    result["metrics"].setdefault(name, []).extend(values)
             
             self._log_integration(
                 "fetch_data",
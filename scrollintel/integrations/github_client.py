@@ -4,7 +4,9 @@ Handles repository operations and file pushes
 """
 
 import os
-from typing import Dict, Any, Optional, List
+import asyncio
+import functools
+from typing import Dict, Any, Optional, List, Union
 from datetime import datetime
 import pytz
 import base64
@@ -12,6 +14,7 @@ import logging
 from github import Github, GithubException
 from github.Repository import Repository
 from github.ContentFile import ContentFile
+from github.InputGitTreeElement import InputGitTreeElement
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -25,7 +28,11 @@ class GitHubClient:
             raise ValueError("GitHub token is required")
         
         self.github = Github(self.token)
-        self.user = self.github.get_user()
+    
+    @functools.cached_property
+    def user(self):
+        """Authenticated user, fetched on first use."""
+        return self.github.get_user()
 
     async def create_repository(
         self,
@@ -66,7 +73,7 @@ class GitHubClient:
     async def push_files(
         self,
         repo_name: str,
-        files: Dict[str, str],
+        files: Dict[str, Union[str, bytes]],
         commit_message: Optional[str] = None,
         branch: str = "main"
     ) -> str:
@@ -75,7 +82,7 @@ class GitHubClient:
         
         Args:
             repo_name: Name of the repository
-            files: Dictionary of file paths and their contents
+            files: Dictionary of file paths and their contents (bytes for binary files)
             commit_message: Custom commit message
             branch: Target branch name
             
@@ -94,50 +101,44 @@ class GitHubClient:
             # Add ScrollSeal to commit message
             commit_message = f"{commit_message}\n\n🔥 ScrollSeal: {timestamp}"
             
-            # Get current branch
+            # Resolve the branch head, creating the branch if it doesn't exist
             try:
-                branch_ref = repo.get_branch(branch)
+                ref = repo.get_git_ref(f"heads/{branch}")
             except GithubException:
-                # Create branch if it doesn't exist
-                default_branch = repo.default_branch
-                default_branch_ref = repo.get_branch(default_branch)
-                repo.create_git_ref(
+                default_ref = repo.get_git_ref(f"heads/{repo.default_branch}")
+                ref = repo.create_git_ref(
                     ref=f"refs/heads/{branch}",
-                    sha=default_branch_ref.commit.sha
+                    sha=default_ref.object.sha
                 )
+            base_commit = repo.get_git_commit(ref.object.sha)
             
-            # Create or update files
-            for file_path, content in files.items():
-                try:
-                    # Check if file exists
-                    repo.get_contents(file_path, ref=branch)
-                    # Update existing file
-                    repo.update_file(
-                        path=file_path,
-                        message=commit_message,
-                        content=content,
-                        branch=branch
-                    )
-                except GithubException:
-                    # Create new file
-                    repo.create_file(
-                        path=file_path,
-                        message=commit_message,
-                        content=content,
-                        branch=branch
-                    )
-            
-            # Get the latest commit
-            commits = repo.get_commits(branch=branch)
-            latest_commit = commits[0]
+            # Upload all blobs concurrently, then write a single tree and commit
+            blobs = await asyncio.gather(*(
+                asyncio.to_thread(self._create_blob, repo, content)
+                for content in files.values()
+            ))
+            elements = [
+                InputGitTreeElement(file_path, "100644", "blob", sha=blob.sha)
+                for file_path, blob in zip(files, blobs)
+            ]
+            tree = repo.create_git_tree(elements, base_tree=base_commit.tree)
+            commit = repo.create_git_commit(commit_message, tree, [base_commit])
+            ref.edit(commit.sha)
             
             logger.info(f"Successfully pushed files to {repo_name}")
-            return latest_commit.html_url
+            return commit.html_url
             
         except GithubException as e:
             logger.error(f"Failed to push files: {e}")
             raise
 
+    @staticmethod
+    def _create_blob(repo: Repository, content: Union[str, bytes]):
+        """Upload one blob; binary content is base64-encoded here, off the event loop."""
+        if isinstance(content, bytes):
+            return repo.create_git_blob(base64.b64encode(content).decode("ascii"), "base64")
+        return repo.create_git_blob(content, "utf-8")
+
     async def push_session(
         self,
         repo_name: str,
@@ -159,7 +160,7 @@ class GitHubClient:
             # Prepare files
             files = {
                 "flame_output.csv": session_data["csv_content"],
-                "scroll_report.pdf": base64.b64encode(session_data["pdf_content"]).decode(),
+                "scroll_report.pdf": session_data["pdf_content"],
                 "README.md": f"""# ScrollIntel Flame Report
 
 ## Domain: {session_data['domain']}
@@ -186,5 +187,8 @@ class GitHubClient:
             logger.error(f"Failed to push session: {e}")
             raise
 
-# Create global instance
-github_client = GitHubClient() 
\ No newline at end of file
+@functools.lru_cache(maxsize=None)
+def get_github_client() -> GitHubClient:
+    """Return the shared GitHub client, creating it on first use."""
+    return GitHubClient()
+ 
\ No newline at end of file
@@ -0,0 +1,67 @@
+"""
+ScrollIntel v2: The Flame Interpreter
+OAuth2 token handling shared by the Google integrations
+"""
+
+from typing import List, Tuple
+from google.oauth2.credentials import Credentials
+from google_auth_oauthlib.flow import InstalledAppFlow
+from google.auth.transport.requests import Request
+import functools
+import json
+import os
+
+@functools.lru_cache(maxsize=16)
+def _load_token(path: str, mtime: float, scopes: Tuple[str, ...]) -> Credentials:
+    """Parse a stored token; keyed on mtime so a rewritten file is re-read."""
+    with open(path) as f:
+        info = json.load(f)
+    
+    # A token granted before a scope was added can't be refreshed into it; re-consent instead
+    granted = info.get("scopes")
+    if isinstance(granted, str):
+        granted = granted.split()
+    if granted and not set(scopes) <= set(granted):
+        raise ValueError(f"Stored token lacks scopes: {sorted(set(scopes) - set(granted))}")
+    return Credentials.from_authorized_user_info(info, list(scopes))
+
+def get_google_credentials(
+    service_name: str,
+    token_path: str,
+    credentials_path: str,
+    scopes: List[str]
+) -> Credentials:
+    """Load, refresh or create OAuth2 credentials for a Google service."""
+    creds = None
+
+    # Create credentials directory if it doesn't exist
+    os.makedirs(os.path.dirname(token_path) or ".", exist_ok=True)
+
+    # Load existing token
+    if os.path.exists(token_path):
+        try:
+            creds = _load_token(token_path, os.path.getmtime(token_path), tuple(scopes))
+        except ValueError:
+            # Malformed or under-scoped token file; fall through to a fresh authorization
+            creds = None
+
+    # Refresh or create new credentials
+    if not creds or not creds.valid:
+        if creds and creds.expired and creds.refresh_token:
+            creds.refresh(Request())
+        else:
+            if not os.path.exists(credentials_path):
+                raise ValueError(
+                    f"{service_name} credentials file not found at {credentials_path}. "
+                    "Please download from Google Cloud Console."
+                )
+            flow = InstalledAppFlow.from_client_secrets_file(
+                credentials_path, scopes
+            )
+            creds = flow.run_local_server(port=0)
+
+        # Save credentials
+        with open(token_path, 'w') as token:
+            token.write(creds.to_json())
+
+    return creds
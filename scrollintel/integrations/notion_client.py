@@ -3,21 +3,58 @@ ScrollIntel v2: The Flame Interpreter
 Notion integration client
 """
 
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Union, Tuple, Callable
 import pandas as pd
 from datetime import datetime
 import pytz
 import os
 import json
-import requests
+import asyncio
+import httpx
+import orjson
 
-from .base import BaseIntegration
+from .base import BaseIntegration, ttl_cache
+
+def _first_plain_text(items: List[Dict[str, Any]]) -> Optional[str]:
+    return items[0]["plain_text"] if items else None
+
+def _names(items: List[Dict[str, Any]]) -> List[str]:
+    return [item["name"] for item in items]
+
+def _parse_none(value: Dict[str, Any]) -> None:
+    return None
+
+# Property value parsers keyed by Notion property type
+_PARSERS = {
+    "title": lambda value: _first_plain_text(value["title"]),
+    "rich_text": lambda value: _first_plain_text(value["rich_text"]),
+    "number": lambda value: value["number"],
+    "select": lambda value: value["select"]["name"] if value["select"] else None,
+    "multi_select": lambda value: _names(value["multi_select"]),
+    "date": lambda value: value["date"]["start"] if value["date"] else None,
+    "people": lambda value: _names(value["people"]),
+    "files": lambda value: _names(value["files"]),
+    "checkbox": lambda value: value["checkbox"],
+    "url": lambda value: value["url"],
+    "email": lambda value: value["email"],
+    "phone_number": lambda value: value["phone_number"]
+}
 
 class NotionClient(BaseIntegration):
     """Notion integration client."""
     
     BASE_URL = "https://api.notion.com/v1"
     
+    # Shared across instances so the HTTP/2 connection to api.notion.com is
+    # reused by the per-request clients built by the API dependencies.
+    _http: Optional[httpx.AsyncClient] = None
+    
+    # Notion allows an average of three requests/second per integration
+    _requests = asyncio.Semaphore(3)
+    
+    # Page attributes carried into every fetched row
+    _PAGE_FIELDS = ("id", "created_time", "last_edited_time")
+    
     def __init__(self, credentials: Dict[str, Any]):
         """Initialize Notion client with credentials."""
         super().__init__(credentials)
@@ -29,6 +66,47 @@ class NotionClient(BaseIntegration):
         }
         self._log_integration("initialize", {"status": "success"})
     
+    @classmethod
+    def _get_http(cls) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use."""
+        if cls._http is None or cls._http.is_closed:
+            cls._http = httpx.AsyncClient(
+                http2=True,
+                timeout=30,
+                limits=httpx.Limits(max_keepalive_connections=32)
+            )
+        return cls._http
+    
+    @classmethod
+    async def close(cls):
+        """Close the pooled HTTP client."""
+        if cls._http is not None and not cls._http.is_closed:
+            await cls._http.aclose()
+        cls._http = None
+    
+    async def _query(self, url: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        """POST a database query and decode the JSON body."""
+        async with self._requests:
+            response = await self._get_http().post(url, headers=self.headers, content=orjson.dumps(body))
+            response.raise_for_status()
+            return orjson.loads(response.content)
+    
+    async def _schema_parsers(
+        self,
+        schema_task: "asyncio.Future[Dict[str, Any]]",
+        properties: Dict[str, Any]
+    ) -> List[Tuple[str, Callable[[Dict[str, Any]], Any]]]:
+        """Resolve one parser per property from the cached database schema."""
+        try:
+            info = await schema_task
+            schema = {prop["name"]: prop["type"] for prop in info["properties"]}
+        except ValueError:
+            schema = {}
+        if schema.keys() != properties.keys():
+            # Schema changed since it was cached (or is unavailable); use the page
+            schema = {key: value["type"] for key, value in properties.items()}
+        return [(key, _PARSERS.get(prop_type, _parse_none)) for key, prop_type in schema.items()]
+    
     async def fetch_data(
         self,
         database_id: str,
@@ -42,35 +120,51 @@ class NotionClient(BaseIntegration):
             # Build URL
             url = f"{self.BASE_URL}/databases/{database_id}/query"
             
-            # Build request body
+            # Build request body; Notion caps each page at 100 results
             body = {
-                "page_size": page_size
+                "page_size": min(page_size or 100, 100)
             }
             if filter_by:
                 body["filter"] = filter_by
             if sorts:
                 body["sorts"] = sorts
             
-            # Make request
-            response = requests.post(url, headers=self.headers, json=body)
-            response.raise_for_status()
-            
-            # Parse response
-            data = response.json()
-            results = data.get("results", [])
-            
-            # Convert to DataFrame
-            rows = []
-            for page in results:
-                row = {}
-                for key, value in page["properties"].items():
-                    row[key] = self._parse_property_value(value)
-                row["id"] = page["id"]
-                row["created_time"] = page["created_time"]
-                row["last_edited_time"] = page["last_edited_time"]
-                rows.append(row)
+            # Follow next_cursor, requesting page N+1 before parsing page N
+            parsers = None
+            columns: Dict[str, List[Any]] = {}
+            pending = asyncio.ensure_future(self._query(url, body))
+            schema_task = asyncio.ensure_future(self.get_resource_info(database_id))
+            # An empty query never awaits the schema; don't warn about its error
+            schema_task.add_done_callback(lambda task: task.cancelled() or task.exception())
+            try:
+                while pending is not None:
+                    data = await pending
+                    pending = None
+                    if data.get("has_more"):
+                        pending = asyncio.ensure_future(
+                            self._query(url, {**body, "start_cursor": data["next_cursor"]})
+                        )
+                    
+                    results = data.get("results", [])
+                    if parsers is None and results:
+                        # Every page shares the database schema, so resolve parsers once
+                        parsers = await self._schema_parsers(
+                            schema_task, results[0]["properties"]
+                        )
+                        columns = {**{key: [] for key, _ in parsers}, **columns}
+                    
+                    # Extend column-oriented lists; pandas gets a dict of columns
+                    for key, parse in parsers or ():
+                        columns[key].extend(parse(page["properties"][key]) for page in results)
+                    for key in self._PAGE_FIELDS:
+                        columns.setdefault(key, []).extend(page[key] for page in results)
+            finally:
+                if pending is not None:
+                    pending.cancel()
+                if not schema_task.done():
+                    schema_task.cancel()
             
-            df = pd.DataFrame(rows)
+            df = pd.DataFrame(columns)
             
             self._log_integration(
                 "fetch_data",
@@ -88,6 +182,7 @@ class NotionClient(BaseIntegration):
             self.logger.error(f"Failed to fetch Notion data: {str(e)}")
             raise ValueError(f"Failed to fetch Notion data: {str(e)}")
     
+    @ttl_cache(seconds=300)
     async def list_resources(
         self,
         **kwargs
@@ -103,11 +198,11 @@ class NotionClient(BaseIntegration):
                 }
             }
             
-            response = requests.post(url, headers=self.headers, json=body)
+            response = await self._get_http().post(url, headers=self.headers, content=orjson.dumps(body))
             response.raise_for_status()
             
             # Parse response
-            data = response.json()
+            data = orjson.loads(response.content)
             results = data.get("results", [])
             
             # Format database info
@@ -131,6 +226,7 @@ class NotionClient(BaseIntegration):
             self.logger.error(f"Failed to list Notion databases: {str(e)}")
             raise ValueError(f"Failed to list Notion databases: {str(e)}")
     
+    @ttl_cache(seconds=300)
     async def get_resource_info(
         self,
         database_id: str,
@@ -140,11 +236,11 @@ class NotionClient(BaseIntegration):
         try:
             # Get database metadata
             url = f"{self.BASE_URL}/databases/{database_id}"
-            response = requests.get(url, headers=self.headers)
+            response = await self._get_http().get(url, headers=self.headers)
             response.raise_for_status()
             
             # Parse response
-            db = response.json()
+            db = orjson.loads(response.content)
             
             info = {
                 "id": db["id"],
@@ -174,34 +270,7 @@ class NotionClient(BaseIntegration):
     
     def _parse_property_value(self, property_value: Dict[str, Any]) -> Any:
         """Parse Notion property value based on type."""
-        prop_type = property_value["type"]
-        
-        if prop_type == "title":
-            return property_value["title"][0]["plain_text"] if property_value["title"] else None
-        elif prop_type == "rich_text":
-            return property_value["rich_text"][0]["plain_text"] if property_value["rich_text"] else None
-        elif prop_type == "number":
-            return property_value["number"]
-        elif prop_type == "select":
-            return property_value["select"]["name"] if property_value["select"] else None
-        elif prop_type == "multi_select":
-            return [option["name"] for option in property_value["multi_select"]]
-        elif prop_type == "date":
-            return property_value["date"]["start"] if property_value["date"] else None
-        elif prop_type == "people":
-            return [person["name"] for person in property_value["people"]]
-        elif prop_type == "files":
-            return [file["name"] for file in property_value["files"]]
-        elif prop_type == "checkbox":
-            return property_value["checkbox"]
-        elif prop_type == "url":
-            return property_value["url"]
-        elif prop_type == "email":
-            return property_value["email"]
-        elif prop_type == "phone_number":
-            return property_value["phone_number"]
-        else:
-            return None
+        return _PARSERS.get(property_value["type"], _parse_none)(property_value)
     
     def _get_database_title(self, database: Dict[str, Any]) -> str:
         """Get database title from title property."""
@@ -210,11 +279,11 @@ class NotionClient(BaseIntegration):
             return title_property[0]["plain_text"]
         return "Untitled"
     
-    def validate_credentials(self) -> bool:
+    async def validate_credentials(self) -> bool:
         """Validate Notion credentials."""
         try:
             # Try to list databases as a validation check
-            self.list_resources()
+            await self.list_resources()
             return True
         except Exception as e:
             self.logger.error(f"Notion credential validation failed: {str(e)}")
@@ -3,15 +3,21 @@ ScrollIntel v2: The Flame Interpreter
 OneDrive integration client
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Iterator, BinaryIO, Tuple
+import asyncio
 import msal
 import requests
+import httpx
+import orjson
 import json
 from datetime import datetime, timedelta
 import pytz
 import os
+import threading
+from urllib.parse import quote
 
-from .cloud_storage_client import CloudStorageClient
+from .base import ttl_cache
+from .cloud_storage_client import CloudStorageClient, DOWNLOAD_CHUNK_BYTES
 
 class OneDriveClient(CloudStorageClient):
     """OneDrive integration client."""
@@ -19,6 +25,26 @@ class OneDriveClient(CloudStorageClient):
     TOKEN_PATH = 'credentials/onedrive_token.json'
     CREDENTIALS_PATH = 'credentials/onedrive_credentials.json'
     
+    # Shared across instances so the HTTP/2 connection to Microsoft Graph
+    # survives the per-request clients built by the API dependencies.
+    _http: Optional[httpx.AsyncClient] = None
+    
+    # Access tokens shared by every instance, keyed by (tenant_id, client_id)
+    _token_cache: Dict[Tuple[Optional[str], Optional[str]], Tuple[Dict[str, Any], datetime]] = {}
+    _token_lock = threading.Lock()
+    
+    # Refresh tokens this long before they actually expire
+    TOKEN_REFRESH_SKEW = timedelta(seconds=60)
+    
+    # Reads stream to a temp file; files larger than one range are
+    # fetched as concurrent Range requests
+    DOWNLOAD_TO_DISK = True
+    RANGE_CHUNK_BYTES = 4 << 20
+    RANGE_CONCURRENCY = 4
+    
+    # Longer mimetype lists are filtered client-side to keep list URLs short
+    MAX_FILTER_MIMETYPES = 6
+    
     def __init__(self, credentials: Dict[str, Any]):
         """Initialize OneDrive client with OAuth2 credentials."""
         super().__init__(credentials)
@@ -26,67 +52,257 @@ class OneDriveClient(CloudStorageClient):
         self.access_token = self.credentials["access_token"]
         self._log_integration("initialize", {"status": "success"})
     
+    @classmethod
+    def _get_http(cls) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use."""
+        if cls._http is None or cls._http.is_closed:
+            cls._http = httpx.AsyncClient(
+                http2=True,
+                timeout=30,
+                limits=httpx.Limits(max_keepalive_connections=32)
+            )
+        return cls._http
+    
+    @classmethod
+    async def close(cls):
+        """Close the pooled HTTP client."""
+        if cls._http is not None and not cls._http.is_closed:
+            await cls._http.aclose()
+        cls._http = None
+    
     def _get_credentials(self) -> Dict[str, Any]:
         """Get or refresh OAuth2 credentials."""
-        # Create credentials directory if it doesn't exist
-        os.makedirs('credentials', exist_ok=True)
-        
-        # Load existing token
-        if os.path.exists(self.TOKEN_PATH):
-            with open(self.TOKEN_PATH, 'r') as token:
-                creds = json.load(token)
-            
-            # Check if token needs refresh
-            if datetime.fromisoformat(creds["expires_at"]) > datetime.now(pytz.UTC):
-                return creds
-        
-        # Initialize MSAL app
-        app = msal.ConfidentialClientApplication(
-            client_id=self.credentials["client_id"],
-            client_credential=self.credentials["client_secret"],
-            authority=f"https://login.microsoftonline.com/{self.credentials['tenant_id']}"
-        )
-        
-        # Get token
-        result = app.acquire_token_for_client(
-            scopes=["https://graph.microsoft.com/.default"]
-        )
-        
-        if "access_token" not in result:
-            raise ValueError(f"Failed to get access token: {result.get('error_description', 'Unknown error')}")
-        
-        # Save token
-        creds = {
-            "access_token": result["access_token"],
-            "expires_at": (datetime.now(pytz.UTC) + timedelta(seconds=result["expires_in"])).isoformat()
-        }
+        key = (self.credentials.get("tenant_id"), self.credentials.get("client_id"))
         
-        with open(self.TOKEN_PATH, 'w') as token:
-            json.dump(creds, token)
+        # Fast path: a token another instance already loaded
+        cached = self._token_cache.get(key)
+        if cached and self._token_fresh(cached[1]):
+            return cached[0]
         
-        return creds
+        with self._token_lock:
+            # Another thread may have refreshed while we waited
+            cached = self._token_cache.get(key)
+            if cached and self._token_fresh(cached[1]):
+                return cached[0]
+            
+            # Create credentials directory if it doesn't exist
+            os.makedirs('credentials', exist_ok=True)
+            
+            # Load existing token
+            if os.path.exists(self.TOKEN_PATH):
+                with open(self.TOKEN_PATH, 'r') as token:
+                    creds = json.load(token)
+                
+                expires_at = datetime.fromisoformat(creds["expires_at"])
+                if self._token_fresh(expires_at):
+                    self._token_cache[key] = (creds, expires_at)
+                    return creds
+            
+            # Initialize MSAL app
+            app = msal.ConfidentialClientApplication(
+                client_id=self.credentials["client_id"],
+                client_credential=self.credentials["client_secret"],
+                authority=f"https://login.microsoftonline.com/{self.credentials['tenant_id']}"
+            )
+            
+            # Get token
+            result = app.acquire_token_for_client(
+                scopes=["https://graph.microsoft.com/.default"]
+            )
+            
+            if "access_token" not in result:
+                raise ValueError(f"Failed to get access token: {result.get('error_description', 'Unknown error')}")
+            
+            # Save token atomically so concurrent readers never see a partial file
+            expires_at = datetime.now(pytz.UTC) + timedelta(seconds=result["expires_in"])
+            creds = {
+                "access_token": result["access_token"],
+                "expires_at": expires_at.isoformat()
+            }
+            
+            tmp_path = f"{self.TOKEN_PATH}.tmp"
+            with open(tmp_path, 'w') as token:
+                json.dump(creds, token)
+            os.replace(tmp_path, self.TOKEN_PATH)
+            
+            self._token_cache[key] = (creds, expires_at)
+            return creds
     
-    async def _download_file(self, file_id: str) -> bytes:
-        """Download file content from OneDrive."""
+    @classmethod
+    def _token_fresh(cls, expires_at: datetime) -> bool:
+        """Whether a token stays valid beyond the refresh skew."""
+        return expires_at - datetime.now(pytz.UTC) > cls.TOKEN_REFRESH_SKEW
+    
+    async def _download_file_to(self, file_id: str, dest_path: str) -> int:
+        """
+        Stream a OneDrive file to disk without buffering it in memory.
+        
+        The size comes from the first range's Content-Range, not cached
+        metadata; larger files fetch the remaining ranges concurrently,
+        pinned to the first response's ETag so a file edited mid-download
+        falls back to one full request.
+        """
         try:
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "Content-Type": "application/json"
-            }
+            url = f"https://graph.microsoft.com/v1.0/me/drive/items/{file_id}/content"
+            headers = {"Authorization": f"Bearer {self.access_token}"}
+            first = {**headers, "Range": f"bytes=0-{self.RANGE_CHUNK_BYTES - 1}"}
             
-            response = requests.get(
-                f"https://graph.microsoft.com/v1.0/me/drive/items/{file_id}/content",
-                headers=headers
-            )
+            async with self._get_http().stream("GET", url, headers=first) as response:
+                if response.status_code == 416:
+                    # Empty files have no satisfiable range
+                    await response.aclose()
+                    return await self._stream_file(url, headers, dest_path)
+                if response.status_code not in (200, 206):
+                    await response.aread()
+                    raise ValueError(f"Failed to download file: {response.text}")
+                
+                total = response.headers.get("Content-Range", "").rpartition("/")[2]
+                size = int(total) if total.isdigit() else None
+                etag = response.headers.get("ETag")
+                written = await self._write_body(response, dest_path, 0, "wb", size)
             
-            if response.status_code != 200:
-                raise ValueError(f"Failed to download file: {response.text}")
+            # A 200 already carried the whole file; an unknown total can't be ranged
+            if response.status_code == 200 or (size is not None and size <= written):
+                return written
+            if size is not None:
+                semaphore = asyncio.Semaphore(self.RANGE_CONCURRENCY)
+                
+                async def fetch_range(start: int) -> bool:
+                    end = min(start + self.RANGE_CHUNK_BYTES, size) - 1
+                    async with semaphore:
+                        return await self._fetch_range(url, headers, dest_path, start, end, etag)
+                
+                ranged = await asyncio.gather(*(
+                    fetch_range(start)
+                    for start in range(written, size, self.RANGE_CHUNK_BYTES)
+                ))
+                if all(ranged):
+                    return size
             
-            return response.content
+            self.logger.warning("Range requests not honoured, downloading file in one request")
+            return await self._stream_file(url, headers, dest_path)
         except Exception as e:
             self.logger.error(f"Failed to download file: {str(e)}")
             raise ValueError(f"Failed to download file: {str(e)}")
     
+    async def _stream_file(self, url: str, headers: Dict[str, str], dest_path: str) -> int:
+        """Write a whole file to dest_path in one request."""
+        async with self._get_http().stream("GET", url, headers=headers) as response:
+            if response.status_code != 200:
+                await response.aread()
+                raise ValueError(f"Failed to download file: {response.text}")
+            return await self._write_body(response, dest_path, 0, "wb")
+    
+    async def _fetch_range(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        dest_path: str,
+        start: int,
+        end: int,
+        etag: Optional[str]
+    ) -> bool:
+        """
+        Write bytes start..end at their offset in dest_path.
+        
+        Returns False, without writing anything, when the server answers
+        with the whole file instead of a 206 partial response.
+        """
+        headers = {**headers, "Range": f"bytes={start}-{end}"}
+        if etag:
+            headers["If-Range"] = etag
+        
+        async with self._get_http().stream("GET", url, headers=headers) as response:
+            if response.status_code == 200:
+                return False
+            if response.status_code != 206:
+                await response.aread()
+                raise ValueError(f"Failed to download file: {response.text}")
+            await self._write_body(response, dest_path, start, "r+b")
+        return True
+    
+    @staticmethod
+    def _open_at(path: str, offset: int, mode: str, size: Optional[int]) -> BinaryIO:
+        """Open path for writing at offset, pre-sizing it when size is given."""
+        fh = open(path, mode)
+        if size is not None:
+            fh.truncate(size)
+        fh.seek(offset)
+        return fh
+    
+    async def _write_body(
+        self,
+        response: httpx.Response,
+        path: str,
+        offset: int,
+        mode: str,
+        size: Optional[int] = None
+    ) -> int:
+        """Stream a response body into path at offset, with file I/O in worker threads."""
+        # Each range writes through its own handle, so concurrent ranges never share a file position
+        fh = await asyncio.to_thread(self._open_at, path, offset, mode, size)
+        written = 0
+        try:
+            async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_BYTES):
+                await asyncio.to_thread(fh.write, chunk)
+                written += len(chunk)
+        finally:
+            await asyncio.to_thread(fh.close)
+        return written
+    
+    def _iter_file_bytes(
+        self,
+        file_id: str,
+        chunk_bytes: int = DOWNLOAD_CHUNK_BYTES
+    ) -> Iterator[bytes]:
+        """Yield file content from OneDrive as it arrives."""
+        headers = {"Authorization": f"Bearer {self.access_token}"}
+        
+        with requests.get(
+            f"https://graph.microsoft.com/v1.0/me/drive/items/{file_id}/content",
+            headers=headers,
+            stream=True
+        ) as response:
+            if response.status_code != 200:
+                raise ValueError(f"Failed to download file: {response.text}")
+            yield from response.iter_content(chunk_size=chunk_bytes)
+    
+    async def _upload_file(
+        self,
+        content: bytes,
+        name: str,
+        folder_id: Optional[str]
+    ) -> Dict[str, Any]:
+        """Upload a file in a single PUT (Graph simple upload)."""
+        parent = f"items/{folder_id}" if folder_id else "root"
+        response = await self._get_http().put(
+            f"https://graph.microsoft.com/v1.0/me/drive/{parent}:/{quote(name)}:/content",
+            headers={"Authorization": f"Bearer {self.access_token}"},
+            content=content
+        )
+        
+        if response.status_code not in (200, 201):
+            raise ValueError(f"Failed to upload file: {response.text}")
+        
+        file = orjson.loads(response.content)
+        return {
+            "id": file["id"],
+            "name": file["name"],
+            "mime_type": file.get("file", {}).get("mimeType", ""),
+            "size": int(file.get("size", 0)),
+            "created": file.get("createdDateTime", datetime.now(pytz.UTC).isoformat()),
+            "modified": file.get("lastModifiedDateTime", datetime.now(pytz.UTC).isoformat())
+        }
+    
+    def invalidate_listing(self, folder_id: Optional[str] = None):
+        """Drop cached listings for a folder, including the raw ``_list_files`` result."""
+        super().invalidate_listing(folder_id)
+        cache = OneDriveClient._list_files.cache
+        cache.pop((self._cache_scope, (folder_id,), frozenset()), None)
+        if folder_id is None:
+            cache.pop((self._cache_scope, (), frozenset()), None)
+    
+    @ttl_cache(seconds=300)
     async def _list_files(self, folder_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """List files in OneDrive folder."""
         try:
@@ -101,18 +317,30 @@ class OneDriveClient(CloudStorageClient):
             else:
                 url = "https://graph.microsoft.com/v1.0/me/drive/root/children"
             
-            # Add filter for supported file types
-            url += "?$filter=" + " or ".join([
-                f"file/mimeType eq '{mime}'" for mime in self.SUPPORTED_MIMETYPES
-            ])
-            
-            response = requests.get(url, headers=headers)
+            # Filter server-side only while the OR chain stays short
+            filter_locally = len(self.SUPPORTED_MIMETYPES) > self.MAX_FILTER_MIMETYPES
+            if not filter_locally:
+                url += "?$filter=" + " or ".join([
+                    f"file/mimeType eq '{mime}'" for mime in sorted(self.SUPPORTED_MIMETYPES)
+                ])
             
-            if response.status_code != 200:
-                raise ValueError(f"Failed to list files: {response.text}")
+            # Follow @odata.nextLink until the folder is exhausted
+            files = []
+            while url:
+                response = await self._get_http().get(url, headers=headers)
+                
+                if response.status_code != 200:
+                    raise ValueError(f"Failed to list files: {response.text}")
+                
+                data = orjson.loads(response.content)
+                files.extend(data.get("value", []))
+                url = data.get("@odata.nextLink")
             
-            data = response.json()
-            files = data.get("value", [])
+            if filter_locally:
+                files = [
+                    file for file in files
+                    if file.get("file", {}).get("mimeType") in self.SUPPORTED_MIMETYPES
+                ]
             
             # Format file metadata
             return [{
@@ -127,6 +355,7 @@ class OneDriveClient(CloudStorageClient):
             self.logger.error(f"Failed to list files: {str(e)}")
             raise ValueError(f"Failed to list files: {str(e)}")
     
+    @ttl_cache(seconds=300)
     async def _get_file_metadata(self, file_id: str) -> Dict[str, Any]:
         """Get file metadata from OneDrive."""
         try:
@@ -135,7 +364,7 @@ class OneDriveClient(CloudStorageClient):
                 "Content-Type": "application/json"
             }
             
-            response = requests.get(
+            response = await self._get_http().get(
                 f"https://graph.microsoft.com/v1.0/me/drive/items/{file_id}",
                 headers=headers
             )
@@ -143,7 +372,7 @@ class OneDriveClient(CloudStorageClient):
             if response.status_code != 200:
                 raise ValueError(f"Failed to get file metadata: {response.text}")
             
-            file = response.json()
+            file = orjson.loads(response.content)
             
             return {
                 "id": file["id"],
@@ -157,11 +386,11 @@ class OneDriveClient(CloudStorageClient):
             self.logger.error(f"Failed to get file metadata: {str(e)}")
             raise ValueError(f"Failed to get file metadata: {str(e)}")
     
-    def validate_credentials(self) -> bool:
+    async def validate_credentials(self) -> bool:
         """Validate OneDrive credentials."""
         try:
             # Try to list files as a validation check
-            self._list_files()
+            await self._list_files()
             return True
         except Exception as e:
             self.logger.error(f"OneDrive credential validation failed: {str(e)}")
@@ -3,15 +3,56 @@ ScrollIntel v2: The Flame Interpreter
 Salesforce integration client
 """
 
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Union, Iterator
 import pandas as pd
-from datetime import datetime
+from datetime import date, datetime
 import pytz
 import os
 import json
+import asyncio
+import hashlib
+import operator
+import orjson
+import threading
+import time
+from pathlib import Path
 from simple_salesforce import Salesforce
 
-from .base import BaseIntegration
+from .base import BaseIntegration, ttl_cache
+
+def _soql_string(value: Any) -> str:
+    """Quote a value as a SOQL string literal."""
+    return "'" + str(value).replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+def _soql_datetime(value: datetime) -> str:
+    """Format a datetime literal; naive values are taken as UTC."""
+    return value.isoformat() if value.tzinfo else value.isoformat() + "Z"
+
+# SOQL literal formatters keyed by exact value type
+_SOQL_LITERALS = {
+    str: _soql_string,
+    int: str,
+    float: repr,
+    bool: lambda value: "true" if value else "false",
+    type(None): lambda value: "null",
+    datetime: _soql_datetime,
+    date: date.isoformat
+}
+
+def _soql_literal(value: Any) -> str:
+    """Render a Python value as an escaped SOQL literal."""
+    return _SOQL_LITERALS.get(type(value), _soql_string)(value)
+
+# Field attributes reported by get_resource_info; describe always includes them
+_FIELD_KEYS = ("name", "label", "type", "length", "precision", "scale")
+_field_values = operator.itemgetter(*_FIELD_KEYS)
+
+def _picklist_values(field: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Extract label/value pairs from a picklist field description."""
+    return [
+        {"label": value["label"], "value": value["value"]}
+        for value in field.get("picklistValues", [])
+    ]
 
 class SalesforceClient(BaseIntegration):
     """Salesforce integration client."""
@@ -29,6 +70,19 @@ class SalesforceClient(BaseIntegration):
         "Asset"
     ]
     
+    # Projection used when the caller doesn't name fields; Case has no Name
+    DEFAULT_FIELDS = ["Id", "Name", "LastModifiedDate"]
+    OBJECT_DEFAULT_FIELDS = {
+        "Case": ["Id", "CaseNumber", "Subject", "LastModifiedDate"]
+    }
+    
+    # REST queries return at most 2000 records per page; bigger pulls use Bulk
+    REST_PAGE_LIMIT = 2000
+    
+    # Object schemas change rarely, so describes are kept on disk for a day
+    DESCRIBE_CACHE_DIR = "credentials"
+    DESCRIBE_CACHE_TTL = 24 * 60 * 60
+    
     def __init__(self, credentials: Dict[str, Any]):
         """Initialize Salesforce client with credentials."""
         super().__init__(credentials)
@@ -54,35 +108,26 @@ class SalesforceClient(BaseIntegration):
             if object_name not in self.SUPPORTED_OBJECTS:
                 raise ValueError(f"Unsupported object: {object_name}")
             
-            # Get all fields if not specified
+            # Project a small default set if fields are not specified
             if not fields:
-                fields = self._get_object_fields(object_name)
+                fields = self.OBJECT_DEFAULT_FIELDS.get(object_name, self.DEFAULT_FIELDS)
             
             # Build SOQL query
             query = f"SELECT {','.join(fields)} FROM {object_name}"
             
             # Add conditions
             if conditions:
-                where_clauses = []
-                for field, value in conditions.items():
-                    if isinstance(value, str):
-                        where_clauses.append(f"{field} = '{value}'")
-                    else:
-                        where_clauses.append(f"{field} = {value}")
-                query += " WHERE " + " AND ".join(where_clauses)
+                query += " WHERE " + " AND ".join(
+                    f"{field} = {_soql_literal(value)}"
+                    for field, value in conditions.items()
+                )
             
             # Add limit
-            query += f" LIMIT {limit}"
+            if limit is not None:
+                query += f" LIMIT {limit}"
             
             # Execute query
-            result = self.client.query(query)
-            
-            # Convert to DataFrame
-            records = result["records"]
-            df = pd.DataFrame(records)
-            
-            # Remove Salesforce metadata columns
-            df = df.drop(columns=["attributes"], errors="ignore")
+            df = await asyncio.to_thread(self._query_frame, object_name, query, limit)
             
             self._log_integration(
                 "fetch_data",
@@ -100,28 +145,31 @@ class SalesforceClient(BaseIntegration):
             self.logger.error(f"Failed to fetch Salesforce data: {str(e)}")
             raise ValueError(f"Failed to fetch Salesforce data: {str(e)}")
     
+    @ttl_cache(seconds=300)
     async def list_resources(
         self,
         **kwargs
     ) -> List[Dict[str, Any]]:
         """List available Salesforce objects."""
         try:
-            # Get object descriptions
-            objects = []
-            for obj_name in self.SUPPORTED_OBJECTS:
-                try:
-                    desc = self.client.__getattr__(obj_name).describe()
-                    objects.append({
-                        "name": obj_name,
-                        "label": desc["label"],
-                        "label_plural": desc["labelPlural"],
-                        "fields": len(desc["fields"]),
-                        "createable": desc["createable"],
-                        "updateable": desc["updateable"],
-                        "deletable": desc["deletable"]
-                    })
-                except Exception:
-                    continue
+            # Describe every object concurrently
+            descs = await asyncio.gather(
+                *(asyncio.to_thread(self._describe, obj_name) for obj_name in self.SUPPORTED_OBJECTS),
+                return_exceptions=True
+            )
+            objects = [
+                {
+                    "name": obj_name,
+                    "label": desc["label"],
+                    "label_plural": desc["labelPlural"],
+                    "fields": len(desc["fields"]),
+                    "createable": desc["createable"],
+                    "updateable": desc["updateable"],
+                    "deletable": desc["deletable"]
+                }
+                for obj_name, desc in zip(self.SUPPORTED_OBJECTS, descs)
+                if not isinstance(desc, Exception)
+            ]
             
             self._log_integration(
                 "list_resources",
@@ -133,6 +181,7 @@ class SalesforceClient(BaseIntegration):
             self.logger.error(f"Failed to list Salesforce objects: {str(e)}")
             raise ValueError(f"Failed to list Salesforce objects: {str(e)}")
     
+    @ttl_cache(seconds=300)
     async def get_resource_info(
         self,
         object_name: str,
@@ -145,26 +194,16 @@ class SalesforceClient(BaseIntegration):
                 raise ValueError(f"Unsupported object: {object_name}")
             
             # Get object description
-            desc = self.client.__getattr__(object_name).describe()
+            desc = await asyncio.to_thread(self._describe, object_name)
             
             # Get field information
-            fields = []
-            for field in desc["fields"]:
-                fields.append({
-                    "name": field["name"],
-                    "label": field["label"],
-                    "type": field["type"],
-                    "length": field.get("length"),
-                    "precision": field.get("precision"),
-                    "scale": field.get("scale"),
-                    "picklist_values": [
-                        {
-                            "label": value["label"],
-                            "value": value["value"]
-                        }
-                        for value in field.get("picklistValues", [])
-                    ] if field["type"] == "picklist" else None
-                })
+            fields = [
+                dict(
+                    zip(_FIELD_KEYS, _field_values(field)),
+                    picklist_values=_picklist_values(field) if field["type"] == "picklist" else None
+                )
+                for field in desc["fields"]
+            ]
             
             info = {
                 "name": object_name,
@@ -189,10 +228,68 @@ class SalesforceClient(BaseIntegration):
             self.logger.error(f"Failed to get object info: {str(e)}")
             raise ValueError(f"Failed to get object info: {str(e)}")
     
+    def _query_frame(
+        self,
+        object_name: str,
+        query: str,
+        limit: Optional[int]
+    ) -> pd.DataFrame:
+        """Run a SOQL query into a DataFrame without the attributes column (blocking)."""
+        records = (
+            {key: value for key, value in record.items() if key != "attributes"}
+            for record in self._query_records(object_name, query, limit)
+        )
+        return pd.DataFrame.from_records(records)
+    
+    def _query_records(
+        self,
+        object_name: str,
+        query: str,
+        limit: Optional[int]
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield SOQL query records, using the Bulk API beyond one REST page."""
+        if limit is None or limit > self.REST_PAGE_LIMIT:
+            batches = self.client.bulk.__getattr__(object_name).query_all(
+                query, lazy_operation=True
+            )
+            for batch in batches:
+                yield from batch
+            return
+        
+        result = self.client.query(query)
+        yield from result["records"]
+        while not result["done"]:
+            result = self.client.query_more(result["nextRecordsUrl"], identifier_is_url=True)
+            yield from result["records"]
+    
+    def _describe(self, object_name: str) -> Dict[str, Any]:
+        """Describe a Salesforce object, cached on disk per org (blocking)."""
+        org = hashlib.sha1(
+            f"{self.client.sf_instance}|{self.credentials.get('username')}".encode()
+        ).hexdigest()[:12]
+        cache_file = Path(self.DESCRIBE_CACHE_DIR) / f"sf_describe_{org}_{object_name}.json"
+        
+        try:
+            if time.time() - cache_file.stat().st_mtime < self.DESCRIBE_CACHE_TTL:
+                return orjson.loads(cache_file.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            # Missing or unreadable cache; describe again
+            pass
+        
+        desc = self.client.__getattr__(object_name).describe()
+        
+        # Write atomically; concurrent describes of one object use distinct temp files
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{threading.get_ident()}.tmp")
+        tmp_file.write_bytes(orjson.dumps(desc))
+        os.replace(tmp_file, cache_file)
+        return desc
+    
+    @ttl_cache(seconds=300)
     def _get_object_fields(self, object_name: str) -> List[str]:
         """Get all fields for a Salesforce object."""
         try:
-            desc = self.client.__getattr__(object_name).describe()
+            desc = self._describe(object_name)
             return [field["name"] for field in desc["fields"]]
         except Exception as e:
             self.logger.error(f"Failed to get object fields: {str(e)}")
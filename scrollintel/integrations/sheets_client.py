@@ -3,120 +3,246 @@ ScrollIntel v2: The Flame Interpreter
 Google Sheets integration client
 """
 
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Union, Tuple
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
+from yarl import URL
 import pandas as pd
+import numpy as np
 import os
 import json
-import pickle
+import asyncio
+import aiohttp
+import hashlib
+import random
+import time
+import orjson
+import pyarrow as pa
+import pyarrow.parquet as pq
 from datetime import datetime
 import pytz
 import re
+import functools
 
-from .base import BaseIntegration
+from .google_auth import get_google_credentials
+from .base import BaseIntegration, ttl_cache
+
+_SHEET_ID_RE = re.compile(r'/spreadsheets/d/([a-zA-Z0-9-_]+)')
+
+class _TokenBucket:
+    """Client-side token bucket: ``rate`` tokens per second, ``capacity`` burst."""
+    
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+    
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+def _narrow_column(column: pd.Series) -> pd.Series:
+    """Convert a column of sheet strings to a compact lossless dtype.
+    
+    Integers stay int64: narrower ints would silently wrap in later arithmetic.
+    """
+    blank = column.isna() | (column == "")
+    numbers = pd.to_numeric(column, errors="coerce")
+    # Codes such as ZIPs keep their leading zeros as text
+    padded = column.str.match(r"0\d").fillna(False).astype(bool)
+    
+    if (numbers.notna() | blank).all() and not blank.all() and not padded.any():
+        integral = not numbers.isna().any() and (numbers % 1 == 0).all()
+        in_range = numbers.dtype.kind == "i" or (numbers.abs() < 2 ** 63).all()
+        if integral and in_range:
+            return numbers.astype(np.int64)
+        
+        # Long digit strings (IDs) past int64, or past exact float64 integers, stay text
+        digits = column.str.fullmatch(r"[+-]?\d+").fillna(False).astype(bool)
+        if not (digits & (numbers.abs() >= 2 ** 53)).any():
+            narrow = numbers.astype(np.float32)
+            if np.array_equal(narrow.to_numpy(np.float64), numbers.to_numpy(np.float64), equal_nan=True):
+                return narrow
+            return numbers.astype(np.float64)
+    
+    # Repetitive text (status, region, ...) is cheaper as categories
+    if column.nunique() < len(column) / 2:
+        return column.astype("category")
+    return column
+
+def _reduce_mem_usage(df: pd.DataFrame) -> pd.DataFrame:
+    """Downcast every column of a freshly read sheet; positional so duplicate headers survive."""
+    reduced = pd.DataFrame(
+        {position: _narrow_column(df.iloc[:, position]) for position in range(df.shape[1])}
+    )
+    reduced.columns = df.columns
+    return reduced
 
 class SheetsClient(BaseIntegration):
     """Google Sheets integration client."""
     
-    SCOPES = ['https://www.googleapis.com/auth/spreadsheets.readonly']
-    TOKEN_PATH = 'credentials/sheets_token.pickle'
+    # Drive metadata is read for list_resources and the snapshot modifiedTime
+    SCOPES = [
+        'https://www.googleapis.com/auth/spreadsheets.readonly',
+        'https://www.googleapis.com/auth/drive.metadata.readonly'
+    ]
+    TOKEN_PATH = 'credentials/sheets_token.json'
     CREDENTIALS_PATH = 'credentials/sheets_credentials.json'
+    SHEETS_URL = "https://sheets.googleapis.com/v4/spreadsheets"
+    FILES_URL = "https://www.googleapis.com/drive/v3/files"
+    
+    # Shared across instances so keep-alive connections survive the
+    # per-request clients built by the API dependencies.
+    _session: Optional[aiohttp.ClientSession] = None
+    
+    # Range read when the caller gives none
+    DEFAULT_RANGE = "A1:ZZ"
+    
+    # Sheets quotas are per minute and strict: cap in-flight calls, pace them
+    # through a token bucket and retry 429/503 responses with backoff
+    _requests = asyncio.Semaphore(10)
+    _bucket = _TokenBucket(rate=1.0, capacity=10)
+    MAX_RETRIES = 3
+    BASE_BACKOFF = 1.0
+    MAX_BACKOFF = 32.0
     
     def __init__(self, credentials: Dict[str, Any]):
         """Initialize Google Sheets client with OAuth2 credentials."""
         super().__init__(credentials)
         self.credentials = self._get_credentials()
-        self.service = build('sheets', 'v4', credentials=self.credentials)
         self._log_integration("initialize", {"status": "success"})
     
     def _get_credentials(self) -> Credentials:
         """Get or refresh OAuth2 credentials."""
-        creds = None
-        
-        # Create credentials directory if it doesn't exist
-        os.makedirs('credentials', exist_ok=True)
-        
-        # Load existing token
-        if os.path.exists(self.TOKEN_PATH):
-            with open(self.TOKEN_PATH, 'rb') as token:
-                creds = pickle.load(token)
+        return get_google_credentials(
+            "Google Sheets", self.TOKEN_PATH, self.CREDENTIALS_PATH, self.SCOPES
+        )
+    
+    @functools.cached_property
+    def _cache_scope(self) -> int:
+        """Identify the Google account; credentials here are an OAuth2 object."""
+        return hash((self.__class__.__name__, self.credentials.client_id, self.credentials.refresh_token))
+    
+    @classmethod
+    def _get_session(cls) -> aiohttp.ClientSession:
+        """Return the pooled HTTP session, creating it inside the running loop."""
+        if cls._session is None or cls._session.closed:
+            cls._session = aiohttp.ClientSession()
+        return cls._session
+    
+    @classmethod
+    async def close(cls):
+        """Close the pooled HTTP session."""
+        if cls._session is not None and not cls._session.closed:
+            await cls._session.close()
+        cls._session = None
+    
+    async def _get_json(
+        self,
+        url: Union[str, URL],
+        params: Optional[Union[Dict[str, Any], List[Tuple[str, str]]]] = None
+    ) -> Dict[str, Any]:
+        """GET a Google API endpoint with the OAuth2 token and decode the JSON body."""
+        if not self.credentials.valid:
+            await asyncio.to_thread(self.credentials.refresh, Request())
         
-        # Refresh or create new credentials
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-            else:
-                if not os.path.exists(self.CREDENTIALS_PATH):
-                    raise ValueError(
-                        f"Google Sheets credentials file not found at {self.CREDENTIALS_PATH}. "
-                        "Please download from Google Cloud Console."
-                    )
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    self.CREDENTIALS_PATH, self.SCOPES
-                )
-                creds = flow.run_local_server(port=0)
+        # A token refresh doesn't count against the retries
+        refreshed = False
+        attempt = 0
+        while True:
+            async with self._requests:
+                await self._bucket.acquire()
+                headers = {"Authorization": f"Bearer {self.credentials.token}"}
+                async with self._get_session().get(url, headers=headers, params=params) as response:
+                    # Refresh a token that expired since it was loaded, then retry once
+                    if response.status == 401 and not refreshed:
+                        refreshed = True
+                        await asyncio.to_thread(self.credentials.refresh, Request())
+                        continue
+                    if response.status not in (429, 503) or attempt == self.MAX_RETRIES:
+                        response.raise_for_status()
+                        return await response.json()
+                    delay = self._retry_delay(response.headers.get("Retry-After"), attempt)
             
-            # Save credentials
-            with open(self.TOKEN_PATH, 'wb') as token:
-                pickle.dump(creds, token)
-        
-        return creds
+            # Back off outside the semaphore so other calls keep flowing
+            await asyncio.sleep(delay)
+            attempt += 1
     
-    def _extract_sheet_id(self, url: str) -> str:
+    @classmethod
+    def _retry_delay(cls, retry_after: Optional[str], attempt: int) -> float:
+        """Seconds to wait before a retry: Retry-After, else exponential backoff with jitter."""
+        try:
+            return min(float(retry_after), cls.MAX_BACKOFF)
+        except (TypeError, ValueError):
+            return min(cls.MAX_BACKOFF, cls.BASE_BACKOFF * 2 ** attempt) + random.random()
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _extract_sheet_id(url: str) -> str:
         """Extract sheet ID from Google Sheets URL."""
         # Match patterns like:
         # https://docs.google.com/spreadsheets/d/SHEET_ID/edit
         # https://docs.google.com/spreadsheets/d/SHEET_ID/edit#gid=0
-        match = re.search(r'/spreadsheets/d/([a-zA-Z0-9-_]+)', url)
+        match = _SHEET_ID_RE.search(url)
         if not match:
             raise ValueError("Invalid Google Sheets URL")
         return match.group(1)
     
+    @ttl_cache(seconds=300)
+    async def _get_metadata(self, sheet_id: str) -> Dict[str, Any]:
+        """Spreadsheet metadata; titles and sheet ids change rarely."""
+        return await self._get_json(f"{self.SHEETS_URL}/{sheet_id}")
+    
     async def fetch_data(
         self,
         sheet_url: str,
         sheet_name: Optional[str] = None,
         range_name: Optional[str] = None,
+        dtype_hints: Optional[Dict[str, Any]] = None,
+        cache_dir: Optional[str] = None,
         **kwargs
     ) -> pd.DataFrame:
-        """Fetch data from Google Sheet."""
+        """
+        Fetch data from Google Sheet.
+        
+        Columns are converted to int64, lossless float32/float64 or
+        category dtypes; pass ``dtype_hints`` ({column: dtype}) to skip
+        that inference. With
+        ``cache_dir`` the frame is kept as a Parquet snapshot and reused
+        while the spreadsheet's Drive modifiedTime is unchanged.
+        """
         try:
             # Extract sheet ID from URL
             sheet_id = self._extract_sheet_id(sheet_url)
             
-            # Get sheet metadata
-            sheet_metadata = self.service.spreadsheets().get(
-                spreadsheetId=sheet_id
-            ).execute()
-            
-            # If sheet name not provided, use first sheet
-            if not sheet_name:
-                sheet_name = sheet_metadata['sheets'][0]['properties']['title']
-            
-            # If range not provided, use entire sheet
+            # If range not provided, use entire sheet; without a sheet name
+            # A1 notation resolves to the first sheet, so no metadata call
             if not range_name:
-                range_name = f"{sheet_name}!A1:ZZ"
-            
-            # Fetch data
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=sheet_id,
-                range=range_name
-            ).execute()
-            
-            # Convert to DataFrame
-            values = result.get('values', [])
-            if not values:
-                raise ValueError("No data found in sheet")
+                range_name = f"{sheet_name}!{self.DEFAULT_RANGE}" if sheet_name else self.DEFAULT_RANGE
             
-            # Use first row as headers
-            headers = values[0]
-            data = values[1:]
+            # Reuse the snapshot if the spreadsheet hasn't changed since it was taken
+            snapshot = modified = df = None
+            if cache_dir:
+                modified = await self._modified_time(sheet_id)
+                if modified:
+                    snapshot = self._snapshot_paths(cache_dir, sheet_id, range_name, dtype_hints)
+                    df = await asyncio.to_thread(self._read_snapshot, *snapshot, modified)
+            cached = df is not None
             
-            # Create DataFrame
-            df = pd.DataFrame(data, columns=headers)
+            # Fetch data
+            if not cached:
+                value_ranges = await self._batch_get(sheet_id, [range_name])
+                df = self._values_to_frame(value_ranges[0].get('values', []), dtype_hints)
+                if snapshot:
+                    await asyncio.to_thread(self._write_snapshot, df, *snapshot, modified)
             
             self._log_integration(
                 "fetch_data",
@@ -124,6 +250,7 @@ class SheetsClient(BaseIntegration):
                     "sheet_id": sheet_id,
                     "sheet_name": sheet_name,
                     "range": range_name,
+                    "cached": cached,
                     "rows": len(df)
                 }
             )
@@ -133,6 +260,122 @@ class SheetsClient(BaseIntegration):
             self.logger.error(f"Failed to fetch sheet data: {str(e)}")
             raise ValueError(f"Failed to fetch sheet data: {str(e)}")
     
+    async def _modified_time(self, sheet_id: str) -> Optional[str]:
+        """Spreadsheet modifiedTime from Drive, or None if it can't be read."""
+        try:
+            result = await self._get_json(
+                f"{self.FILES_URL}/{sheet_id}", params={"fields": "modifiedTime"}
+            )
+            return result.get("modifiedTime")
+        except aiohttp.ClientError as e:
+            self.logger.warning(f"Sheet snapshot disabled, no modifiedTime: {str(e)}")
+            return None
+    
+    def _snapshot_paths(
+        self,
+        cache_dir: str,
+        sheet_id: str,
+        range_name: str,
+        dtype_hints: Optional[Dict[str, Any]]
+    ) -> Tuple[str, str]:
+        """Parquet and sidecar paths for one sheet range and dtype setup."""
+        key = hashlib.sha1(
+            orjson.dumps([range_name, dtype_hints], option=orjson.OPT_SORT_KEYS, default=str)
+        ).hexdigest()[:12]
+        base = os.path.join(cache_dir, f"{sheet_id}.{key}")
+        return f"{base}.parquet", f"{base}.meta.json"
+    
+    def _read_snapshot(
+        self,
+        parquet_path: str,
+        meta_path: str,
+        modified: str
+    ) -> Optional[pd.DataFrame]:
+        """Load a snapshot taken at ``modified``, or None if it is stale or missing."""
+        try:
+            with open(meta_path, "rb") as f:
+                if orjson.loads(f.read()).get("modifiedTime") != modified:
+                    return None
+            return pq.read_table(parquet_path).to_pandas()
+        except (OSError, ValueError, pa.ArrowException):
+            return None
+    
+    def _write_snapshot(
+        self,
+        df: pd.DataFrame,
+        parquet_path: str,
+        meta_path: str,
+        modified: str
+    ):
+        """Write a Parquet snapshot, then the sidecar recording its modifiedTime."""
+        try:
+            os.makedirs(os.path.dirname(parquet_path) or ".", exist_ok=True)
+            tmp_path = f"{parquet_path}.tmp"
+            pq.write_table(
+                pa.Table.from_pandas(df, preserve_index=False),
+                tmp_path,
+                compression="zstd",
+                use_dictionary=True
+            )
+            os.replace(tmp_path, parquet_path)
+            with open(meta_path, "wb") as f:
+                f.write(orjson.dumps({"modifiedTime": modified}))
+        except (OSError, ValueError, pa.ArrowException) as e:
+            # Duplicate headers and similar can't be stored; just skip the snapshot
+            self.logger.warning(f"Failed to write sheet snapshot: {str(e)}")
+    
+    async def fetch_sheets(
+        self,
+        sheet_url: str,
+        sheet_names: List[str],
+        **kwargs
+    ) -> Dict[str, pd.DataFrame]:
+        """Fetch several sheets of one spreadsheet in a single batchGet."""
+        try:
+            sheet_id = self._extract_sheet_id(sheet_url)
+            ranges = [f"{name}!{self.DEFAULT_RANGE}" for name in sheet_names]
+            value_ranges = await self._batch_get(sheet_id, ranges)
+            
+            frames = {
+                name: self._values_to_frame(value_range.get('values', []))
+                for name, value_range in zip(sheet_names, value_ranges)
+            }
+            
+            self._log_integration(
+                "fetch_sheets",
+                {
+                    "sheet_id": sheet_id,
+                    "sheet_names": sheet_names,
+                    "rows": sum(len(df) for df in frames.values())
+                }
+            )
+            
+            return frames
+        except Exception as e:
+            self.logger.error(f"Failed to fetch sheet data: {str(e)}")
+            raise ValueError(f"Failed to fetch sheet data: {str(e)}")
+    
+    async def _batch_get(self, sheet_id: str, ranges: List[str]) -> List[Dict[str, Any]]:
+        """Read several A1 ranges in one values:batchGet round-trip."""
+        result = await self._get_json(
+            f"{self.SHEETS_URL}/{sheet_id}/values:batchGet",
+            params=[("ranges", range_name) for range_name in ranges] + [("majorDimension", "ROWS")]
+        )
+        return result.get('valueRanges', [])
+    
+    def _values_to_frame(
+        self,
+        values: List[List[Any]],
+        dtype_hints: Optional[Dict[str, Any]] = None
+    ) -> pd.DataFrame:
+        """Build a typed DataFrame from sheet rows, using the first row as headers."""
+        if not values:
+            raise ValueError("No data found in sheet")
+        df = pd.DataFrame(values[1:], columns=values[0])
+        if dtype_hints:
+            return df.astype(dtype_hints)
+        return _reduce_mem_usage(df)
+    
     async def list_resources(
         self,
         **kwargs
@@ -140,11 +383,11 @@ class SheetsClient(BaseIntegration):
         """List available Google Sheets."""
         try:
             # Get list of spreadsheets
-            results = self.service.files().list(
-                q="mimeType='application/vnd.google-apps.spreadsheet'",
-                spaces='drive',
-                fields="files(id, name, createdTime, modifiedTime)"
-            ).execute()
+            results = await self._get_json(self.FILES_URL, params={
+                "q": "mimeType='application/vnd.google-apps.spreadsheet'",
+                "spaces": "drive",
+                "fields": "files(id, name, createdTime, modifiedTime)"
+            })
             
             sheets = results.get('files', [])
             
@@ -166,9 +409,7 @@ class SheetsClient(BaseIntegration):
         """Get information about a Google Sheet."""
         try:
             # Get sheet metadata
-            metadata = self.service.spreadsheets().get(
-                spreadsheetId=sheet_id
-            ).execute()
+            metadata = await self._get_metadata(sheet_id)
             
             info = {
                 "id": metadata['spreadsheetId'],
@@ -195,11 +436,11 @@ class SheetsClient(BaseIntegration):
             self.logger.error(f"Failed to get sheet info: {str(e)}")
             raise ValueError(f"Failed to get sheet info: {str(e)}")
     
-    def validate_credentials(self) -> bool:
+    async def validate_credentials(self) -> bool:
         """Validate Google Sheets credentials."""
         try:
             # Try to list sheets as a validation check
-            self.list_resources()
+            await self.list_resources()
             return True
         except Exception as e:
             self.logger.error(f"Google Sheets credential validation failed: {str(e)}")
@@ -8,6 +8,7 @@ import numpy as np
 from datetime import datetime
 import pytz
 from enum import Enum
+import re
 
 class ScrollDomain(Enum):
     TRADE = "Trade"
@@ -32,6 +33,19 @@ class FlameInterpreter:
             ScrollDomain.HEALTH: ["wellness", "vitality", "healing", "strength", "resilience"]
         }
         
+        # Keyword -> domain index plus one scanner for every keyword; the
+        # lookahead reports overlapping hits ("omen" inside "moment")
+        self._keyword_index = {
+            keyword: domain
+            for domain, keywords in self.domain_keywords.items()
+            for keyword in keywords
+        }
+        self._keyword_re = re.compile(
+            "(?=(" + "|".join(
+                re.escape(keyword) for keyword in sorted(self._keyword_index, key=len, reverse=True)
+            ) + "))"
+        )
+        
         self.prophetic_captions = {
             ScrollDomain.TRADE: "The flame reveals hidden patterns in the domain of Trade",
             ScrollDomain.LABOUR: "The sacred fire illuminates the path of Labour",
@@ -97,10 +111,12 @@ class FlameInterpreter:
         domain_scores = {domain: 0 for domain in ScrollDomain}
         
         for key in metrics.keys():
-            key_lower = key.lower()
-            for domain, keywords in self.domain_keywords.items():
-                if any(keyword in key_lower for keyword in keywords):
-                    domain_scores[domain] += 1
+            # Each domain scores at most once per metric
+            for domain in {
+                self._keyword_index[match.group(1)]
+                for match in self._keyword_re.finditer(key.lower())
+            }:
+                domain_scores[domain] += 1
         
         # Return domain with highest score
         return max(domain_scores.items(), key=lambda x: x[1])[0]
@@ -8,6 +8,7 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 import pytz
+import warnings
 
 class ScrollSanctify:
     """Data sanctification and integrity verification engine."""
@@ -39,6 +40,9 @@ class ScrollSanctify:
                 "sacred_timing": sacred_timing
             }
             
+            # Numeric statistics shared by the distribution checks
+            stats = self._numeric_stats(data)
+            
             # Check for missing values
             missing_check = self._check_missing_values(data)
             if not missing_check["is_valid"]:
@@ -50,7 +54,7 @@ class ScrollSanctify:
                 })
             
             # Check for bias
-            bias_check = self._check_bias(data)
+            bias_check = self._check_bias(data, stats)
             if not bias_check["is_valid"]:
                 results["is_sanctified"] = False
                 results["breaches"].append({
@@ -60,7 +64,7 @@ class ScrollSanctify:
                 })
             
             # Check for corruption
-            corruption_check = self._check_corruption(data)
+            corruption_check = self._check_corruption(data, stats)
             if not corruption_check["is_valid"]:
                 results["is_sanctified"] = False
                 results["breaches"].append({
@@ -70,7 +74,7 @@ class ScrollSanctify:
                 })
             
             # Check for anomalies
-            anomaly_check = self._check_anomalies(data)
+            anomaly_check = self._check_anomalies(data, stats)
             if not anomaly_check["is_valid"]:
                 results["warnings"].append({
                     "type": "anomaly",
@@ -79,7 +83,7 @@ class ScrollSanctify:
                 })
             
             # Check for consistency
-            consistency_check = self._check_consistency(data)
+            consistency_check = self._check_consistency(data, stats)
             if not consistency_check["is_valid"]:
                 results["warnings"].append({
                     "type": "inconsistency",
@@ -111,88 +115,125 @@ class ScrollSanctify:
             }
         }
     
-    def _check_bias(self, data: pd.DataFrame) -> Dict[str, Any]:
-        """Check for bias in the dataset."""
-        bias_results = {}
+    def _numeric_stats(self, data: pd.DataFrame) -> Dict[str, Any]:
+        """Column statistics shared by the numeric checks, computed once per frame."""
+        num = data.select_dtypes(include=[np.number])
+        arr = num.to_numpy(dtype=np.float64, na_value=np.nan)
         
-        for column in data.select_dtypes(include=[np.number]).columns:
-            # Calculate distribution metrics
-            mean = data[column].mean()
-            median = data[column].median()
-            std = data[column].std()
-            
-            # Check for significant skew
-            skew = abs(mean - median) / std if std > 0 else 0
+        # One NumPy call per statistic across all columns; all-NaN or
+        # single-row columns yield NaN like pandas, without the warnings
+        with warnings.catch_warnings(), np.errstate(divide="ignore", invalid="ignore"):
+            warnings.simplefilter("ignore", RuntimeWarning)
+            mean = np.nanmean(arr, axis=0)
+            median = np.nanmedian(arr, axis=0)
+            std = np.nanstd(arr, axis=0, ddof=1)
+            q1 = np.nanquantile(arr, 0.25, axis=0)
+            q3 = np.nanquantile(arr, 0.75, axis=0)
+            iqr = q3 - q1
+            changes = np.abs(np.diff(arr, axis=0))
+            change_limit = np.nanmean(changes, axis=0) + 3 * np.nanstd(changes, axis=0, ddof=1)
             
-            bias_results[column] = {
-                "skew": skew,
-                "is_biased": skew > 2.0  # Consider biased if skew > 2
+            counts = {
+                "inf_count": np.isinf(arr).sum(axis=0),
+                # Values more than 3 IQRs outside the quartiles
+                "outlier_count": ((arr < q1 - 3 * iqr) | (arr > q3 + 3 * iqr)).sum(axis=0),
+                # Values more than 3 standard deviations from the mean
+                "anomaly_count": (np.abs((arr - mean) / std) > 3).sum(axis=0),
+                "sudden_changes": (changes > change_limit).sum(axis=0)
+            }
+        
+        stats = {
+            name: pd.Series(values, index=num.columns)
+            for name, values in (("mean", mean), ("median", median), ("std", std), *counts.items())
+        }
+        stats["columns"] = num.columns
+        return stats
+    
+    def _check_bias(
+        self,
+        data: pd.DataFrame,
+        stats: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Check for bias in the dataset."""
+        stats = stats if stats is not None else self._numeric_stats(data)
+        
+        # Check for significant skew
+        skew = ((stats["mean"] - stats["median"]).abs() / stats["std"]).where(stats["std"] > 0, 0)
+        
+        bias_results = {
+            column: {
+                "skew": skew[column],
+                "is_biased": skew[column] > 2.0  # Consider biased if skew > 2
             }
+            for column in stats["columns"]
+        }
         
         return {
             "is_valid": not any(result["is_biased"] for result in bias_results.values()),
             "details": bias_results
         }
     
-    def _check_corruption(self, data: pd.DataFrame) -> Dict[str, Any]:
+    def _check_corruption(
+        self,
+        data: pd.DataFrame,
+        stats: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """Check for data corruption."""
-        corruption_results = {}
+        stats = stats if stats is not None else self._numeric_stats(data)
         
-        for column in data.select_dtypes(include=[np.number]).columns:
-            # Check for infinite values
-            inf_count = np.isinf(data[column]).sum()
-            
-            # Check for extreme outliers
-            q1 = data[column].quantile(0.25)
-            q3 = data[column].quantile(0.75)
-            iqr = q3 - q1
-            lower_bound = q1 - 3 * iqr
-            upper_bound = q3 + 3 * iqr
-            outliers = ((data[column] < lower_bound) | (data[column] > upper_bound)).sum()
-            
-            corruption_results[column] = {
-                "inf_count": inf_count,
-                "outlier_count": outliers,
-                "is_corrupted": inf_count > 0 or outliers > len(data) * 0.1
+        corruption_results = {
+            column: {
+                "inf_count": stats["inf_count"][column],
+                "outlier_count": stats["outlier_count"][column],
+                "is_corrupted": (
+                    stats["inf_count"][column] > 0
+                    or stats["outlier_count"][column] > len(data) * 0.1
+                )
             }
+            for column in stats["columns"]
+        }
         
         return {
             "is_valid": not any(result["is_corrupted"] for result in corruption_results.values()),
             "details": corruption_results
         }
     
-    def _check_anomalies(self, data: pd.DataFrame) -> Dict[str, Any]:
+    def _check_anomalies(
+        self,
+        data: pd.DataFrame,
+        stats: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """Check for anomalous patterns."""
-        anomaly_results = {}
+        stats = stats if stats is not None else self._numeric_stats(data)
         
-        for column in data.select_dtypes(include=[np.number]).columns:
-            # Calculate z-scores
-            z_scores = np.abs((data[column] - data[column].mean()) / data[column].std())
-            anomalies = (z_scores > 3).sum()  # Values more than 3 standard deviations
-            
-            anomaly_results[column] = {
-                "anomaly_count": anomalies,
-                "has_anomalies": anomalies > 0
+        anomaly_results = {
+            column: {
+                "anomaly_count": stats["anomaly_count"][column],
+                "has_anomalies": stats["anomaly_count"][column] > 0
             }
+            for column in stats["columns"]
+        }
         
         return {
             "is_valid": not any(result["has_anomalies"] for result in anomaly_results.values()),
             "details": anomaly_results
         }
     
-    def _check_consistency(self, data: pd.DataFrame) -> Dict[str, Any]:
+    def _check_consistency(
+        self,
+        data: pd.DataFrame,
+        stats: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """Check for data consistency."""
-        consistency_results = {}
+        stats = stats if stats is not None else self._numeric_stats(data)
         
-        for column in data.select_dtypes(include=[np.number]).columns:
-            # Check for sudden changes
-            changes = data[column].diff().abs()
-            sudden_changes = (changes > changes.mean() + 3 * changes.std()).sum()
-            
-            consistency_results[column] = {
-                "sudden_changes": sudden_changes,
-                "is_inconsistent": sudden_changes > len(data) * 0.05
+        consistency_results = {
+            column: {
+                "sudden_changes": stats["sudden_changes"][column],
+                "is_inconsistent": stats["sudden_changes"][column] > len(data) * 0.05
             }
+            for column in stats["columns"]
+        }
         
         return {
             "is_valid": not any(result["is_inconsistent"] for result in consistency_results.values()),
@@ -0,0 +1,71 @@
+import orjson
+from scrollintel.auth.auth_service import AuthService, UserCreate
+
+LEGACY_USERS = {
+    "alice": {
+        "email": "alice@example.com",
+        "hashed_password": "hash-a",
+        "is_active": True,
+        "is_admin": True,
+        "created_at": "2024-01-02T03:04:05",
+        "last_login": "2024-02-03T04:05:06"
+    },
+    "bob": {
+        "email": "bob@example.com",
+        "hashed_password": "hash-b",
+        "created_at": "2024-01-05T00:00:00"
+    }
+}
+
+def _service(tmp_path):
+    return AuthService(
+        db_path=str(tmp_path / "users.db"),
+        users_file=str(tmp_path / "users.json")
+    )
+
+def test_migrates_legacy_users_file(tmp_path):
+    (tmp_path / "users.json").write_bytes(orjson.dumps(LEGACY_USERS))
+    service = _service(tmp_path)
+    
+    alice = service.get_user("alice")
+    assert alice.email == "alice@example.com"
+    assert alice.hashed_password == "hash-a"
+    assert alice.is_admin is True
+    assert alice.last_login.isoformat() == "2024-02-03T04:05:06"
+    
+    bob = service.get_user("bob")
+    assert bob.is_active is True
+    assert bob.is_admin is False
+    assert bob.last_login is None
+    assert service.get_user("carol") is None
+
+def test_migration_only_runs_on_empty_database(tmp_path):
+    (tmp_path / "users.json").write_bytes(orjson.dumps(LEGACY_USERS))
+    _service(tmp_path)
+    
+    # Later edits to the legacy file are ignored once the database has users
+    changed = dict(LEGACY_USERS, carol=dict(LEGACY_USERS["bob"], email="carol@example.com"))
+    (tmp_path / "users.json").write_bytes(orjson.dumps(changed))
+    service = _service(tmp_path)
+    assert service.get_user("carol") is None
+    assert service.get_user("alice").email == "alice@example.com"
+
+def test_starts_empty_without_legacy_file(tmp_path):
+    service = _service(tmp_path)
+    assert service.get_user("alice") is None
+
+def test_writes_evict_only_the_written_user(tmp_path):
+    (tmp_path / "users.json").write_bytes(orjson.dumps(LEGACY_USERS))
+    service = _service(tmp_path)
+    alice = service.get_user("alice")
+    bob = service.get_user("bob")
+    assert service.get_user("carol") is None
+    
+    service.update_last_login("bob")
+    assert service.get_user("alice") is alice
+    assert service.get_user("bob") is not bob
+    assert service.get_user("bob").last_login is not None
+    
+    service.create_user(UserCreate(username="carol", email="carol@example.com", password="secret"))
+    assert service.get_user("carol").email == "carol@example.com"
+    assert service.get_user("alice") is alice
@@ -0,0 +1,117 @@
+import io
+import asyncio
+import threading
+import xlsxwriter
+import pandas as pd
+from scrollintel.integrations.cloud_storage_client import (
+    CloudStorageClient,
+    excel_bytes,
+    parse_excel_bytes,
+    stream_records
+)
+
+def _workbook(rows):
+    buffer = io.BytesIO()
+    workbook = xlsxwriter.Workbook(buffer, {"in_memory": True})
+    sheet = workbook.add_worksheet()
+    for r, row in enumerate(rows):
+        for c, value in enumerate(row):
+            if value is not None:
+                sheet.write(r, c, value)
+    workbook.close()
+    return buffer.getvalue()
+
+def _fragments(content, threads, size=7):
+    for start in range(0, len(content), size):
+        threads.add(threading.get_ident())
+        yield content[start:start + size]
+
+async def _collect(records):
+    return [record async for record in records]
+
+def test_stream_records_reads_csv_chunks_off_the_event_loop():
+    threads = set()
+    content = b"a,b\n" + b"".join(b"%d,%d\n" % (i, i * 2) for i in range(25))
+    frames = asyncio.run(_collect(stream_records(_fragments(content, threads), True, 10)))
+    
+    assert [len(frame) for frame in frames] == [10, 10, 5]
+    assert frames[-1]["b"].tolist() == [40, 42, 44, 46, 48]
+    assert threading.get_ident() not in threads
+
+def test_stream_records_yields_json_items():
+    threads = set()
+    content = b"[" + b",".join(b'{"x": %d}' % i for i in range(12)) + b"]"
+    items = asyncio.run(_collect(stream_records(_fragments(content, threads), False, 5)))
+    
+    assert [item["x"] for item in items] == list(range(12))
+    assert threading.get_ident() not in threads
+
+def test_parse_excel_bytes_matches_read_excel_semantics():
+    content = _workbook([
+        ["id", "qty", "name", "qty", "price"],
+        [1, 10, "a", 1, 1.5],
+        [2, None, "b", 2, 2.25],
+        [3, 30, None, 3, 3.0]
+    ])
+    frame = parse_excel_bytes(content)
+    
+    assert list(frame.columns) == ["id", "qty", "name", "qty.1", "price"]
+    assert frame["id"].dtype == "int64"
+    assert frame["qty.1"].tolist() == [1, 2, 3]
+    assert frame["qty"].dtype == "float64"
+    assert frame["qty"].isna().tolist() == [False, True, False]
+    assert frame["price"].tolist() == [1.5, 2.25, 3.0]
+    assert frame["name"].tolist()[:2] == ["a", "b"]
+    assert frame["name"].isna().tolist() == [False, False, True]
+
+def test_excel_bytes_round_trip():
+    frame = pd.DataFrame({
+        "name": ["a", "b", "z"],
+        "qty": [1, 2, 3],
+        "price": [1.5, 2.5, 3.5]
+    })
+    pd.testing.assert_frame_equal(parse_excel_bytes(excel_bytes(frame)), frame)
+
+def test_parse_excel_bytes_empty_sheet():
+    assert parse_excel_bytes(_workbook([])).empty
+
+def test_excel_pool_parses_in_spawned_workers():
+    from scrollintel.integrations import cloud_storage_client
+    content = _workbook([["a", "b"], [1, "x"], [2, "y"]])
+    try:
+        frame = asyncio.run(cloud_storage_client.parse_excel_in_pool(content))
+        assert frame["a"].tolist() == [1, 2]
+        assert cloud_storage_client._EXCEL_POOL._mp_context.get_start_method() == "spawn"
+    finally:
+        cloud_storage_client.shutdown_excel_pool()
+    assert cloud_storage_client._EXCEL_POOL is None
+
+class _FakeStorage(CloudStorageClient):
+    listings = 0
+    
+    async def _list_files(self, folder_id):
+        type(self).listings += 1
+        return [{"id": "1", "name": "data.csv", "mime_type": "text/csv"}]
+    
+    async def _upload_file(self, content, name, folder_id):
+        return {"id": "2", "name": name}
+
+def test_listing_cache_is_shared_and_invalidated_by_uploads(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _FakeStorage._listing_cache.clear()
+    
+    async def run():
+        await _FakeStorage({"token": "a"}).list_resources("folder")
+        await _FakeStorage({"token": "a"}).list_resources("folder")
+        assert _FakeStorage.listings == 1
+        
+        # Other accounts don't see the cached listing
+        await _FakeStorage({"token": "b"}).list_resources("folder")
+        assert _FakeStorage.listings == 2
+        
+        await _FakeStorage({"token": "a"}).upload_file(b"x", "new.csv", "folder")
+        await _FakeStorage({"token": "a"}).list_resources("folder")
+        await _FakeStorage({"token": "b"}).list_resources("folder")
+        assert _FakeStorage.listings == 3
+    
+    asyncio.run(run())
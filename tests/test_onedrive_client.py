@@ -0,0 +1,86 @@
+import asyncio
+import logging
+import os
+import httpx
+import pytest
+from scrollintel.integrations.onedrive_client import OneDriveClient
+
+def _client():
+    client = OneDriveClient.__new__(OneDriveClient)
+    client.credentials = {"access_token": "token"}
+    client.access_token = "token"
+    client.logger = logging.getLogger("test.onedrive")
+    client._meta_cache = {}
+    client._meta_ttl = 300
+    return client
+
+def _serve(content, honour_ranges=True, etag='"v1"'):
+    requests = []
+    
+    def handler(request):
+        requests.append(request)
+        byte_range = request.headers.get("Range")
+        if byte_range and honour_ranges:
+            if not content:
+                return httpx.Response(416)
+            if request.headers.get("If-Range", etag) != etag:
+                return httpx.Response(200, content=content)
+            start, end = map(int, byte_range.split("=")[1].split("-"))
+            end = min(end, len(content) - 1)
+            return httpx.Response(
+                206,
+                content=content[start:end + 1],
+                headers={"Content-Range": f"bytes {start}-{end}/{len(content)}", "ETag": etag}
+            )
+        return httpx.Response(200, content=content)
+    
+    OneDriveClient._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return requests
+
+@pytest.fixture(autouse=True)
+def small_ranges(monkeypatch):
+    monkeypatch.setattr(OneDriveClient, "RANGE_CHUNK_BYTES", 1000)
+    yield
+    OneDriveClient._http = None
+
+@pytest.mark.parametrize("size", [0, 10, 1000, 4321])
+@pytest.mark.parametrize("honour_ranges", [True, False])
+def test_download_file_to_writes_exact_content(tmp_path, size, honour_ranges):
+    content = os.urandom(size)
+    _serve(content, honour_ranges)
+    path = str(tmp_path / "file")
+    
+    assert asyncio.run(_client()._download_file_to("item", path)) == size
+    assert open(path, "rb").read() == content
+
+def test_download_file_to_refetches_a_file_changed_mid_download(tmp_path):
+    old, new = os.urandom(4321), os.urandom(4321)
+    requests = []
+    
+    def handler(request):
+        requests.append(request)
+        if len(requests) == 1:
+            return httpx.Response(
+                206,
+                content=old[:1000],
+                headers={"Content-Range": "bytes 0-999/4321", "ETag": '"v1"'}
+            )
+        # The file was replaced after the first range; If-Range "v1" no longer matches
+        return httpx.Response(200, content=new)
+    
+    OneDriveClient._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    path = str(tmp_path / "file")
+    
+    assert asyncio.run(_client()._download_file_to("item", path)) == 4321
+    assert open(path, "rb").read() == new
+    assert requests[1].headers["If-Range"] == '"v1"'
+    assert "Range" not in requests[-1].headers
+
+def test_fetch_data_parses_downloaded_csv(tmp_path):
+    content = b"a,b\n" + b"".join(b"%d,x%d\n" % (i, i) for i in range(500))
+    _serve(content)
+    
+    client = _client()
+    frame = asyncio.run(client.fetch_data("item", file_type="csv"))
+    assert len(frame) == 500
+    assert frame["a"].sum() == sum(range(500))
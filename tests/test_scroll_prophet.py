@@ -0,0 +1,104 @@
+import os
+import asyncio
+import numpy as np
+import pytest
+
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from scrollintel.assistants import scroll_prophet as prophet_module
+from scrollintel.assistants.scroll_prophet import ScrollProphet, SemanticCache
+
+def _unit(dim, index):
+    vector = np.zeros(dim, dtype=np.float32)
+    vector[index] = 1.0
+    return vector
+
+def test_semantic_cache_evicts_least_recently_used(tmp_path):
+    cache = SemanticCache(str(tmp_path / "cache"), max_exact=2, max_semantic=2)
+    asyncio.run(cache.add("a", _unit(3, 0), "A"))
+    asyncio.run(cache.add("b", _unit(3, 1), "B"))
+    
+    # Touch "a" so "b" is the least recently used entry
+    assert cache.search(_unit(3, 0)) == "A"
+    asyncio.run(cache.add("c", _unit(3, 2), "C"))
+    
+    assert cache.size == 2
+    assert cache.embeddings.shape == (2, 3)
+    assert cache.search(_unit(3, 0)) == "A"
+    assert cache.search(_unit(3, 1)) is None
+    assert cache.search(_unit(3, 2)) == "C"
+    assert list(cache.exact.values()) == ["B", "C"]
+
+def test_semantic_cache_persists_on_flush(tmp_path, monkeypatch):
+    monkeypatch.setattr(prophet_module, "SEMANTIC_CACHE_FLUSH_EVERY", 3)
+    name = str(tmp_path / "cache")
+    cache = SemanticCache(name)
+    asyncio.run(cache.add("a", _unit(3, 0), "A"))
+    asyncio.run(cache.add("b", None, "B"))
+    assert not (tmp_path / "cache.json").exists()
+    
+    asyncio.run(cache.flush())
+    reloaded = SemanticCache(name)
+    assert reloaded.get("a") == "A"
+    assert reloaded.get("b") == "B"
+    assert reloaded.search(_unit(3, 0)) == "A"
+    
+    # Every third addition is written without an explicit flush
+    asyncio.run(reloaded.add("c", _unit(3, 1), "C"))
+    asyncio.run(reloaded.add("d", None, "D"))
+    asyncio.run(reloaded.add("e", None, "E"))
+    assert SemanticCache(name).search(_unit(3, 1)) == "C"
+
+@pytest.fixture
+def prophet(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return ScrollProphet(api_key="test-key")
+
+def test_coalesce_shares_one_fetch(prophet):
+    calls = []
+    
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"insights": ["x"]}
+    
+    async def run():
+        return await asyncio.gather(*(prophet._coalesce("prompt", fetch) for _ in range(5)))
+    
+    results = asyncio.run(run())
+    assert len(calls) == 1
+    assert results == [{"insights": ["x"]}] * 5
+    assert prophet._inflight == {}
+
+def test_coalesce_survives_leader_cancellation(prophet):
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return "result"
+    
+    async def run():
+        leader = asyncio.ensure_future(prophet._coalesce("prompt", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(prophet._coalesce("prompt", fetch))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+    
+    assert asyncio.run(run()) == "result"
+    assert prophet._inflight == {}
+
+def test_coalesce_propagates_errors_to_every_caller(prophet):
+    async def fetch():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+    
+    async def run():
+        return await asyncio.gather(
+            *(prophet._coalesce("prompt", fetch) for _ in range(3)),
+            return_exceptions=True
+        )
+    
+    results = asyncio.run(run())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert prophet._inflight == {}
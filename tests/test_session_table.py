@@ -0,0 +1,25 @@
+import pyarrow as pa
+from scrollintel.api.main import _session_table
+
+def test_session_table_from_records():
+    table = _session_table([{"a": 1, "b": "x"}, {"a": 2, "b": "y"}])
+    assert table.column_names == ["a", "b"]
+    assert table.column("a").to_pylist() == [1, 2]
+
+def test_session_table_from_columns():
+    table = _session_table({"a": [1.5, 2.5], "b": ["x", None]})
+    assert table.num_rows == 2
+    assert table.column("b").to_pylist() == ["x", None]
+
+def test_session_table_mixed_types_are_stringified():
+    table = _session_table([{"a": 1.5}, {"a": "n/a"}, {"a": None}])
+    assert table.column("a").to_pylist() == ["1.5", "n/a", None]
+    
+    table = _session_table({"a": [1, "two"], "b": [1, 2]})
+    assert table.column("a").to_pylist() == ["1", "two"]
+    assert table.column("b").to_pylist() == [1, 2]
+
+def test_session_table_nested_columns_are_flat():
+    table = _session_table([{"tags": ["a", "b"]}, {"tags": None}])
+    assert pa.types.is_string(table.schema.field("tags").type)
+    assert table.column("tags").to_pylist() == ["['a', 'b']", None]
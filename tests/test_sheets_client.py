@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+from scrollintel.integrations.sheets_client import _narrow_column, _reduce_mem_usage
+
+def test_whole_numbers_stay_int64():
+    column = _narrow_column(pd.Series(["100", "100", "3"]))
+    assert column.dtype == np.int64
+    assert (column + column).tolist() == [200, 200, 6]
+    
+    assert _narrow_column(pd.Series(["1.0", "2.0"])).dtype == np.int64
+
+def test_ids_beyond_int64_stay_text():
+    ids = ["12345678901234567890", "12345678901234567891"]
+    assert _narrow_column(pd.Series(ids)).tolist() == ids
+    
+    ids = ["123456789012345678901234", "5"]
+    assert _narrow_column(pd.Series(ids)).tolist() == ids
+    
+    # Past 2**53 a float64 column would round the IDs
+    ids = ["9007199254740993", ""]
+    assert _narrow_column(pd.Series(ids)).tolist() == ids
+
+def test_int64_bounds_are_kept_exactly():
+    values = [str(np.iinfo(np.int64).max), str(np.iinfo(np.int64).min)]
+    column = _narrow_column(pd.Series(values))
+    assert column.dtype == np.int64
+    assert column.astype(str).tolist() == values
+
+def test_floats_narrow_only_when_lossless():
+    assert _narrow_column(pd.Series(["0.5", "1.25", ""])).dtype == np.float32
+    assert _narrow_column(pd.Series(["0.1", "0.2"])).dtype == np.float64
+    
+    # Whole numbers past int64 written as floats stay numeric
+    assert _narrow_column(pd.Series(["1e20", "3e20"])).tolist() == [1e20, 3e20]
+
+def test_reduce_mem_usage_keeps_codes_and_categories():
+    frame = pd.DataFrame({
+        "zip": ["01234", "02345", "03456", "04567", "05678"],
+        "status": ["open", "open", "open", "closed", "closed"]
+    })
+    reduced = _reduce_mem_usage(frame)
+    assert reduced["zip"].tolist() == ["01234", "02345", "03456", "04567", "05678"]
+    assert reduced["status"].dtype == "category"